@@ -1,42 +1,90 @@
 """Run all test suites."""
 
+import os
 import sys
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_test(test_file: str, description: str) -> bool:
-    """Run a test file and report results.
+LOG_DIR = Path("logs")
+TIMEOUT = 60
+
+
+def _drain(stream, lines: list[str], log_path: Path) -> None:
+    """Copy a child's output into a list and its log file as it arrives.
+
+    Args:
+        stream: Child process stdout
+        lines: List collecting output lines
+        log_path: Per-test log file
+    """
+    with open(log_path, "w", encoding="utf-8") as log:
+        for line in stream:
+            lines.append(line)
+            log.write(line)
+            log.flush()
+
+
+def run_test(test_file: str) -> tuple[bool, str]:
+    """Run a test file, streaming its output to logs/<test_file>.log.
 
     Args:
         test_file: Path to test file
-        description: Test description
 
     Returns:
-        True if test passed
+        Tuple of (success, combined stdout/stderr)
     """
-    print(f"\n{'='*60}")
-    print(f"🧪 {description}")
-    print('='*60)
+    LOG_DIR.mkdir(exist_ok=True)
+    log_path = LOG_DIR / f"{Path(test_file).name}.log"
+    lines: list[str] = []
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [sys.executable, test_file],
-            capture_output=False,
-            timeout=60
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True
         )
-        success = result.returncode == 0
-        if success:
-            print(f"✅ {description} 통과")
-        else:
-            print(f"❌ {description} 실패 (exit code: {result.returncode})")
-        return success
-    except subprocess.TimeoutExpired:
-        print(f"⏱️  {description} 타임아웃 (60초)")
-        return False
     except Exception as e:
-        print(f"❌ {description} 오류: {e}")
-        return False
+        return False, f"❌ 오류: {e}\n"
+
+    reader = threading.Thread(target=_drain, args=(proc.stdout, lines, log_path))
+    reader.start()
+
+    try:
+        returncode = proc.wait(timeout=TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        reader.join()
+        lines.append(f"⏱️  타임아웃 ({TIMEOUT}초)\n")
+        return False, "".join(lines)
+
+    reader.join()
+    if returncode != 0:
+        lines.append(f"exit code: {returncode}\n")
+    return returncode == 0, "".join(lines)
+
+
+def report_test(description: str, success: bool, output: str) -> None:
+    """Print captured output and result of a test file as one block.
+
+    Args:
+        description: Test description
+        success: Whether the test passed
+        output: Captured output
+    """
+    block = [f"\n{'='*60}", f"🧪 {description}", '='*60]
+    if output:
+        block.append(output.rstrip("\n"))
+    if success:
+        block.append(f"✅ {description} 통과")
+    else:
+        block.append(f"❌ {description} 실패")
+    print("\n".join(block))
 
 
 def main():
@@ -49,17 +97,54 @@ def main():
         ("test_stock_service.py", "주식 서비스 테스트"),
         ("test_end_to_end.py", "포트폴리오 End-to-End 테스트"),
         ("test_google_services.py", "Google 서비스 테스트"),
+        ("tests/test_migrations.py", "데이터베이스 마이그레이션 테스트"),
+        ("tests/test_cache.py", "캐시 테스트"),
+        ("tests/test_history_store.py", "히스토리 저장소 테스트"),
+        ("tests/test_chart_history.py", "차트 히스토리 테스트"),
+        ("tests/test_db_manager.py", "데이터베이스 매니저 테스트"),
+        ("tests/test_transactions.py", "트랜잭션 테스트"),
+        ("tests/test_stock_cache_ttl.py", "시세 캐시 TTL 테스트"),
+        ("tests/test_price_coalescing.py", "시세 요청 병합 테스트"),
+        ("tests/test_google_auth.py", "Google 인증 테스트"),
     ]
 
+    # One listing per test directory instead of a stat per test file
+    directories = {os.path.dirname(test_file) or '.' for test_file, _ in tests}
+    present = {
+        os.path.normpath(entry.path)
+        for directory in directories if os.path.isdir(directory)
+        for entry in os.scandir(directory) if entry.is_file()
+    }
+
     results = []
+    runnable = []
     for test_file, description in tests:
-        test_path = Path(test_file)
-        if not test_path.exists():
+        if os.path.normpath(test_file) not in present:
             print(f"⚠️  테스트 파일 없음: {test_file}")
+            continue
+        runnable.append((test_file, description))
+
+    # Test files are independent subprocesses, so run them concurrently
+    # and print their captured output in submission order.
+    if runnable:
+        with ThreadPoolExecutor(max_workers=len(runnable)) as executor:
+            futures = [
+                (description, executor.submit(run_test, test_file))
+                for test_file, description in runnable
+            ]
+            outcomes = {
+                description: future.result() for description, future in futures
+            }
+    else:
+        outcomes = {}
+
+    for _, description in tests:
+        if description not in outcomes:
             results.append((description, False))
             continue
 
-        success = run_test(test_file, description)
+        success, output = outcomes[description]
+        report_test(description, success, output)
         results.append((description, success))
 
     # Summary
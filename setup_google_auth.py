@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """Setup Google OAuth authentication."""
 
+import json
 import os
+import time
+from datetime import UTC, datetime
 from pathlib import Path
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -19,6 +19,55 @@ SCOPES = [
 
 CREDENTIALS_PATH = os.getenv('GOOGLE_CREDENTIALS_PATH', '.credential.json')
 TOKEN_PATH = os.getenv('GOOGLE_TOKEN_PATH', '.token.json')
+# Marker written after the API test passes, so later runs can skip it
+VERIFIED_PATH = Path(TOKEN_PATH).with_suffix('.verified')
+# Minimum remaining token lifetime (seconds) to trust a verified token
+EXPIRY_MARGIN = 300
+
+
+def _token_is_fresh(token_path: str) -> bool:
+    """Check the saved token without importing the Google client libraries.
+
+    Args:
+        token_path: Path to the authorized user token file
+
+    Returns:
+        True if the token covers SCOPES and is valid for at least
+        EXPIRY_MARGIN seconds
+    """
+    try:
+        with open(token_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    if not data.get('token') or not set(SCOPES) <= set(data.get('scopes') or ()):
+        return False
+
+    expiry = data.get('expiry')
+    if not expiry:
+        return True
+
+    try:
+        # google-auth writes expiry as naive UTC ISO 8601 with a trailing 'Z'
+        expires_at = datetime.fromisoformat(expiry.rstrip('Z')).replace(tzinfo=UTC)
+    except ValueError:
+        return False
+    return expires_at.timestamp() - time.time() > EXPIRY_MARGIN
+
+
+def _write_token(data: str) -> None:
+    """Atomically replace the token file so a crash never leaves it empty.
+
+    Args:
+        data: Serialized credentials JSON
+    """
+    tmp_path = f"{TOKEN_PATH}.tmp"
+    with open(tmp_path, 'w') as token:
+        token.write(data)
+        token.flush()
+        os.fsync(token.fileno())
+    os.replace(tmp_path, TOKEN_PATH)
 
 
 def setup_google_auth():
@@ -44,6 +93,17 @@ def setup_google_auth():
 
     print(f"✓ Credentials 파일 발견: {CREDENTIALS_PATH}")
 
+    # Fast path: token already verified and not near expiry
+    if VERIFIED_PATH.exists() and _token_is_fresh(TOKEN_PATH):
+        print(f"✓ Token 파일 발견: {TOKEN_PATH}")
+        print("✓ 유효한 토큰이 이미 존재합니다 (인증 테스트 생략)")
+        return True
+
+    # Client libraries are only needed to refresh, authorize or test the token
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
     creds = None
 
     # Check if token already exists
@@ -106,8 +166,8 @@ def setup_google_auth():
         # Save credentials
         print(f"\n💾 토큰 저장 중: {TOKEN_PATH}")
         try:
-            with open(TOKEN_PATH, 'w') as token:
-                token.write(creds.to_json())
+            _write_token(creds.to_json())
+            VERIFIED_PATH.unlink(missing_ok=True)
             print("✓ 토큰 저장 성공")
         except Exception as e:
             print(f"❌ 토큰 저장 실패: {e}")
@@ -146,6 +206,7 @@ def setup_google_auth():
         print("✓")
 
         print("\n✅ 모든 API 테스트 통과!")
+        VERIFIED_PATH.touch()
         print("\n🎉 Google 서비스 설정 완료!")
         print(f"\n이제 myDash를 실행하세요: ./run.sh")
         return True
@@ -1,44 +1,53 @@
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Environment read once when the module is imported
+_env = os.environ
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings."""
 
-    # Projecvt root
-    BASE_DIR = Path(__file__).resolve().parent.parent.parent
+    # Project root
+    BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
 
-    # Dtabase
-    DATABASE_PATH = os.getenv('DATABASE_PATH', './data/mydash.db')
+    # Database
+    DATABASE_PATH: str = _env.get('DATABASE_PATH', './data/mydash.db')
 
     # OpenWeather API
-    OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY')
-    OPENWEATHER_CITY = os.getenv('OPENWEATHER_CITY', 'Seoul')
-    OPENWEATHER_UNITS = os.getenv('OPENWEATHER_UNITS', 'metric')
-    WEATHER_CITY = os.getenv('WEATHER_CITY', 'Seoul')  # Alias for easier access
+    OPENWEATHER_API_KEY: str | None = _env.get('OPENWEATHER_API_KEY')
+    OPENWEATHER_CITY: str = _env.get('OPENWEATHER_CITY', 'Seoul')
+    OPENWEATHER_UNITS: str = _env.get('OPENWEATHER_UNITS', 'metric')
+    WEATHER_CITY: str = _env.get('WEATHER_CITY', 'Seoul')  # Alias for easier access
 
     # Update intervals (seconds)
-    REFRESH_INTERVAL_SYSTEM = int(os.getenv('REFRESH_INTERVAL_SYSTEM', 5))
-    REFRESH_INTERVAL_WEATHER = int(os.getenv('REFRESH_INTERVAL_WEATHER', 1800))
-    REFRESH_INTERVAL_CALENDAR = int(os.getenv('REFRESH_INTERVAL_CALENDAR', 900))
-    REFRESH_INTERVAL_GMAIL = int(os.getenv('REFRESH_INTERVAL_GMAIL', 300))
-    REFRESH_INTERVAL_TASKS = int(os.getenv('REFRESH_INTERVAL_TASKS', 600))
-    REFRESH_INTERVAL_STOCKS = int(os.getenv('REFRESH_INTERVAL_STOCKS', 60))
+    REFRESH_INTERVAL_SYSTEM: int = int(_env.get('REFRESH_INTERVAL_SYSTEM', '5'))
+    REFRESH_INTERVAL_WEATHER: int = int(_env.get('REFRESH_INTERVAL_WEATHER', '1800'))
+    REFRESH_INTERVAL_CALENDAR: int = int(_env.get('REFRESH_INTERVAL_CALENDAR', '900'))
+    REFRESH_INTERVAL_GMAIL: int = int(_env.get('REFRESH_INTERVAL_GMAIL', '300'))
+    REFRESH_INTERVAL_TASKS: int = int(_env.get('REFRESH_INTERVAL_TASKS', '600'))
+    REFRESH_INTERVAL_STOCKS: int = int(_env.get('REFRESH_INTERVAL_STOCKS', '60'))
 
     # Google OAuth
-    GOOGLE_CREDENTIALS_PATH = os.getenv('GOOGLE_CREDENTIALS_PATH', '.credential.json')
-    GOOGLE_TOKEN_PATH = os.getenv('GOOGLE_TOKEN_PATH', '.token.json')
-    GOOGLE_SCOPES = os.getenv('GOOGLE_SCOPES', '').split(',')
+    GOOGLE_CREDENTIALS_PATH: str = _env.get('GOOGLE_CREDENTIALS_PATH', '.credential.json')
+    GOOGLE_TOKEN_PATH: str = _env.get('GOOGLE_TOKEN_PATH', '.token.json')
+    GOOGLE_SCOPES: list[str] = field(
+        default_factory=lambda: _env.get('GOOGLE_SCOPES', '').split(',')
+    )
 
     # Logging
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', './data/mydash.log')
+    LOG_LEVEL: str = _env.get('LOG_LEVEL', 'INFO')
+    LOG_FILE: str = _env.get('LOG_FILE', './data/mydash.log')
 
     # Cache
-    CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
-    CACHE_TTL = int(os.getenv('CACHE_TTL',3600))
+    CACHE_ENABLED: bool = _env.get('CACHE_ENABLED', 'true').lower() == 'true'
+    CACHE_TTL: int = int(_env.get('CACHE_TTL', '3600'))
+    HISTORY_CACHE_PATH: str = _env.get('HISTORY_CACHE_PATH', './data/history.db')
 
 settings = Settings()
@@ -1,6 +1,17 @@
 """Database package for myDash."""
 
 from src.database.db_manager import DatabaseManager
-from src.database.migrations import create_schema, verify_schema
+from src.database.migrations import (
+    create_schema,
+    create_schema_on_conn,
+    migrate_schema,
+    verify_schema,
+)
 
-__all__ = ["DatabaseManager", "create_schema", "verify_schema"]
+__all__ = [
+    "DatabaseManager",
+    "create_schema",
+    "create_schema_on_conn",
+    "migrate_schema",
+    "verify_schema",
+]
@@ -1,12 +1,163 @@
 """Database manager for SQLite operations."""
 
+import functools
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from src.models import Portfolio, Stock, Transaction, TransactionType
 from src.config.settings import settings
+from src.database.migrations import (
+    EPOCH_NOW,
+    create_schema,
+    create_schema_on_conn,
+    migrate_schema,
+)
+
+
+# Dates are stored as epoch seconds at UTC midnight
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+
+# ========== SQL Statements ==========
+# Columns are listed in model field order so the row mappers below can
+# construct models positionally.
+
+_PORTFOLIO_COLUMNS = "name, id, created_at, updated_at"
+_STOCK_COLUMNS = (
+    "symbol, portfolio_id, quantity, avg_price, purchase_date, id, created_at, updated_at"
+)
+_TRANSACTION_COLUMNS = "stock_id, txn_type, quantity, price, txn_date, id, created_at"
+
+# RETURNING reports bound values before REAL affinity is applied,
+# so numeric columns are cast to keep them floats.
+_STOCK_RETURNING = (
+    "symbol, portfolio_id, CAST(quantity AS REAL), CAST(avg_price AS REAL), "
+    "purchase_date, id, created_at, updated_at"
+)
+_TRANSACTION_RETURNING = (
+    "stock_id, txn_type, CAST(quantity AS REAL), CAST(price AS REAL), "
+    "txn_date, id, created_at"
+)
+
+_SQL_INSERT_PORTFOLIO = (
+    f"INSERT INTO portfolios (name) VALUES (?) RETURNING {_PORTFOLIO_COLUMNS}"
+)
+_SQL_GET_PORTFOLIO = f"SELECT {_PORTFOLIO_COLUMNS} FROM portfolios WHERE id = ?"
+_SQL_GET_ALL_PORTFOLIOS = f"SELECT {_PORTFOLIO_COLUMNS} FROM portfolios ORDER BY name"
+_SQL_UPDATE_PORTFOLIO = f"""UPDATE portfolios
+                            SET name = ?, updated_at = {EPOCH_NOW}
+                            WHERE id = ?"""
+_SQL_DELETE_PORTFOLIO = "DELETE FROM portfolios WHERE id = ?"
+
+_SQL_INSERT_STOCK = f"""INSERT INTO stocks (portfolio_id, symbol, quantity, avg_price, purchase_date)
+                        VALUES (?, ?, ?, ?, ?)
+                        RETURNING {_STOCK_RETURNING}"""
+_SQL_GET_STOCK = f"SELECT {_STOCK_COLUMNS} FROM stocks WHERE id = ?"
+_SQL_GET_STOCK_BY_SYMBOL = (
+    f"SELECT {_STOCK_COLUMNS} FROM stocks WHERE portfolio_id = ? AND symbol = ?"
+)
+_SQL_GET_STOCKS_BY_PORTFOLIO = (
+    f"SELECT {_STOCK_COLUMNS} FROM stocks WHERE portfolio_id = ? ORDER BY symbol"
+)
+# A single statement for every combination of fields; NULL keeps the current value
+_UPDATE_STOCK_SET = f"""UPDATE stocks
+                        SET quantity = COALESCE(?, quantity),
+                            avg_price = COALESCE(?, avg_price),
+                            purchase_date = COALESCE(?, purchase_date),
+                            updated_at = {EPOCH_NOW}"""
+_SQL_UPDATE_STOCK = f"""{_UPDATE_STOCK_SET}
+                        WHERE id = ?
+                        RETURNING {_STOCK_RETURNING}"""
+_SQL_UPDATE_STOCK_BY_SYMBOL = f"""{_UPDATE_STOCK_SET}
+                                  WHERE portfolio_id = ? AND symbol = ?
+                                  RETURNING {_STOCK_RETURNING}"""
+_SQL_DELETE_STOCK = "DELETE FROM stocks WHERE id = ?"
+_SQL_DELETE_STOCK_BY_SYMBOL = (
+    f"DELETE FROM stocks WHERE portfolio_id = ? AND symbol = ? RETURNING {_STOCK_RETURNING}"
+)
+_SQL_GET_STOCK_ARRAYS = (
+    "SELECT symbol, quantity, avg_price FROM stocks WHERE portfolio_id = ? ORDER BY symbol"
+)
+_SQL_GET_EARLIEST_PURCHASE_DATE = "SELECT MIN(purchase_date) FROM stocks WHERE portfolio_id = ?"
+
+_SQL_INSERT_TRANSACTION = f"""INSERT INTO transactions (stock_id, txn_type, quantity, price, txn_date)
+                              VALUES (?, ?, ?, ?, ?)
+                              RETURNING {_TRANSACTION_RETURNING}"""
+_SQL_INSERT_TRANSACTIONS = """INSERT INTO transactions (stock_id, txn_type, quantity, price, txn_date)
+                              VALUES (?, ?, ?, ?, ?)"""
+_SQL_GET_TRANSACTION = f"SELECT {_TRANSACTION_COLUMNS} FROM transactions WHERE id = ?"
+_SQL_GET_TRANSACTIONS_BY_STOCK = (
+    f"SELECT {_TRANSACTION_COLUMNS} FROM transactions "
+    "WHERE stock_id = ? ORDER BY txn_date DESC"
+)
+
+
+def _date_to_epoch(value: date) -> int:
+    """Convert a date to epoch seconds at UTC midnight."""
+    return (value.toordinal() - _EPOCH_ORDINAL) * _SECONDS_PER_DAY
+
+
+@functools.cache
+def _ensure_db_exists(db_path: str) -> None:
+    """Ensure database file exists and its schema is up to date.
+
+    Cached per path so managers created after the first skip the stat and
+    the schema version check.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    if not Path(db_path).exists():
+        create_schema(db_path)
+    else:
+        migrate_schema(db_path)
+
+
+# ========== Row Mappers ==========
+# Models are built positionally, with the class and converters bound as
+# default arguments so they resolve as fast locals.
+
+def _row_to_portfolio(row, _cls=Portfolio, _dt=datetime.fromtimestamp) -> Portfolio:
+    """Build a Portfolio from a row in _PORTFOLIO_COLUMNS order."""
+    return _cls(row[0], row[1], _dt(row[2]), _dt(row[3]))
+
+
+def _row_to_stock(
+    row,
+    _cls=Stock,
+    _dt=datetime.fromtimestamp,
+    _dd=date.fromordinal,
+    _epoch=_EPOCH_ORDINAL
+) -> Stock:
+    """Build a Stock from a row in _STOCK_COLUMNS order."""
+    return _cls(
+        row[0], row[1], row[2], row[3],
+        _dd(_epoch + row[4] // _SECONDS_PER_DAY),
+        row[5], _dt(row[6]), _dt(row[7])
+    )
+
+
+def _row_to_transaction(
+    row,
+    _cls=Transaction,
+    _dt=datetime.fromtimestamp,
+    _dd=date.fromordinal,
+    _epoch=_EPOCH_ORDINAL,
+    _type=TransactionType
+) -> Transaction:
+    """Build a Transaction from a row in _TRANSACTION_COLUMNS order."""
+    return _cls(
+        row[0], _type(row[1]), row[2], row[3],
+        _dd(_epoch + row[4] // _SECONDS_PER_DAY),
+        row[5], _dt(row[6])
+    )
 
 
 class DatabaseManager:
@@ -16,29 +167,99 @@ class DatabaseManager:
         """Initialize database manager.
 
         Args:
-            db_path: Path to SQLite database file (default: from settings)
+            db_path: Path to SQLite database file, or ":memory:" for a
+                private in-memory database (default: from settings)
         """
         self.db_path = db_path or settings.DATABASE_PATH
-        self._ensure_db_exists()
+        self._lock = threading.RLock()
+        # Depth of open transaction() blocks; commits wait for the outermost
+        self._tx_depth = 0
+
+        if self.db_path == ":memory:":
+            # Private in-memory database (tests): nothing on disk to create or migrate
+            self._conn = self._connect()
+            create_schema_on_conn(self._conn)
+        else:
+            _ensure_db_exists(self.db_path)
+            self._conn = self._connect()
 
-    def _ensure_db_exists(self) -> None:
-        """Ensure database file and schema exist."""
-        if not Path(self.db_path).exists():
-            from src.database.migrations import create_schema
-            create_schema(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived database connection.
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory.
+        Connection-level pragmas are applied once here instead of per query.
 
         Returns:
             Database connection
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         # Enable foreign key constraints
         conn.execute("PRAGMA foreign_keys = ON")
+        # WAL lets readers proceed while a write is in progress
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        # Read pages through a 256 MB memory map and keep ~20 MB of page cache
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -20000")
         return conn
 
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Cursor]:
+        """Get a cursor on the shared connection.
+
+        Access is serialized with a lock so the manager can be used from
+        worker threads. Changes are committed when the block exits and
+        rolled back if it raises, unless an enclosing transaction() block
+        decides instead.
+
+        Yields:
+            Database cursor
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                yield cursor
+                if not self._tx_depth:
+                    self._conn.commit()
+            except BaseException:
+                if not self._tx_depth:
+                    self._conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several operations into a single commit.
+
+        Manager methods called inside the block join it instead of committing
+        on their own; everything is committed once when the outermost block
+        exits, or rolled back together if it raises. The connection lock is
+        held for the whole block.
+
+        Yields:
+            Database connection
+        """
+        with self._lock:
+            self._tx_depth += 1
+            try:
+                yield self._conn
+            except BaseException:
+                self._tx_depth -= 1
+                if not self._tx_depth:
+                    self._conn.rollback()
+                raise
+            else:
+                self._tx_depth -= 1
+                if not self._tx_depth:
+                    self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
     # ========== Portfolio Operations ==========
 
     def create_portfolio(self, name: str) -> Portfolio:
@@ -53,21 +274,9 @@ class DatabaseManager:
         Raises:
             sqlite3.IntegrityError: If portfolio name already exists
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute(
-                "INSERT INTO portfolios (name) VALUES (?)",
-                (name,)
-            )
-            conn.commit()
-
-            portfolio_id = cursor.lastrowid
-            return self.get_portfolio(portfolio_id)
-
-        finally:
-            conn.close()
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_INSERT_PORTFOLIO, (name,))
+            return _row_to_portfolio(cursor.fetchone())
 
     def get_portfolio(self, portfolio_id: int) -> Optional[Portfolio]:
         """Get portfolio by ID.
@@ -78,28 +287,14 @@ class DatabaseManager:
         Returns:
             Portfolio or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute(
-                "SELECT * FROM portfolios WHERE id = ?",
-                (portfolio_id,)
-            )
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_PORTFOLIO, (portfolio_id,))
             row = cursor.fetchone()
 
             if not row:
                 return None
 
-            return Portfolio(
-                id=row['id'],
-                name=row['name'],
-                created_at=datetime.fromisoformat(row['created_at']),
-                updated_at=datetime.fromisoformat(row['updated_at'])
-            )
-
-        finally:
-            conn.close()
+            return _row_to_portfolio(row)
 
     def get_all_portfolios(self) -> list[Portfolio]:
         """Get all portfolios.
@@ -107,25 +302,9 @@ class DatabaseManager:
         Returns:
             List of portfolios
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("SELECT * FROM portfolios ORDER BY name")
-            rows = cursor.fetchall()
-
-            return [
-                Portfolio(
-                    id=row['id'],
-                    name=row['name'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at'])
-                )
-                for row in rows
-            ]
-
-        finally:
-            conn.close()
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_ALL_PORTFOLIOS)
+            return list(map(_row_to_portfolio, cursor.fetchall()))
 
     def update_portfolio(self, portfolio_id: int, name: str) -> Optional[Portfolio]:
         """Update portfolio name.
@@ -137,26 +316,14 @@ class DatabaseManager:
         Returns:
             Updated portfolio or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute(
-                """UPDATE portfolios
-                   SET name = ?, updated_at = CURRENT_TIMESTAMP
-                   WHERE id = ?""",
-                (name, portfolio_id)
-            )
-            conn.commit()
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_UPDATE_PORTFOLIO, (name, portfolio_id))
 
             if cursor.rowcount == 0:
                 return None
 
             return self.get_portfolio(portfolio_id)
 
-        finally:
-            conn.close()
-
     def delete_portfolio(self, portfolio_id: int) -> bool:
         """Delete portfolio and all associated stocks.
 
@@ -166,17 +333,10 @@ class DatabaseManager:
         Returns:
             True if deleted, False if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("DELETE FROM portfolios WHERE id = ?", (portfolio_id,))
-            conn.commit()
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_DELETE_PORTFOLIO, (portfolio_id,))
             return cursor.rowcount > 0
 
-        finally:
-            conn.close()
-
     # ========== Stock Operations ==========
 
     def create_stock(
@@ -199,22 +359,12 @@ class DatabaseManager:
         Returns:
             Created stock
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
+        with self._get_connection() as cursor:
             cursor.execute(
-                """INSERT INTO stocks (portfolio_id, symbol, quantity, avg_price, purchase_date)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (portfolio_id, symbol.upper(), quantity, avg_price, purchase_date.isoformat())
+                _SQL_INSERT_STOCK,
+                (portfolio_id, symbol.upper(), quantity, avg_price, _date_to_epoch(purchase_date))
             )
-            conn.commit()
-
-            stock_id = cursor.lastrowid
-            return self.get_stock(stock_id)
-
-        finally:
-            conn.close()
+            return _row_to_stock(cursor.fetchone())
 
     def get_stock(self, stock_id: int) -> Optional[Stock]:
         """Get stock by ID.
@@ -225,66 +375,33 @@ class DatabaseManager:
         Returns:
             Stock or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("SELECT * FROM stocks WHERE id = ?", (stock_id,))
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_STOCK, (stock_id,))
             row = cursor.fetchone()
 
             if not row:
                 return None
 
-            return Stock(
-                id=row['id'],
-                portfolio_id=row['portfolio_id'],
-                symbol=row['symbol'],
-                quantity=row['quantity'],
-                avg_price=row['avg_price'],
-                purchase_date=date.fromisoformat(row['purchase_date']),
-                created_at=datetime.fromisoformat(row['created_at']),
-                updated_at=datetime.fromisoformat(row['updated_at'])
-            )
-
-        finally:
-            conn.close()
+            return _row_to_stock(row)
 
     def get_stock_by_symbol(self, portfolio_id: int, symbol: str) -> Optional[Stock]:
         """Get stock by portfolio ID and symbol.
 
         Args:
             portfolio_id: Portfolio ID
-            symbol: Stock ticker symbol
+            symbol: Stock ticker symbol (matched case-insensitively)
 
         Returns:
             Stock or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute(
-                "SELECT * FROM stocks WHERE portfolio_id = ? AND symbol = ?",
-                (portfolio_id, symbol.upper())
-            )
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_STOCK_BY_SYMBOL, (portfolio_id, symbol))
             row = cursor.fetchone()
 
             if not row:
                 return None
 
-            return Stock(
-                id=row['id'],
-                portfolio_id=row['portfolio_id'],
-                symbol=row['symbol'],
-                quantity=row['quantity'],
-                avg_price=row['avg_price'],
-                purchase_date=date.fromisoformat(row['purchase_date']),
-                created_at=datetime.fromisoformat(row['created_at']),
-                updated_at=datetime.fromisoformat(row['updated_at'])
-            )
-
-        finally:
-            conn.close()
+            return _row_to_stock(row)
 
     def get_stocks_by_portfolio(self, portfolio_id: int) -> list[Stock]:
         """Get all stocks in a portfolio.
@@ -295,32 +412,49 @@ class DatabaseManager:
         Returns:
             List of stocks
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_STOCKS_BY_PORTFOLIO, (portfolio_id,))
+            return list(map(_row_to_stock, cursor.fetchall()))
 
-        try:
-            cursor.execute(
-                "SELECT * FROM stocks WHERE portfolio_id = ? ORDER BY symbol",
-                (portfolio_id,)
-            )
+    def get_stocks_as_arrays(self, portfolio_id: int) -> dict[str, np.ndarray]:
+        """Get a portfolio's holdings as column arrays.
+
+        Lets valuation run on arrays straight from one SELECT, without
+        building a Stock per row.
+
+        Args:
+            portfolio_id: Portfolio ID
+
+        Returns:
+            Dict with 'symbols', 'quantities' and 'avg_prices' arrays ordered by symbol
+        """
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_STOCK_ARRAYS, (portfolio_id,))
             rows = cursor.fetchall()
 
-            return [
-                Stock(
-                    id=row['id'],
-                    portfolio_id=row['portfolio_id'],
-                    symbol=row['symbol'],
-                    quantity=row['quantity'],
-                    avg_price=row['avg_price'],
-                    purchase_date=date.fromisoformat(row['purchase_date']),
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at'])
-                )
-                for row in rows
-            ]
-
-        finally:
-            conn.close()
+        count = len(rows)
+        return {
+            'symbols': np.array([row[0] for row in rows], dtype=object),
+            'quantities': np.fromiter((row[1] for row in rows), dtype=np.float64, count=count),
+            'avg_prices': np.fromiter((row[2] for row in rows), dtype=np.float64, count=count),
+        }
+
+    def get_earliest_purchase_date(self, portfolio_id: int) -> Optional[date]:
+        """Get the earliest purchase date in a portfolio.
+
+        Args:
+            portfolio_id: Portfolio ID
+
+        Returns:
+            Earliest purchase date or None if the portfolio has no stocks
+        """
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_EARLIEST_PURCHASE_DATE, (portfolio_id,))
+            epoch = cursor.fetchone()[0]
+
+        if epoch is None:
+            return None
+        return date.fromordinal(_EPOCH_ORDINAL + epoch // _SECONDS_PER_DAY)
 
     def update_stock(
         self,
@@ -340,63 +474,88 @@ class DatabaseManager:
         Returns:
             Updated stock or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        if quantity is None and avg_price is None and purchase_date is None:
+            return self.get_stock(stock_id)
 
-        try:
-            # Build dynamic UPDATE query
-            updates = []
-            params = []
+        epoch_date = _date_to_epoch(purchase_date) if purchase_date is not None else None
 
-            if quantity is not None:
-                updates.append("quantity = ?")
-                params.append(quantity)
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_UPDATE_STOCK, (quantity, avg_price, epoch_date, stock_id))
+            row = cursor.fetchone()
 
-            if avg_price is not None:
-                updates.append("avg_price = ?")
-                params.append(avg_price)
+            if not row:
+                return None
 
-            if purchase_date is not None:
-                updates.append("purchase_date = ?")
-                params.append(purchase_date.isoformat())
+            return _row_to_stock(row)
 
-            if not updates:
-                return self.get_stock(stock_id)
+    def delete_stock(self, stock_id: int) -> bool:
+        """Delete stock and all associated transactions.
 
-            updates.append("updated_at = CURRENT_TIMESTAMP")
-            params.append(stock_id)
+        Args:
+            stock_id: Stock ID
 
-            query = f"UPDATE stocks SET {', '.join(updates)} WHERE id = ?"
-            cursor.execute(query, params)
-            conn.commit()
+        Returns:
+            True if deleted, False if not found
+        """
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_DELETE_STOCK, (stock_id,))
+            return cursor.rowcount > 0
 
-            if cursor.rowcount == 0:
-                return None
+    def update_stock_by_symbol(
+        self,
+        portfolio_id: int,
+        symbol: str,
+        quantity: Optional[float] = None,
+        avg_price: Optional[float] = None,
+        purchase_date: Optional[date] = None
+    ) -> Optional[Stock]:
+        """Update stock details by portfolio ID and symbol in one statement.
 
-            return self.get_stock(stock_id)
+        Args:
+            portfolio_id: Portfolio ID
+            symbol: Stock ticker symbol (matched case-insensitively)
+            quantity: New quantity (optional)
+            avg_price: New average price (optional)
+            purchase_date: New purchase date (optional)
 
-        finally:
-            conn.close()
+        Returns:
+            Updated stock or None if not found
+        """
+        if quantity is None and avg_price is None and purchase_date is None:
+            return self.get_stock_by_symbol(portfolio_id, symbol)
 
-    def delete_stock(self, stock_id: int) -> bool:
-        """Delete stock and all associated transactions.
+        epoch_date = _date_to_epoch(purchase_date) if purchase_date is not None else None
+
+        with self._get_connection() as cursor:
+            cursor.execute(
+                _SQL_UPDATE_STOCK_BY_SYMBOL,
+                (quantity, avg_price, epoch_date, portfolio_id, symbol)
+            )
+            row = cursor.fetchone()
+
+            if not row:
+                return None
+
+            return _row_to_stock(row)
+
+    def delete_stock_by_symbol(self, portfolio_id: int, symbol: str) -> Optional[Stock]:
+        """Delete stock by portfolio ID and symbol in one statement.
 
         Args:
-            stock_id: Stock ID
+            portfolio_id: Portfolio ID
+            symbol: Stock ticker symbol (matched case-insensitively)
 
         Returns:
-            True if deleted, False if not found
+            Deleted stock or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_DELETE_STOCK_BY_SYMBOL, (portfolio_id, symbol))
+            row = cursor.fetchone()
 
-        try:
-            cursor.execute("DELETE FROM stocks WHERE id = ?", (stock_id,))
-            conn.commit()
-            return cursor.rowcount > 0
+            if not row:
+                return None
 
-        finally:
-            conn.close()
+            return _row_to_stock(row)
 
     # ========== Transaction Operations ==========
 
@@ -420,22 +579,29 @@ class DatabaseManager:
         Returns:
             Created transaction
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
+        with self._get_connection() as cursor:
             cursor.execute(
-                """INSERT INTO transactions (stock_id, txn_type, quantity, price, txn_date)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (stock_id, txn_type.value, quantity, price, txn_date.isoformat())
+                _SQL_INSERT_TRANSACTION,
+                (stock_id, txn_type.value, quantity, price, _date_to_epoch(txn_date))
             )
-            conn.commit()
+            return _row_to_transaction(cursor.fetchone())
+
+    def create_transactions(
+        self,
+        rows: list[tuple[int, TransactionType, float, float, date]]
+    ) -> None:
+        """Create many transactions in a single database transaction.
 
-            transaction_id = cursor.lastrowid
-            return self.get_transaction(transaction_id)
+        Args:
+            rows: List of (stock_id, txn_type, quantity, price, txn_date) tuples
+        """
+        payload = (
+            (stock_id, txn_type.value, quantity, price, _date_to_epoch(txn_date))
+            for stock_id, txn_type, quantity, price, txn_date in rows
+        )
 
-        finally:
-            conn.close()
+        with self._get_connection() as cursor:
+            cursor.executemany(_SQL_INSERT_TRANSACTIONS, payload)
 
     def get_transaction(self, transaction_id: int) -> Optional[Transaction]:
         """Get transaction by ID.
@@ -446,28 +612,14 @@ class DatabaseManager:
         Returns:
             Transaction or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("SELECT * FROM transactions WHERE id = ?", (transaction_id,))
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_TRANSACTION, (transaction_id,))
             row = cursor.fetchone()
 
             if not row:
                 return None
 
-            return Transaction(
-                id=row['id'],
-                stock_id=row['stock_id'],
-                txn_type=TransactionType(row['txn_type']),
-                quantity=row['quantity'],
-                price=row['price'],
-                txn_date=date.fromisoformat(row['txn_date']),
-                created_at=datetime.fromisoformat(row['created_at'])
-            )
-
-        finally:
-            conn.close()
+            return _row_to_transaction(row)
 
     def get_transactions_by_stock(self, stock_id: int) -> list[Transaction]:
         """Get all transactions for a stock.
@@ -478,28 +630,6 @@ class DatabaseManager:
         Returns:
             List of transactions ordered by date (newest first)
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute(
-                "SELECT * FROM transactions WHERE stock_id = ? ORDER BY txn_date DESC",
-                (stock_id,)
-            )
-            rows = cursor.fetchall()
-
-            return [
-                Transaction(
-                    id=row['id'],
-                    stock_id=row['stock_id'],
-                    txn_type=TransactionType(row['txn_type']),
-                    quantity=row['quantity'],
-                    price=row['price'],
-                    txn_date=date.fromisoformat(row['txn_date']),
-                    created_at=datetime.fromisoformat(row['created_at'])
-                )
-                for row in rows
-            ]
-
-        finally:
-            conn.close()
+        with self._get_connection() as cursor:
+            cursor.execute(_SQL_GET_TRANSACTIONS_BY_STOCK, (stock_id,))
+            return list(map(_row_to_transaction, cursor.fetchall()))
@@ -3,6 +3,115 @@
 import sqlite3
 from pathlib import Path
 
+# Stored in PRAGMA user_version; bump when the schema changes
+SCHEMA_VERSION = 3
+
+# SQL expression for the current time as unix epoch seconds
+EPOCH_NOW = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+_PORTFOLIOS_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {{name}} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        created_at INTEGER DEFAULT ({EPOCH_NOW}),
+        updated_at INTEGER DEFAULT ({EPOCH_NOW})
+    )
+"""
+
+_STOCKS_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {{name}} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        portfolio_id INTEGER NOT NULL,
+        symbol TEXT NOT NULL COLLATE NOCASE,
+        purchase_date INTEGER NOT NULL,
+        quantity REAL NOT NULL CHECK(quantity > 0),
+        avg_price REAL NOT NULL CHECK(avg_price > 0),
+        created_at INTEGER DEFAULT ({EPOCH_NOW}),
+        updated_at INTEGER DEFAULT ({EPOCH_NOW}),
+        FOREIGN KEY (portfolio_id) REFERENCES portfolios(id) ON DELETE CASCADE,
+        UNIQUE(portfolio_id, symbol)
+    )
+"""
+
+_TRANSACTIONS_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {{name}} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        stock_id INTEGER NOT NULL,
+        txn_type TEXT NOT NULL CHECK(txn_type IN ('BUY', 'SELL')),
+        quantity REAL NOT NULL CHECK(quantity > 0),
+        price REAL NOT NULL CHECK(price > 0),
+        txn_date INTEGER NOT NULL,
+        created_at INTEGER DEFAULT ({EPOCH_NOW}),
+        FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
+    )
+"""
+
+# Lookups by (portfolio_id, symbol) and by portfolio_id alone are served by
+# the implicit index behind UNIQUE(portfolio_id, symbol).
+_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_portfolios_name ON portfolios(name)",
+    "CREATE INDEX IF NOT EXISTS idx_stocks_purchase_date ON stocks(purchase_date)",
+    (
+        "CREATE INDEX IF NOT EXISTS idx_transactions_stock_date "
+        "ON transactions(stock_id, txn_date DESC)"
+    ),
+    "CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(txn_date)",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(txn_type)",
+]
+
+# Indexes made redundant by the ones above (dropped in schema version 2)
+_OBSOLETE_INDEXES = [
+    "idx_stocks_portfolio",
+    "idx_stocks_symbol",
+    "idx_transactions_stock",
+]
+
+
+def _epoch(column: str) -> str:
+    """Build SQL converting an ISO date/timestamp column to epoch seconds.
+
+    Args:
+        column: Column name
+
+    Returns:
+        SQL expression
+    """
+    return f"CAST(strftime('%s', {column}) AS INTEGER)"
+
+
+def _create_tables(cursor: sqlite3.Cursor) -> None:
+    """Create all tables and indexes if they do not exist.
+
+    Args:
+        cursor: Database cursor
+    """
+    cursor.execute(_PORTFOLIOS_TABLE.format(name="portfolios"))
+    cursor.execute(_STOCKS_TABLE.format(name="stocks"))
+    cursor.execute(_TRANSACTIONS_TABLE.format(name="transactions"))
+
+    # Create indexes for better query performance
+    for statement in _INDEXES:
+        cursor.execute(statement)
+
+
+def create_schema_on_conn(conn: sqlite3.Connection) -> None:
+    """Create database schema on an open connection.
+
+    Args:
+        conn: Database connection (e.g. an in-memory database)
+    """
+    cursor = conn.cursor()
+
+    try:
+        _create_tables(cursor)
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
 
 def create_schema(db_path: str) -> None:
     """Create database schema.
@@ -13,79 +122,145 @@ def create_schema(db_path: str) -> None:
     # Ensure data directory exists
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+    conn = sqlite3.connect(db_path)
+
+    try:
+        create_schema_on_conn(conn)
+
+        # WAL is persistent for the database file; set it up front so the
+        # first connection already gets concurrent readers
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+
+        print(f"✓ Database schema created successfully")
+        print(f"✓ Location: {db_path}")
+
+    except sqlite3.Error as e:
+        print(f"✗ Error creating schema: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+def _migrate_epoch_timestamps(cursor: sqlite3.Cursor) -> None:
+    """Rebuild tables to store dates and timestamps as INTEGER epoch seconds.
+
+    Args:
+        cursor: Cursor inside an open transaction with foreign keys disabled
+    """
+    cursor.execute(_PORTFOLIOS_TABLE.format(name="portfolios_new"))
+    cursor.execute(f"""
+        INSERT INTO portfolios_new (id, name, created_at, updated_at)
+        SELECT id, name, {_epoch('created_at')}, {_epoch('updated_at')}
+        FROM portfolios
+    """)
+
+    cursor.execute(_STOCKS_TABLE.format(name="stocks_new"))
+    cursor.execute(f"""
+        INSERT INTO stocks_new (id, portfolio_id, symbol, purchase_date,
+                                quantity, avg_price, created_at, updated_at)
+        SELECT id, portfolio_id, symbol, {_epoch('purchase_date')},
+               quantity, avg_price, {_epoch('created_at')}, {_epoch('updated_at')}
+        FROM stocks
+    """)
+
+    cursor.execute(_TRANSACTIONS_TABLE.format(name="transactions_new"))
+    cursor.execute(f"""
+        INSERT INTO transactions_new (id, stock_id, txn_type, quantity,
+                                      price, txn_date, created_at)
+        SELECT id, stock_id, txn_type, quantity,
+               price, {_epoch('txn_date')}, {_epoch('created_at')}
+        FROM transactions
+    """)
+
+    for table in ("transactions", "stocks", "portfolios"):
+        cursor.execute(f"DROP TABLE {table}")
+    for table in ("portfolios", "stocks", "transactions"):
+        cursor.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+    for statement in _INDEXES:
+        cursor.execute(statement)
+
+
+def _migrate_indexes(cursor: sqlite3.Cursor) -> None:
+    """Replace redundant single-column indexes with composite ones.
+
+    Args:
+        cursor: Cursor inside an open transaction
+    """
+    for name in _OBSOLETE_INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+    for statement in _INDEXES:
+        cursor.execute(statement)
+
+
+def _migrate_symbol_nocase(cursor: sqlite3.Cursor) -> None:
+    """Rebuild the stocks table so symbols compare case-insensitively.
+
+    Args:
+        cursor: Cursor inside an open transaction with foreign keys disabled
+    """
+    cursor.execute(_STOCKS_TABLE.format(name="stocks_new"))
+    cursor.execute("""
+        INSERT INTO stocks_new (id, portfolio_id, symbol, purchase_date,
+                                quantity, avg_price, created_at, updated_at)
+        SELECT id, portfolio_id, symbol, purchase_date,
+               quantity, avg_price, created_at, updated_at
+        FROM stocks
+    """)
+    cursor.execute("DROP TABLE stocks")
+    cursor.execute("ALTER TABLE stocks_new RENAME TO stocks")
+
+    for statement in _INDEXES:
+        cursor.execute(statement)
+
+
+def migrate_schema(db_path: str) -> None:
+    """Upgrade an existing database to the current schema version.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     try:
-        # Create portfolios table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS portfolios (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
 
-        # Create stocks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS stocks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                portfolio_id INTEGER NOT NULL,
-                symbol TEXT NOT NULL,
-                purchase_date DATE NOT NULL,
-                quantity REAL NOT NULL CHECK(quantity > 0),
-                avg_price REAL NOT NULL CHECK(avg_price > 0),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (portfolio_id) REFERENCES portfolios(id) ON DELETE CASCADE,
-                UNIQUE(portfolio_id, symbol)
-            )
-        """)
+        # Table rebuilds require foreign keys to be off (outside a transaction)
+        cursor.execute("PRAGMA foreign_keys = OFF")
+        cursor.execute("BEGIN")
 
-        # Create transactions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                stock_id INTEGER NOT NULL,
-                txn_type TEXT NOT NULL CHECK(txn_type IN ('BUY', 'SELL')),
-                quantity REAL NOT NULL CHECK(quantity > 0),
-                price REAL NOT NULL CHECK(price > 0),
-                txn_date DATE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
-            )
-        """)
+        has_tables = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='portfolios'"
+        ).fetchone()
+
+        if not has_tables:
+            _create_tables(cursor)
+        else:
+            if version < 1:
+                _migrate_epoch_timestamps(cursor)
+            if version < 2:
+                _migrate_indexes(cursor)
+            # The version 1 rebuild already creates stocks with NOCASE symbols
+            if 1 <= version < 3:
+                _migrate_symbol_nocase(cursor)
 
-        # Create indexes for better query performance
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_portfolios_name ON portfolios(name)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_stocks_portfolio ON stocks(portfolio_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_stocks_symbol ON stocks(symbol)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_stocks_purchase_date ON stocks(purchase_date)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_transactions_stock ON transactions(stock_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(txn_date)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(txn_type)"
-        )
+        violations = cursor.execute("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            raise sqlite3.IntegrityError(
+                f"Foreign key violations after migration: {violations}"
+            )
 
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
-        print(f"✓ Database schema created successfully")
-        print(f"✓ Location: {db_path}")
+        print(f"✓ Database migrated to schema version {SCHEMA_VERSION}")
 
     except sqlite3.Error as e:
-        print(f"✗ Error creating schema: {e}")
+        print(f"✗ Error migrating schema: {e}")
         conn.rollback()
         raise
     finally:
@@ -122,6 +297,14 @@ def verify_schema(db_path: str) -> bool:
 
         print(f"✓ All tables exist: {', '.join(tables)}")
 
+        # Check schema version
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            print(f"✗ Schema version {version}, expected {SCHEMA_VERSION}")
+            return False
+
+        print(f"✓ Schema version {version}")
+
         # Check indexes exist
         cursor.execute("""
             SELECT name FROM sqlite_master
@@ -146,7 +329,10 @@ if __name__ == "__main__":
     print("Database Migration - Creating Schema")
     print("=" * 60)
 
-    create_schema(settings.DATABASE_PATH)
+    if Path(settings.DATABASE_PATH).exists():
+        migrate_schema(settings.DATABASE_PATH)
+    else:
+        create_schema(settings.DATABASE_PATH)
 
     print("\n" + "=" * 60)
     print("Verifying Schema")
@@ -1,10 +1,17 @@
 """myDash - Personal Dashboard TUI Application."""
 
+import asyncio
+import logging
+from pathlib import Path
+from typing import Optional
+
 from textual.app import App, ComposeResult
+from textual.timer import Timer
 from textual.widgets import Header, Footer, Static
 from textual.containers import Container, Vertical
 
 from src.config.settings import settings
+from src.models import Portfolio
 from src.widgets import (
     PortfolioTable,
     AddStockModal,
@@ -13,7 +20,17 @@ from src.widgets import (
     GooglePanel,
     ChartView,
 )
-from src.services import PortfolioManager, SystemService, WeatherService
+from src.services import (
+    ChartService,
+    HistoryStore,
+    PortfolioManager,
+    StockService,
+    SystemService,
+    WeatherService,
+)
+
+# Delay (seconds) before a row selection redraws the stock chart
+CHART_DEBOUNCE = 0.15
 
 
 class HeaderBar(Static):
@@ -24,93 +41,43 @@ class HeaderBar(Static):
         super().__init__()
         self.system_service = SystemService()
         self.weather_service = WeatherService()
+        self._sys_str = ""
+        self._weather_str = ""
 
     def on_mount(self) -> None:
-        """Initialize header content and start update timer."""
+        """Initialize header content and start update timers."""
+        self._tick_weather()
+        self._tick_sys()
+        # Weather changes on a much slower cadence than the clock
+        self.set_interval(1.0, self._tick_sys)
+        self.set_interval(settings.REFRESH_INTERVAL_WEATHER, self._tick_weather)
+
+    def _tick_sys(self) -> None:
+        """Refresh the system part of the header."""
+        self._sys_str = self.system_service.format_status_line()
         self.update_status()
-        self.set_interval(1.0, self.update_status)
 
-    def update_status(self) -> None:
-        """Update header with current system status."""
-        # System info
-        sys_status = self.system_service.format_status_line()
+    def _tick_weather(self) -> None:
+        """Refresh the weather part of the header in a background worker."""
+        self.run_worker(self._load_weather(), group="weather", exclusive=True)
 
-        # Weather info
-        weather_status = self.weather_service.format_weather_short(city=settings.WEATHER_CITY)
+    async def _load_weather(self) -> None:
+        """Fetch weather off the UI thread, then update the header."""
+        weather = await self.weather_service.get_weather_async(city=settings.WEATHER_CITY)
+        # An empty dict renders the placeholder instead of refetching on this thread
+        self._weather_str = self.weather_service.format_weather_short(weather or {})
+        self.update_status()
 
-        # Combined status
-        status = f"myDash | {sys_status} | {weather_status}"
-        self.update(status)
+    def update_status(self) -> None:
+        """Update header from the cached status strings."""
+        self.update(f"myDash | {self._sys_str} | {self._weather_str}")
 
 
 class MyDashApp(App):
     """myDash TUI application."""
 
-    CSS = """
-    HeaderBar {
-        dock: top;
-        height: 1;
-        background: $primary;
-        color: $text;
-    }
-
-    #main-container {
-        layout: horizontal;
-        height: 3fr;
-    }
-
-    .panel {
-        border: solid $primary;
-        height: 100%;
-        padding: 1;
-    }
-
-    .panel-title {
-        text-style: bold;
-        background: $primary;
-        padding: 0 1;
-        margin-bottom: 1;
-    }
-
-    #stock-panel {
-        width: 60%;
-    }
-
-    #google-panel {
-        width: 40%;
-    }
-
-    #portfolio-table {
-        height: 1fr;
-    }
-
-    #portfolio-summary {
-        dock: bottom;
-        height: 2;
-        background: $surface;
-        padding: 0 2;
-        content-align: center middle;
-    }
-
-    #chart-container {
-        dock: bottom;
-        height: 35;
-        border: solid $primary;
-        padding: 1;
-        display: none;
-    }
-
-    #chart-container.visible {
-        display: block;
-    }
-
-    #chart-view {
-        height: 100%;
-        width: 100%;
-        overflow-y: auto;
-        overflow-x: hidden;
-    }
-    """
+    # Stylesheet lives next to this module (supports live reload with `textual run --dev`)
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         ("q", "quit", "종료"),
@@ -122,66 +89,78 @@ class MyDashApp(App):
         ("ctrl+v", "toggle_portfolio_chart", "포트폴리오 차트"),
     ]
 
+    def __init__(self):
+        """Initialize app."""
+        super().__init__()
+        # One manager (and database connection), one history store (and its
+        # SQLite connection) and one stock service (and its price caches)
+        # shared by the app and all widgets
+        self.pm = PortfolioManager()
+        history_store = HistoryStore()
+        self.stock_service = StockService(history_store)
+        self.chart_service = ChartService(history_store)
+
     def compose(self) -> ComposeResult:
         """Compose the UI."""
         yield HeaderBar()
         yield Footer()
         with Container(id="main-container"):
             with Vertical(id="stock-panel", classes="panel"):
-                yield PortfolioTable()
+                yield PortfolioTable(pm=self.pm, stock_service=self.stock_service)
             with Vertical(id="google-panel", classes="panel"):
                 yield GooglePanel()
         with Container(id="chart-container"):
-            yield ChartView(id="chart-view")
+            yield ChartView(
+                stock_service=self.stock_service,
+                chart_service=self.chart_service,
+                id="chart-view",
+            )
 
     def on_mount(self) -> None:
         """Called when app starts."""
+        # Widgets are composed once; keep references instead of re-querying
+        self._portfolio_table = self.query_one(PortfolioTable)
+        self._chart_container = self.query_one("#chart-container")
+        self._chart_view = self.query_one(ChartView)
+        self._pending_chart_timer: Optional[Timer] = None
+
         self.title = "myDash"
         self.sub_title = f"Database: {settings.DATABASE_PATH}"
 
         # Initialize with test data if no portfolios exist
-        pm = PortfolioManager()
-        portfolios = pm.get_all_portfolios()
+        portfolios = self.pm.get_all_portfolios()
 
         if not portfolios:
             # Create default portfolio
-            portfolio = pm.create_portfolio("My Portfolio")
+            portfolios = [self.pm.create_portfolio("My Portfolio")]
 
         # Set first portfolio to display
-        portfolios = pm.get_all_portfolios()
-        if portfolios:
-            portfolio_table = self.query_one(PortfolioTable)
-            portfolio_table.portfolio_id = portfolios[0].id
+        self._portfolio_table.portfolio_id = portfolios[0].id
 
     def action_refresh(self) -> None:
         """Refresh portfolio data."""
-        portfolio_table = self.query_one(PortfolioTable)
-        portfolio_table.refresh_data()
-        self.notify("✅ 데이터 새로고침 완료", severity="information")
+        self._portfolio_table.refresh_data(notify=True)
 
     def action_add_stock(self) -> None:
         """Add new stock."""
-        portfolio_table = self.query_one(PortfolioTable)
-        if not portfolio_table.portfolio_id:
+        if not self._portfolio_table.portfolio_id:
             self.notify("❌ 먼저 포트폴리오를 선택하세요", severity="error")
             return
 
-        self.push_screen(AddStockModal(portfolio_table.portfolio_id), callback=self._handle_add_stock)
+        self.push_screen(AddStockModal(self._portfolio_table.portfolio_id), callback=self._handle_add_stock)
 
     def _handle_add_stock(self, result) -> None:
         """Handle add stock result."""
         if result:
-            pm = PortfolioManager()
             try:
-                stock = pm.add_stock(
+                stock = self.pm.add_stock(
                     portfolio_id=result["portfolio_id"],
                     symbol=result["symbol"],
                     quantity=result["quantity"],
                     price=result["price"],
                     purchase_date=result["purchase_date"]
                 )
-                portfolio_table = self.query_one(PortfolioTable)
-                portfolio_table.refresh_data()
+                self._portfolio_table.refresh_data()
                 self.notify(
                     f"✅ {stock.symbol} 추가됨: {stock.quantity}주 @ ${stock.avg_price:.2f}",
                     severity="information"
@@ -191,15 +170,13 @@ class MyDashApp(App):
 
     def action_edit_stock(self) -> None:
         """Edit selected stock."""
-        portfolio_table = self.query_one(PortfolioTable)
-        symbol = portfolio_table.get_selected_stock_symbol()
+        symbol = self._portfolio_table.get_selected_stock_symbol()
 
         if not symbol:
             self.notify("❌ 수정할 주식을 선택하세요", severity="error")
             return
 
-        pm = PortfolioManager()
-        stock = pm.db.get_stock_by_symbol(portfolio_table.portfolio_id, symbol)
+        stock = self.pm.db.get_stock_by_symbol(self._portfolio_table.portfolio_id, symbol)
 
         if not stock:
             self.notify("❌ 주식을 찾을 수 없습니다", severity="error")
@@ -213,15 +190,13 @@ class MyDashApp(App):
     def _handle_edit_stock(self, result) -> None:
         """Handle edit stock result."""
         if result:
-            pm = PortfolioManager()
             try:
-                updated_stock = pm.update_stock(
+                updated_stock = self.pm.update_stock(
                     stock_id=result["stock_id"],
                     quantity=result["quantity"],
                     avg_price=result["avg_price"]
                 )
-                portfolio_table = self.query_one(PortfolioTable)
-                portfolio_table.refresh_data()
+                self._portfolio_table.refresh_data()
                 self.notify(
                     f"✅ {updated_stock.symbol} 업데이트됨",
                     severity="information"
@@ -231,8 +206,7 @@ class MyDashApp(App):
 
     def action_delete_stock(self) -> None:
         """Delete selected stock."""
-        portfolio_table = self.query_one(PortfolioTable)
-        symbol = portfolio_table.get_selected_stock_symbol()
+        symbol = self._portfolio_table.get_selected_stock_symbol()
 
         if not symbol:
             self.notify("❌ 삭제할 주식을 선택하세요", severity="error")
@@ -243,32 +217,26 @@ class MyDashApp(App):
     def _handle_delete_stock(self, symbol: str, confirm: bool) -> None:
         """Handle delete stock confirmation."""
         if confirm:
-            portfolio_table = self.query_one(PortfolioTable)
-            pm = PortfolioManager()
-            stock = pm.db.get_stock_by_symbol(portfolio_table.portfolio_id, symbol)
+            deleted = self.pm.delete_stock_by_symbol(self._portfolio_table.portfolio_id, symbol)
 
-            if stock and pm.delete_stock(stock.id):
-                portfolio_table.refresh_data()
+            if deleted:
+                self._portfolio_table.refresh_data()
                 self.notify(f"✅ {symbol} 삭제됨", severity="information")
             else:
                 self.notify("❌ 삭제 실패", severity="error")
 
     def action_toggle_stock_chart(self) -> None:
         """Toggle stock chart view visibility."""
-        portfolio_table = self.query_one(PortfolioTable)
-        symbol = portfolio_table.get_selected_stock_symbol()
+        symbol = self._portfolio_table.get_selected_stock_symbol()
 
         if not symbol:
             self.notify("❌ 주식을 선택하세요", severity="error")
             return
 
-        chart_container = self.query_one("#chart-container")
-        chart_view = self.query_one(ChartView)
-
-        if chart_container.has_class("visible") and chart_view.view_mode == "stock":
+        if self._chart_container.has_class("visible") and self._chart_view.view_mode == "stock":
             # Hide chart
-            chart_container.remove_class("visible")
-            chart_view.hide_chart()
+            self._chart_container.remove_class("visible")
+            self._chart_view.hide_chart()
             self.notify("📊 차트 숨김", severity="information")
         else:
             # Show stock chart
@@ -276,13 +244,11 @@ class MyDashApp(App):
 
     def action_toggle_portfolio_chart(self) -> None:
         """Toggle portfolio chart view visibility."""
-        chart_container = self.query_one("#chart-container")
-        chart_view = self.query_one(ChartView)
 
-        if chart_container.has_class("visible") and chart_view.view_mode == "portfolio":
+        if self._chart_container.has_class("visible") and self._chart_view.view_mode == "portfolio":
             # Hide chart
-            chart_container.remove_class("visible")
-            chart_view.hide_chart()
+            self._chart_container.remove_class("visible")
+            self._chart_view.hide_chart()
             self.notify("📊 차트 숨김", severity="information")
         else:
             # Show portfolio chart
@@ -290,66 +256,99 @@ class MyDashApp(App):
 
     def _show_stock_chart(self) -> None:
         """Show stock chart for selected stock."""
-        portfolio_table = self.query_one(PortfolioTable)
-        chart_container = self.query_one("#chart-container")
-        chart_view = self.query_one(ChartView)
 
-        symbol = portfolio_table.get_selected_stock_symbol()
+        symbol = self._portfolio_table.get_selected_stock_symbol()
         if not symbol:
             self.notify("❌ 주식을 선택하세요", severity="error")
             return
 
-        pm = PortfolioManager()
-        stock = pm.db.get_stock_by_symbol(portfolio_table.portfolio_id, symbol)
+        stock = self.pm.db.get_stock_by_symbol(self._portfolio_table.portfolio_id, symbol)
 
         if stock:
-            chart_container.add_class("visible")
-            chart_view.show_stock_chart(
-                symbol,
-                {
-                    'avg_price': stock.avg_price,
-                    'quantity': stock.quantity
-                }
+            data = {
+                'avg_price': stock.avg_price,
+                'quantity': stock.quantity
+            }
+            self.run_worker(
+                self._load_stock_chart(symbol, data),
+                group="chart",
+                exclusive=True
             )
-            self.notify(f"📈 {symbol} 차트 표시", severity="information")
         else:
             self.notify("❌ 주식 정보를 찾을 수 없습니다", severity="error")
 
+    async def _load_stock_chart(self, symbol: str, data: dict) -> None:
+        """Fetch stock chart data off the UI thread, then show the chart.
+
+        Args:
+            symbol: Stock symbol
+            data: Dict with 'avg_price' and 'quantity'
+        """
+
+        # Warm the caches the chart renders from
+        await asyncio.gather(
+            self._chart_view.chart_service.get_stock_history_async(symbol, "3mo"),
+            asyncio.to_thread(self.stock_service.get_current_price, symbol)
+        )
+
+        self._chart_container.add_class("visible")
+        self._chart_view.show_stock_chart(symbol, data)
+        self.notify(f"📈 {symbol} 차트 표시", severity="information")
+
     def _show_portfolio_chart(self) -> None:
         """Show portfolio summary chart."""
-        portfolio_table = self.query_one(PortfolioTable)
-        chart_container = self.query_one("#chart-container")
-        chart_view = self.query_one(ChartView)
-
-        pm = PortfolioManager()
-        stocks = pm.get_stocks(portfolio_table.portfolio_id)
-
-        if stocks:
-            stock_data = []
-            for stock in stocks:
-                stock_data.append({
-                    'symbol': stock.symbol,
-                    'quantity': stock.quantity,
-                    'avg_price': stock.avg_price
-                })
-
-            chart_container.add_class("visible")
-            chart_view.show_portfolio_chart(stock_data)
-            self.notify("📊 포트폴리오 차트 표시", severity="information")
+
+        portfolio = self.pm.get_portfolio_holdings(self._portfolio_table.portfolio_id)
+
+        if portfolio and portfolio.symbols.size:
+            self.run_worker(
+                self._load_portfolio_chart(portfolio),
+                group="chart",
+                exclusive=True
+            )
         else:
             self.notify("❌ 표시할 데이터가 없습니다", severity="error")
 
+    async def _load_portfolio_chart(self, portfolio: Portfolio) -> None:
+        """Fetch portfolio chart data off the UI thread, then show the chart.
+
+        Args:
+            portfolio: Portfolio with holdings loaded
+        """
+        symbols = portfolio.symbols.tolist()
+
+        # Warm the history cache for every holding in one batched request,
+        # and fetch current prices and the exchange rate concurrently
+        _, _, prices = await asyncio.gather(
+            self._chart_view.chart_service.get_many_histories_async(symbols),
+            asyncio.to_thread(self.stock_service.get_usd_to_krw_rate),
+            self.stock_service.get_multiple_prices_async(symbols)
+        )
+        portfolio.set_current_prices(prices)
+
+        self._chart_container.add_class("visible")
+        self._chart_view.show_portfolio_chart(portfolio)
+        self.notify("📊 포트폴리오 차트 표시", severity="information")
+
     def on_data_table_row_selected(self, event) -> None:
         """Handle row selection in portfolio table."""
-        # Auto-update stock chart if visible
-        chart_container = self.query_one("#chart-container")
-        chart_view = self.query_one(ChartView)
-        if chart_container.has_class("visible") and chart_view.view_mode == "stock":
-            self._show_stock_chart()
+        # Auto-update stock chart if visible, once the selection settles
+        if self._chart_container.has_class("visible") and self._chart_view.view_mode == "stock":
+            if self._pending_chart_timer:
+                self._pending_chart_timer.stop()
+            self._pending_chart_timer = self.set_timer(CHART_DEBOUNCE, self._show_stock_chart)
 
 
 def main():
     """Run the application."""
+    # Service warnings go to the log file; stderr would draw over the TUI
+    Path(settings.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        filename=settings.LOG_FILE,
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
     app = MyDashApp()
     app.run()
 
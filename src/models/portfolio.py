@@ -2,9 +2,12 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Portfolio:
     """Portfolio data model.
 
@@ -19,6 +22,10 @@ class Portfolio:
         value_gain_overall: Total gain/loss (calculated)
         value_gain_today: Today's gain/loss (calculated)
         change_percent: Today's percentage change (calculated)
+        symbols: Stock symbols, in the same order as stocks
+        quantities: Share counts, in the same order as stocks
+        avg_prices: Average purchase prices, in the same order as stocks
+        current_prices: Current prices (NaN where unknown), in the same order as stocks
     """
 
     name: str
@@ -31,6 +38,71 @@ class Portfolio:
     value_gain_overall: float = 0.0
     value_gain_today: float = 0.0
     change_percent: float = 0.0
+    # Column arrays mirroring stocks, for vectorized valuation (see set_stocks
+    # and set_holdings)
+    symbols: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=object), init=False, repr=False, compare=False
+    )
+    quantities: np.ndarray = field(
+        default_factory=lambda: np.empty(0), init=False, repr=False, compare=False
+    )
+    avg_prices: np.ndarray = field(
+        default_factory=lambda: np.empty(0), init=False, repr=False, compare=False
+    )
+    current_prices: np.ndarray = field(
+        default_factory=lambda: np.empty(0), init=False, repr=False, compare=False
+    )
+
+    def set_stocks(self, stocks: list["Stock"]) -> None:
+        """Replace the stock list and rebuild the column arrays.
+
+        Args:
+            stocks: Stocks in the portfolio
+        """
+        count = len(stocks)
+        self.stocks = stocks
+        self.symbols = np.array([s.symbol for s in stocks], dtype=object)
+        self.quantities = np.fromiter((s.quantity for s in stocks), dtype=np.float64, count=count)
+        self.avg_prices = np.fromiter((s.avg_price for s in stocks), dtype=np.float64, count=count)
+        self.current_prices = np.fromiter(
+            (s.current_price or np.nan for s in stocks), dtype=np.float64, count=count
+        )
+
+    def set_holdings(
+        self,
+        symbols: np.ndarray,
+        quantities: np.ndarray,
+        avg_prices: np.ndarray
+    ) -> None:
+        """Set the column arrays directly, without loading Stock objects.
+
+        For valuation-only use such as the portfolio chart; stocks stays
+        empty and current prices start unknown.
+
+        Args:
+            symbols: Stock symbols
+            quantities: Share counts, in the same order as symbols
+            avg_prices: Average purchase prices, in the same order as symbols
+        """
+        self.stocks = []
+        self.symbols = symbols
+        self.quantities = quantities
+        self.avg_prices = avg_prices
+        self.current_prices = np.full(len(symbols), np.nan)
+
+    def set_current_prices(self, prices: dict[str, Optional[float]]) -> None:
+        """Update current prices on the stocks and the column array.
+
+        Args:
+            prices: Symbol to current price (None if unavailable)
+        """
+        for stock in self.stocks:
+            stock.current_price = prices.get(stock.symbol) or 0.0
+        self.current_prices = np.fromiter(
+            (prices.get(symbol) or np.nan for symbol in self.symbols),
+            dtype=np.float64,
+            count=len(self.symbols)
+        )
 
     def __str__(self) -> str:
         """String representation."""
@@ -41,7 +113,8 @@ class Portfolio:
         return self.__str__()
 
 
-# Forward reference for type hints
+# Forward reference for type hints (slots=True fixes the attribute set, so
+# instances cannot gain attributes beyond the declared fields)
 from src.models.stock import Stock
 
 Portfolio.__annotations__['stocks'] = list[Stock]
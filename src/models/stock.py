@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime, date
 
 
-@dataclass
+@dataclass(slots=True)
 class Stock:
     """Stock data model.
 
@@ -12,7 +12,7 @@ class TransactionType(Enum):
     SELL = "SELL"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Transaction data model.
 
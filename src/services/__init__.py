@@ -11,6 +11,7 @@ from src.services.google_services import (
     GoogleTasksService,
 )
 from src.services.chart_service import ChartService
+from src.services.history_store import HistoryStore
 
 __all__ = [
     "PortfolioManager",
@@ -22,4 +23,5 @@ __all__ = [
     "GmailService",
     "GoogleTasksService",
     "ChartService",
+    "HistoryStore",
 ]
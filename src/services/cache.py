@@ -0,0 +1,96 @@
+"""Bounded in-memory cache with per-entry expiry."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Optional
+
+
+class TTLCache:
+    """LRU cache whose entries also expire after a time-to-live.
+
+    Reads refresh an entry's recency; once ``maxsize`` is exceeded the least
+    recently used entry is evicted. Expired entries behave as missing.
+    Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Default time-to-live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """Get a live entry.
+
+        Raises:
+            KeyError: If the key is missing or expired
+        """
+        with self._lock:
+            expires_at, value = self._data[key]
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """Store an entry with the default time-to-live."""
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Remove an entry."""
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check for a live entry without refreshing its recency."""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        """Number of stored entries (including any not yet evicted expired ones)."""
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a live entry or a default.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (default: the cache's ttl)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
@@ -1,18 +1,91 @@
 """Chart data service for stock and portfolio visualization."""
 
-from datetime import datetime, timedelta
+import asyncio
+import logging
+from datetime import date, timedelta
 from typing import Optional
-import yfinance as yf
+import numpy as np
 import pandas as pd
 
+from src.models import Portfolio
+from src.services.cache import TTLCache
+from src.services.history_store import HistoryStore, normalize_history
+
+logger = logging.getLogger(__name__)
+
+# Calendar days covered by each period the store can serve
+_PERIOD_DAYS = {
+    "1mo": 31,
+    "3mo": 92,
+    "6mo": 183,
+    "1y": 366,
+    "2y": 731,
+    "5y": 1827,
+}
+# Stored bars starting within this many days of a period's start cover it,
+# and no market closure (weekends and holidays) leaves a longer gap between bars
+_COVERAGE_SLACK = timedelta(days=7)
+# Stored bars older than the longest period are never read
+_RETENTION = timedelta(days=max(_PERIOD_DAYS.values())) + _COVERAGE_SLACK
+
+
+def _adjustments_changed(stored: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+    """Check whether fresh bars disagree with stored bars on shared dates.
+
+    yfinance back-adjusts every earlier bar after a split or dividend, so a
+    stored bar that no longer matches means the whole stored series is stale.
+    Opens are compared because a session's open is final even while it trades.
+
+    Args:
+        stored: Bars from the store
+        fresh: Newly downloaded bars in normalize_history layout
+
+    Returns:
+        True if any shared date's open differs
+    """
+    shared = stored.index.intersection(fresh.index)
+    if shared.empty:
+        return False
+    return not np.allclose(
+        stored.loc[shared, 'Open'].to_numpy(),
+        fresh.loc[shared, 'Open'].to_numpy(),
+        rtol=1e-4,
+        equal_nan=True
+    )
+
+
+def _covers(stored: pd.DataFrame, start: date) -> bool:
+    """Check whether stored bars cover a period without holes.
+
+    Args:
+        stored: Bars from the store, from the period's start on
+        start: First date of the period
+
+    Returns:
+        True if the bars start near the period's start and no gap between
+        consecutive bars is longer than a market closure
+    """
+    if stored.index[0].date() > start + _COVERAGE_SLACK:
+        return False
+    # A longer gap means bars are missing (e.g. an earlier save failed);
+    # incremental refetches only extend the end, so they would never refill it
+    gaps = np.diff(stored.index.to_numpy())
+    return not len(gaps) or gaps.max() <= np.timedelta64(_COVERAGE_SLACK)
+
 
 class ChartService:
     """Service for fetching and processing chart data."""
 
-    def __init__(self):
-        """Initialize chart service."""
-        self._cache = {}
-        self._cache_duration = timedelta(minutes=5)
+    def __init__(self, store: Optional[HistoryStore] = None):
+        """Initialize chart service.
+
+        Args:
+            store: On-disk bar store behind the in-memory cache (default: new HistoryStore)
+        """
+        # Bounded so a long session does not keep every history ever viewed
+        self._cache = TTLCache(maxsize=64, ttl=300)
+        self._store = store or HistoryStore()
+        self._store.purge_before(date.today() - _RETENTION)
 
     def get_stock_history(
         self,
@@ -22,6 +95,11 @@ class ChartService:
         """
         Get historical stock data.
 
+        Bars are persisted to the on-disk store, so only sessions from the
+        last stored bar on are downloaded again. If that bar's price has been
+        re-adjusted since it was stored, or the stored bars have a gap, the
+        whole period is downloaded again.
+
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
             period: Time period ('1mo', '3mo', '6mo', '1y')
@@ -32,32 +110,177 @@ class ChartService:
         cache_key = f"{symbol}_{period}"
 
         # Check cache
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if datetime.now() - cached_time < self._cache_duration:
-                return cached_data
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            pass
+
+        days = _PERIOD_DAYS.get(period)
+        start = date.today() - timedelta(days=days) if days else None
+        stored = self._store.load(symbol, start) if start else None
+
+        import yfinance as yf
 
         try:
             ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
 
-            if hist.empty:
-                return None
+            hist = None
+            if stored is not None and _covers(stored, start):
+                # Refetch from the last stored bar; it overlaps the fresh bars
+                fresh = ticker.history(start=stored.index[-1].date())
+                hist = stored
+                if not fresh.empty:
+                    fresh = normalize_history(fresh)
+                    if _adjustments_changed(stored, fresh):
+                        hist = None
+                    else:
+                        self._store.save(symbol, fresh)
+                        hist = pd.concat([stored, fresh])
+                        hist = hist[~hist.index.duplicated(keep='last')]
+
+            if hist is None:
+                hist = ticker.history(period=period)
+                if hist.empty:
+                    return None
+                hist = normalize_history(hist)
+                if start:
+                    self._save_period(symbol, hist)
 
             # Cache the result
-            self._cache[cache_key] = (datetime.now(), hist)
+            self._cache[cache_key] = hist
             return hist
 
         except Exception as e:
-            print(f"Error fetching history for {symbol}: {e}")
-            return None
+            logger.warning("Error fetching history for %s: %s", symbol, e)
+            # Serve stored bars when offline
+            return stored
+
+    def get_many_histories(
+        self,
+        symbols: list[str],
+        period: str = "3mo"
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Get historical data for several stocks with one batched download.
+
+        Symbols with a fresh cache entry are served from the cache; the rest
+        are fetched together and cached individually.
+
+        Args:
+            symbols: Stock symbols
+            period: Time period ('1mo', '3mo', '6mo', '1y')
+
+        Returns:
+            Dict of symbol to history DataFrame (symbols without data are omitted)
+        """
+        histories = {}
+        missing = []
+
+        for symbol in dict.fromkeys(symbols):
+            cached = self._cache.get(f"{symbol}_{period}")
+            if cached is not None:
+                histories[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return histories
+
+        import yfinance as yf
+
+        try:
+            data = yf.download(
+                tickers=" ".join(missing),
+                period=period,
+                group_by='ticker',
+                auto_adjust=True,
+                threads=True,
+                progress=False
+            )
+        except Exception as e:
+            logger.warning("Error fetching history for %s: %s", ", ".join(missing), e)
+            return histories
+
+        if data is None or data.empty:
+            return histories
+
+        for symbol in missing:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                hist = data[symbol]
+            else:
+                # Older yfinance returns flat columns for a single ticker
+                hist = data
+
+            # Rows are aligned across tickers; drop other markets' trading days
+            hist = hist.dropna(how='all')
+            if hist.empty:
+                continue
+
+            hist = normalize_history(hist)
+            if period in _PERIOD_DAYS:
+                self._save_period(symbol, hist)
+            self._cache[f"{symbol}_{period}"] = hist
+            histories[symbol] = hist
+
+        return histories
+
+    async def get_stock_history_async(
+        self,
+        symbol: str,
+        period: str = "3mo"
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get historical stock data without blocking the event loop.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            period: Time period ('1mo', '3mo', '6mo', '1y')
+
+        Returns:
+            DataFrame with columns: Date, Open, High, Low, Close, Volume
+        """
+        return await asyncio.to_thread(self.get_stock_history, symbol, period)
+
+    async def get_many_histories_async(
+        self,
+        symbols: list[str],
+        period: str = "3mo"
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Get historical data for several stocks without blocking the event loop.
+
+        Args:
+            symbols: Stock symbols
+            period: Time period ('1mo', '3mo', '6mo', '1y')
+
+        Returns:
+            Dict of symbol to history DataFrame (symbols without data are omitted)
+        """
+        return await asyncio.to_thread(self.get_many_histories, symbols, period)
+
+    def _save_period(self, symbol: str, hist: pd.DataFrame) -> None:
+        """
+        Store a freshly downloaded period of bars.
+
+        Stored bars that disagree with it were adjusted differently, so they
+        are all dropped rather than mixed with the new ones.
+
+        Args:
+            symbol: Stock symbol
+            hist: Bars in normalize_history layout
+        """
+        stored = self._store.load(symbol, hist.index[0].date())
+        replace = stored is not None and _adjustments_changed(stored, hist)
+        self._store.save(symbol, hist, replace=replace)
 
     def get_stock_returns(
         self,
         symbol: str,
         avg_price: float,
         period: str = "3mo"
-    ) -> Optional[pd.DataFrame]:
+    ) -> Optional[tuple[np.ndarray, np.ndarray]]:
         """
         Calculate stock returns vs average purchase price.
 
@@ -67,20 +290,18 @@ class ChartService:
             period: Time period
 
         Returns:
-            DataFrame with Date and Return % columns
+            Tuple of (dates, return_percentages) arrays
         """
         hist = self.get_stock_history(symbol, period)
         if hist is None:
             return None
 
-        # Calculate returns
-        returns = pd.DataFrame()
-        returns['Date'] = hist.index
-        returns['Return%'] = ((hist['Close'] - avg_price) / avg_price * 100).values
+        closes = hist['Close'].to_numpy()
+        returns = (closes - avg_price) / avg_price * 100.0
 
-        return returns
+        return hist.index.values, returns
 
-    def format_price_data(self, hist: pd.DataFrame) -> tuple[list[int], list[float]]:
+    def format_price_data(self, hist: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
         """
         Format price history for plotting.
 
@@ -88,14 +309,14 @@ class ChartService:
             hist: Historical data DataFrame
 
         Returns:
-            Tuple of (indices, prices) - using numeric indices instead of date strings
+            Tuple of (indices, prices) arrays - using numeric indices instead of date strings
         """
         if hist is None or hist.empty:
-            return [], []
+            return np.arange(0, dtype=np.int32), np.empty(0, dtype=np.float32)
 
         # Use numeric indices instead of date strings to avoid plotext date parsing issues
-        indices = list(range(len(hist)))
-        prices = hist['Close'].values.tolist()
+        indices = np.arange(len(hist), dtype=np.int32)
+        prices = hist['Close'].to_numpy()
 
         return indices, prices
 
@@ -112,59 +333,63 @@ class ChartService:
         if hist is None or hist.empty:
             return [], []
 
-        dates = [d.strftime('%m/%d') for d in hist.index]
-        volumes = hist['Volume'].values.tolist()
+        dates = pd.DatetimeIndex(hist.index).strftime('%m/%d').tolist()
+        volumes = hist['Volume'].to_numpy().tolist()
 
         return dates, volumes
 
     def get_portfolio_allocation(
         self,
-        stocks: list[tuple[str, float, float]]
+        portfolio: Portfolio
     ) -> tuple[list[str], list[float]]:
         """
         Calculate portfolio allocation percentages.
 
         Args:
-            stocks: List of (symbol, quantity, current_price) tuples
+            portfolio: Portfolio with holdings and current prices set
 
         Returns:
-            Tuple of (symbols, percentages)
+            Tuple of (symbols, percentages) for stocks with a known price
         """
-        if not stocks:
+        priced = ~np.isnan(portfolio.current_prices)
+        if not priced.any():
             return [], []
 
         # Calculate total value
-        total_value = sum(qty * price for _, qty, price in stocks)
+        values = portfolio.quantities[priced] * portfolio.current_prices[priced]
+        total_value = values.sum()
 
         if total_value == 0:
             return [], []
 
         # Calculate percentages
-        symbols = [s[0] for s in stocks]
-        percentages = [(qty * price / total_value * 100) for _, qty, price in stocks]
+        percentages = values / total_value * 100.0
 
-        return symbols, percentages
+        return portfolio.symbols[priced].tolist(), percentages.tolist()
 
     def get_portfolio_performance(
         self,
-        stocks: list[tuple[str, float, float, float]]
+        portfolio: Portfolio
     ) -> tuple[list[str], list[float]]:
         """
         Calculate individual stock performance.
 
         Args:
-            stocks: List of (symbol, quantity, avg_price, current_price) tuples
+            portfolio: Portfolio with holdings and current prices set
 
         Returns:
-            Tuple of (symbols, return_percentages)
+            Tuple of (symbols, return_percentages) for stocks with a known price
         """
-        if not stocks:
+        priced = ~np.isnan(portfolio.current_prices)
+        if not priced.any():
             return [], []
 
-        symbols = [s[0] for s in stocks]
-        returns = [
-            ((current - avg) / avg * 100) if avg > 0 else 0
-            for _, _, avg, current in stocks
-        ]
+        avgs = portfolio.avg_prices[priced]
+        currents = portfolio.current_prices[priced]
+
+        # Divide only where avg > 0 so zero-cost rows report 0 without warnings
+        returns = np.divide(
+            currents - avgs, avgs, out=np.zeros(len(avgs)), where=avgs > 0
+        ) * 100.0
 
-        return symbols, returns
+        return portfolio.symbols[priced].tolist(), returns.tolist()
@@ -1,16 +1,37 @@
 """Google OAuth authentication service."""
 
+import asyncio
+import json
+import logging
 import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 
 from src.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+def _load_json(path: str) -> dict:
+    """Read a JSON file, using orjson when it is installed.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Parsed JSON object
+    """
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
 
 class GoogleAuthService:
     """Handles Google OAuth authentication."""
@@ -36,94 +57,180 @@ class GoogleAuthService:
         self.credentials_path = credentials_path or settings.GOOGLE_CREDENTIALS_PATH
         self.token_path = token_path or settings.GOOGLE_TOKEN_PATH
         self._creds = None
+        self._services: dict[str, Any] = {}
+        # Guards _creds and _services; warmup builds services on several threads
+        self._lock = threading.Lock()
+        # Serializes token refreshes and OAuth flows, which may block for long;
+        # never held together with _lock
+        self._auth_lock = threading.Lock()
+        self._credentials_found: Optional[bool] = None
+
+    def _has_credentials_file(self) -> bool:
+        """Check for the OAuth client file (checked once; it does not change at runtime).
+
+        Returns:
+            True if the credentials file exists
+        """
+        if self._credentials_found is None:
+            self._credentials_found = Path(self.credentials_path).exists()
+            if not self._credentials_found:
+                logger.warning(
+                    "Google credentials not found: %s "
+                    "(Google 서비스를 사용하려면 credentials.json이 필요합니다)",
+                    self.credentials_path,
+                )
+        return self._credentials_found
+
+    def has_valid_token(self) -> bool:
+        """Check for usable credentials without network access or a browser flow.
+
+        A token that has expired but carries a refresh token counts as usable;
+        it is refreshed the first time a service is requested.
+
+        Returns:
+            True if a saved or cached token can be used
+        """
+        if not self._has_credentials_file():
+            return False
+
+        creds = self._creds
+        if creds is None:
+            if not Path(self.token_path).exists():
+                return False
+            try:
+                creds = Credentials.from_authorized_user_info(
+                    _load_json(self.token_path),
+                    self.SCOPES
+                )
+            except Exception as e:
+                logger.warning("Failed to load token: %s", e)
+                return False
+            with self._lock:
+                self._creds = creds
+
+        return creds.valid or bool(creds.expired and creds.refresh_token)
+
+    def ensure_credentials(self) -> Optional[Credentials]:
+        """Get or refresh OAuth credentials, running the OAuth flow if needed.
 
-    def get_credentials(self) -> Optional[Credentials]:
-        """Get or refresh OAuth credentials.
+        This may block on the network or open a browser; use has_valid_token()
+        for cheap checks.
 
         Returns:
             Google OAuth credentials or None if not available
         """
-        # Check if credentials file exists
-        if not Path(self.credentials_path).exists():
-            print(f"⚠️  Google credentials not found: {self.credentials_path}")
-            print("   Google 서비스를 사용하려면 credentials.json이 필요합니다")
+        if not self._has_credentials_file():
             return None
 
-        # Load existing token
-        if Path(self.token_path).exists():
-            self._creds = Credentials.from_authorized_user_file(
-                self.token_path,
-                self.SCOPES
-            )
-
-        # Refresh or get new credentials
-        if not self._creds or not self._creds.valid:
-            if self._creds and self._creds.expired and self._creds.refresh_token:
-                try:
-                    self._creds.refresh(Request())
-                except Exception as e:
-                    print(f"⚠️  Token refresh failed: {e}")
-                    self._creds = None
-
-            if not self._creds:
-                try:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        self.credentials_path,
-                        self.SCOPES
-                    )
-                    self._creds = flow.run_local_server(port=0)
-                except Exception as e:
-                    print(f"⚠️  OAuth flow failed: {e}")
-                    return None
-
-            # Save the credentials for next run
-            if self._creds:
-                Path(self.token_path).parent.mkdir(parents=True, exist_ok=True)
-                with open(self.token_path, 'w') as token:
-                    token.write(self._creds.to_json())
-
-        return self._creds
+        # One refresh or OAuth flow at a time; callers that waited on it
+        # reuse its result
+        with self._auth_lock:
+            creds = self._creds
+            if creds and creds.valid:
+                return creds
+
+            # Load existing token
+            if Path(self.token_path).exists():
+                creds = Credentials.from_authorized_user_info(
+                    _load_json(self.token_path),
+                    self.SCOPES
+                )
+
+            # Refresh or get new credentials
+            if not creds or not creds.valid:
+                if creds and creds.expired and creds.refresh_token:
+                    from google.auth.transport.requests import Request
+
+                    try:
+                        creds.refresh(Request())
+                    except Exception as e:
+                        logger.warning("Token refresh failed: %s", e)
+                        creds = None
+
+                if not creds:
+                    from google_auth_oauthlib.flow import InstalledAppFlow
+
+                    try:
+                        flow = InstalledAppFlow.from_client_secrets_file(
+                            self.credentials_path,
+                            self.SCOPES
+                        )
+                        creds = flow.run_local_server(port=0)
+                    except Exception as e:
+                        logger.warning("OAuth flow failed: %s", e)
+                        return None
+
+                # Save the credentials for next run
+                if creds:
+                    Path(self.token_path).parent.mkdir(parents=True, exist_ok=True)
+                    Path(self.token_path).write_text(creds.to_json())
+
+            with self._lock:
+                self._creds = creds
+            return creds
 
     def is_authenticated(self) -> bool:
-        """Check if user is authenticated.
+        """Check if user is authenticated, obtaining credentials if needed.
 
         Returns:
             True if authenticated
         """
-        creds = self.get_credentials()
+        creds = self.ensure_credentials()
         return creds is not None and creds.valid
 
-    def get_calendar_service(self):
-        """Get Google Calendar service.
+    def _get_service(self, name: str, version: str, label: str):
+        """Build a Google API service once and reuse it.
+
+        Uses the discovery documents bundled with google-api-python-client,
+        so building needs no network round-trip.
+
+        Args:
+            name: API name
+            version: API version
+            label: Service name for error messages
 
         Returns:
-            Calendar service instance or None
+            Service instance or None
         """
-        creds = self.get_credentials()
+        with self._lock:
+            if name in self._services:
+                return self._services[name]
+            creds = self._creds
+
+        # Only re-read or refresh the token when the loaded one is unusable;
+        # that may block, so it runs without holding _lock
+        if not creds or not creds.valid:
+            creds = self.ensure_credentials()
         if not creds:
             return None
 
+        # The discovery client is heavy to import and unused without a token
+        from googleapiclient.discovery import build
+
         try:
-            return build('calendar', 'v3', credentials=creds)
+            service = build(name, version, credentials=creds, static_discovery=True)
         except Exception as e:
-            print(f"⚠️  Failed to build Calendar service: {e}")
+            logger.warning("Failed to build %s service: %s", label, e)
             return None
 
+        with self._lock:
+            return self._services.setdefault(name, service)
+
+    def get_calendar_service(self):
+        """Get Google Calendar service.
+
+        Returns:
+            Calendar service instance or None
+        """
+        return self._get_service('calendar', 'v3', 'Calendar')
+
     def get_gmail_service(self):
         """Get Gmail service.
 
         Returns:
             Gmail service instance or None
         """
-        creds = self.get_credentials()
-        if not creds:
-            return None
-
-        try:
-            return build('gmail', 'v1', credentials=creds)
-        except Exception as e:
-            print(f"⚠️  Failed to build Gmail service: {e}")
-            return None
+        return self._get_service('gmail', 'v1', 'Gmail')
 
     def get_tasks_service(self):
         """Get Google Tasks service.
@@ -131,15 +238,27 @@ class GoogleAuthService:
         Returns:
             Tasks service instance or None
         """
-        creds = self.get_credentials()
+        return self._get_service('tasks', 'v1', 'Tasks')
+
+    async def warmup(self) -> bool:
+        """Obtain credentials and build all services concurrently.
+
+        Credentials are resolved first so the OAuth flow runs at most once;
+        the service builds then run side by side in worker threads.
+
+        Returns:
+            True if credentials are available
+        """
+        creds = await asyncio.to_thread(self.ensure_credentials)
         if not creds:
-            return None
+            return False
 
-        try:
-            return build('tasks', 'v1', credentials=creds)
-        except Exception as e:
-            print(f"⚠️  Failed to build Tasks service: {e}")
-            return None
+        await asyncio.gather(
+            asyncio.to_thread(self.get_calendar_service),
+            asyncio.to_thread(self.get_gmail_service),
+            asyncio.to_thread(self.get_tasks_service),
+        )
+        return True
 
     def revoke_credentials(self) -> bool:
         """Revoke OAuth credentials and delete token.
@@ -150,8 +269,10 @@ class GoogleAuthService:
         try:
             if Path(self.token_path).exists():
                 os.remove(self.token_path)
-            self._creds = None
+            with self._lock:
+                self._creds = None
+                self._services.clear()
             return True
         except Exception as e:
-            print(f"⚠️  Failed to revoke credentials: {e}")
+            logger.warning("Failed to revoke credentials: %s", e)
             return False
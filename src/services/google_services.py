@@ -1,10 +1,39 @@
 """Google services (Calendar, Gmail, Tasks)."""
 
+import functools
+import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
+from src.services.cache import TTLCache
 from src.services.google_auth import GoogleAuthService
 
+logger = logging.getLogger(__name__)
+
+# Google API batch requests accept at most this many calls
+_BATCH_LIMIT = 100
+# Message headers shown in the inbox summary
+_EMAIL_HEADERS = ('From', 'Subject', 'Date')
+# Seconds the Gmail unread count is reused before listing again
+UNREAD_CACHE_TTL = 60
+
+
+@functools.cache
+def _api_errors() -> tuple[type[Exception], ...]:
+    """Exceptions a Google API call can raise for remote or network failures.
+
+    Imported on first use so the client libraries load only once Google
+    services are actually called.
+
+    Returns:
+        Tuple of exception types for an except clause
+    """
+    from google.auth.exceptions import GoogleAuthError
+    from googleapiclient.errors import HttpError
+    from httplib2 import HttpLib2Error
+
+    return (HttpError, HttpLib2Error, GoogleAuthError, OSError)
+
 
 class GoogleCalendarService:
     """Google Calendar service."""
@@ -38,7 +67,9 @@ class GoogleCalendarService:
                 timeMin=now,
                 maxResults=max_results,
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                # Partial response: only the fields parsed below
+                fields='items(summary,start,location,description)'
             ).execute()
 
             events = events_result.get('items', [])
@@ -46,7 +77,9 @@ class GoogleCalendarService:
             # Parse events
             parsed_events = []
             for event in events:
-                start = event['start'].get('dateTime', event['start'].get('date'))
+                # A malformed event is shown without a time rather than failing the list
+                event_start = event.get('start') or {}
+                start = event_start.get('dateTime', event_start.get('date', ''))
                 parsed_events.append({
                     'summary': event.get('summary', '(No title)'),
                     'start': start,
@@ -56,8 +89,8 @@ class GoogleCalendarService:
 
             return parsed_events
 
-        except Exception as e:
-            print(f"⚠️  Calendar API error: {e}")
+        except _api_errors() as e:
+            logger.warning("Calendar API error: %s", e)
             return []
 
     def format_events_summary(self, max_events: int = 5) -> str:
@@ -74,24 +107,33 @@ class GoogleCalendarService:
         if not events:
             return "📅 일정 없음"
 
-        lines = [f"📅 다가오는 일정 ({len(events)}개):"]
-        for event in events:
-            start = event['start']
-            # Parse datetime
-            try:
-                if 'T' in start:
-                    dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    time_str = dt.strftime("%m/%d %H:%M")
-                else:
-                    dt = datetime.fromisoformat(start)
-                    time_str = dt.strftime("%m/%d")
-            except:
-                time_str = start
+        return "\n".join([
+            f"📅 다가오는 일정 ({len(events)}개):",
+            *map(self._format_event_line, events),
+        ])
+
+    @staticmethod
+    def _format_event_line(event: dict) -> str:
+        """Format one event as a summary line.
+
+        Args:
+            event: Parsed event dictionary
 
-            summary = event['summary'][:30]  # Truncate long titles
-            lines.append(f"  • {time_str} - {summary}")
+        Returns:
+            Formatted line
+        """
+        start = event['start']
+        # Timed events carry a time part; all-day events are a bare date
+        try:
+            if 'T' in start:
+                dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
+                time_str = dt.strftime("%m/%d %H:%M")
+            else:
+                time_str = datetime.fromisoformat(start).strftime("%m/%d")
+        except ValueError:
+            time_str = start
 
-        return "\n".join(lines)
+        return f"  • {time_str} - {event['summary'][:30]}"
 
 
 class GmailService:
@@ -104,6 +146,87 @@ class GmailService:
             auth_service: Google auth service instance
         """
         self.auth = auth_service or GoogleAuthService()
+        self._unread_cache = TTLCache(maxsize=1, ttl=UNREAD_CACHE_TTL)
+
+    def _list_unread(self, service, max_results: int) -> tuple[int, list[dict]]:
+        """List unread messages.
+
+        Args:
+            service: Gmail service instance
+            max_results: Maximum number of message IDs to return
+
+        Returns:
+            Tuple of (estimated unread count, message ID dicts)
+        """
+        result = service.users().messages().list(
+            userId='me',
+            q='is:unread',
+            maxResults=max_results,
+            fields='resultSizeEstimate,messages/id'
+        ).execute()
+
+        count = result.get('resultSizeEstimate', 0)
+        self._unread_cache['unread'] = count
+        return count, result.get('messages', [])
+
+    def _get_emails(self, service, messages: list[dict]) -> list[dict]:
+        """Fetch sender, subject and date for listed messages.
+
+        Args:
+            service: Gmail service instance
+            messages: Message ID dicts from a list call
+
+        Returns:
+            List of email dictionaries in the order of messages
+        """
+        responses: dict[str, dict] = {}
+
+        def collect(request_id, response, exception):
+            if exception is not None:
+                logger.warning("Gmail API error for message %s: %s", request_id, exception)
+            else:
+                responses[request_id] = response
+
+        # One multipart round trip per batch instead of one per message
+        for i in range(0, len(messages), _BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=collect)
+            for msg in messages[i:i + _BATCH_LIMIT]:
+                batch.add(
+                    service.users().messages().get(
+                        userId='me',
+                        id=msg['id'],
+                        format='metadata',
+                        metadataHeaders=list(_EMAIL_HEADERS),
+                        fields='payload/headers'
+                    ),
+                    request_id=msg['id']
+                )
+            batch.execute()
+
+        emails = []
+        for msg in messages:
+            msg_data = responses.get(msg['id'])
+            if msg_data is None:
+                continue
+
+            # Keep the first value of each wanted header and stop once all are seen
+            headers = {}
+            # A response missing its headers just falls back to the defaults below
+            for header in msg_data.get('payload', {}).get('headers', ()):
+                name = header.get('name')
+                if name in _EMAIL_HEADERS and name not in headers:
+                    headers[name] = header.get('value', '')
+                    if len(headers) == len(_EMAIL_HEADERS):
+                        break
+
+            emails.append({
+                'id': msg['id'],
+                'from': headers.get('From', 'Unknown'),
+                'subject': headers.get('Subject', '(No subject)'),
+                'date': headers.get('Date', ''),
+            })
+
+        return emails
 
     def get_unread_count(self) -> int:
         """Get count of unread emails.
@@ -111,21 +234,20 @@ class GmailService:
         Returns:
             Number of unread emails
         """
+        cached = self._unread_cache.get('unread')
+        if cached is not None:
+            return cached
+
         service = self.auth.get_gmail_service()
         if not service:
             return 0
 
         try:
-            result = service.users().messages().list(
-                userId='me',
-                q='is:unread',
-                maxResults=1
-            ).execute()
-
-            return result.get('resultSizeEstimate', 0)
+            count, _ = self._list_unread(service, max_results=1)
+            return count
 
-        except Exception as e:
-            print(f"⚠️  Gmail API error: {e}")
+        except _api_errors() as e:
+            logger.warning("Gmail API error: %s", e)
             return 0
 
     def get_recent_emails(self, max_results: int = 5) -> list[dict]:
@@ -142,40 +264,11 @@ class GmailService:
             return []
 
         try:
-            # Get unread messages
-            result = service.users().messages().list(
-                userId='me',
-                q='is:unread',
-                maxResults=max_results
-            ).execute()
-
-            messages = result.get('messages', [])
-            emails = []
-
-            for msg in messages:
-                msg_data = service.users().messages().get(
-                    userId='me',
-                    id=msg['id'],
-                    format='metadata',
-                    metadataHeaders=['From', 'Subject', 'Date']
-                ).execute()
-
-                headers = {
-                    h['name']: h['value']
-                    for h in msg_data['payload']['headers']
-                }
-
-                emails.append({
-                    'id': msg['id'],
-                    'from': headers.get('From', 'Unknown'),
-                    'subject': headers.get('Subject', '(No subject)'),
-                    'date': headers.get('Date', ''),
-                })
+            _, messages = self._list_unread(service, max_results)
+            return self._get_emails(service, messages)
 
-            return emails
-
-        except Exception as e:
-            print(f"⚠️  Gmail API error: {e}")
+        except _api_errors() as e:
+            logger.warning("Gmail API error: %s", e)
             return []
 
     def format_inbox_summary(self) -> str:
@@ -184,20 +277,30 @@ class GmailService:
         Returns:
             Formatted inbox string
         """
-        unread_count = self.get_unread_count()
-
-        if unread_count == 0:
+        service = self.auth.get_gmail_service()
+        if not service:
             return "📧 새 메일 없음"
 
-        emails = self.get_recent_emails(3)
+        try:
+            # One list call yields both the unread count and the newest IDs
+            unread_count, messages = self._list_unread(service, max_results=3)
+            if unread_count == 0:
+                return "📧 새 메일 없음"
+
+            emails = self._get_emails(service, messages)
 
-        lines = [f"📧 읽지 않은 메일 {unread_count}개:"]
-        for email in emails:
-            subject = email['subject'][:25]  # Truncate
-            sender = email['from'].split('<')[0].strip()[:20]
-            lines.append(f"  • {sender}: {subject}")
+        except _api_errors() as e:
+            logger.warning("Gmail API error: %s", e)
+            return "📧 새 메일 없음"
 
-        return "\n".join(lines)
+        # Show the display name only, truncated along with the subject
+        return "\n".join([
+            f"📧 읽지 않은 메일 {unread_count}개:",
+            *(
+                f"  • {email['from'].split('<')[0].strip()[:20]}: {email['subject'][:25]}"
+                for email in emails
+            ),
+        ])
 
 
 class GoogleTasksService:
@@ -225,18 +328,13 @@ class GoogleTasksService:
             return []
 
         try:
-            # Get default task list
-            tasklists = service.tasklists().list().execute()
-            if not tasklists.get('items'):
-                return []
-
-            default_list_id = tasklists['items'][0]['id']
-
-            # Get tasks
+            # '@default' addresses the default list directly, saving the
+            # tasklists().list() round trip the tasks call would depend on
             results = service.tasks().list(
-                tasklist=default_list_id,
+                tasklist='@default',
                 maxResults=max_results,
-                showCompleted=False
+                showCompleted=False,
+                fields='items(title,notes,due,status)'
             ).execute()
 
             tasks = results.get('items', [])
@@ -252,8 +350,8 @@ class GoogleTasksService:
 
             return parsed_tasks
 
-        except Exception as e:
-            print(f"⚠️  Tasks API error: {e}")
+        except _api_errors() as e:
+            logger.warning("Tasks API error: %s", e)
             return []
 
     def format_tasks_summary(self, max_tasks: int = 5) -> str:
@@ -270,20 +368,28 @@ class GoogleTasksService:
         if not tasks:
             return "✓ 할 일 없음"
 
-        lines = [f"✓ 할 일 목록 ({len(tasks)}개):"]
-        for task in tasks:
-            title = task['title'][:30]  # Truncate
-            due = task.get('due', '')
-
-            if due:
-                try:
-                    dt = datetime.fromisoformat(due.replace('Z', '+00:00'))
-                    due_str = f" (마감: {dt.strftime('%m/%d')})"
-                except:
-                    due_str = ""
-            else:
-                due_str = ""
+        return "\n".join([
+            f"✓ 할 일 목록 ({len(tasks)}개):",
+            *map(self._format_task_line, tasks),
+        ])
 
-            lines.append(f"  • {title}{due_str}")
+    @staticmethod
+    def _format_task_line(task: dict) -> str:
+        """Format one task as a summary line.
+
+        Args:
+            task: Parsed task dictionary
+
+        Returns:
+            Formatted line
+        """
+        due = task.get('due', '')
+        due_str = ""
+        if due:
+            try:
+                dt = datetime.fromisoformat(due.replace('Z', '+00:00'))
+                due_str = f" (마감: {dt.strftime('%m/%d')})"
+            except ValueError:
+                pass
 
-        return "\n".join(lines)
+        return f"  • {task['title'][:30]}{due_str}"
@@ -0,0 +1,188 @@
+"""Persistent on-disk store for daily price history and recent quotes."""
+
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import settings
+
+
+_SQL_CREATE_BARS = """
+    CREATE TABLE IF NOT EXISTS bars (
+        symbol TEXT NOT NULL,
+        bar_date TEXT NOT NULL,
+        open REAL,
+        high REAL,
+        low REAL,
+        close REAL,
+        volume REAL,
+        PRIMARY KEY (symbol, bar_date)
+    ) WITHOUT ROWID
+"""
+_SQL_LOAD_BARS = """SELECT bar_date, open, high, low, close, volume
+                    FROM bars
+                    WHERE symbol = ? AND bar_date >= ?
+                    ORDER BY bar_date"""
+_SQL_SAVE_BARS = """INSERT OR REPLACE INTO bars (symbol, bar_date, open, high, low, close, volume)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+_SQL_PURGE_BARS = "DELETE FROM bars WHERE bar_date < ?"
+_SQL_DELETE_SYMBOL_BARS = "DELETE FROM bars WHERE symbol = ?"
+
+_SQL_CREATE_QUOTES = """
+    CREATE TABLE IF NOT EXISTS quotes (
+        symbol TEXT PRIMARY KEY,
+        price REAL NOT NULL,
+        expires_at REAL NOT NULL
+    ) WITHOUT ROWID
+"""
+_SQL_LOAD_QUOTES = "SELECT symbol, price, expires_at FROM quotes WHERE expires_at > ? AND symbol IN ({})"
+_SQL_SAVE_QUOTE = "INSERT OR REPLACE INTO quotes (symbol, price, expires_at) VALUES (?, ?, ?)"
+_SQL_PURGE_QUOTES = "DELETE FROM quotes WHERE expires_at <= ?"
+_SQL_CLEAR_QUOTES = "DELETE FROM quotes"
+
+_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def normalize_history(hist: pd.DataFrame) -> pd.DataFrame:
+    """Reduce a yfinance history frame to OHLCV columns on a naive date index.
+
+    Args:
+        hist: History DataFrame from yfinance
+
+    Returns:
+        DataFrame indexed by trading date with float32 Open, High, Low, Close, Volume
+    """
+    index = hist.index
+    if getattr(index, "tz", None) is not None:
+        index = index.tz_localize(None)
+
+    # Single precision is ample for display and halves what downstream math reads;
+    # Volume stays floating so missing sessions can be NaN
+    normalized = hist.reindex(columns=_COLUMNS).astype(np.float32)
+    normalized.index = pd.DatetimeIndex(index).normalize().rename("Date")
+    return normalized
+
+
+class HistoryStore:
+    """Stores daily bars in SQLite so closed sessions are fetched only once.
+
+    Also keeps the latest quote per symbol with its expiry, so a restarted
+    dashboard can show prices that are still fresh without refetching them.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Initialize history store.
+
+        Args:
+            db_path: Path to SQLite cache file (default: from settings)
+        """
+        self.db_path = db_path or settings.HISTORY_CACHE_PATH
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(_SQL_CREATE_BARS)
+        self._conn.execute(_SQL_CREATE_QUOTES)
+        self._conn.execute(_SQL_PURGE_QUOTES, (time.time(),))
+        self._conn.commit()
+
+    def load(self, symbol: str, start: date) -> Optional[pd.DataFrame]:
+        """Load stored bars for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            start: First trading date to include
+
+        Returns:
+            DataFrame in normalize_history layout, or None if nothing is stored
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                _SQL_LOAD_BARS, (symbol, start.isoformat())
+            ).fetchall()
+
+        if not rows:
+            return None
+
+        hist = pd.DataFrame.from_records(rows, columns=["Date"] + _COLUMNS)
+        hist["Date"] = pd.to_datetime(hist["Date"])
+        hist[_COLUMNS] = hist[_COLUMNS].astype(np.float32)
+        return hist.set_index("Date")
+
+    def save(self, symbol: str, hist: pd.DataFrame, replace: bool = False) -> None:
+        """Insert or replace bars for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            hist: DataFrame in normalize_history layout
+            replace: Delete all of the symbol's stored bars first
+        """
+        rows = [
+            (symbol, day.date().isoformat(), *map(float, values))
+            for day, values in zip(hist.index, hist[_COLUMNS].itertuples(index=False, name=None))
+        ]
+
+        with self._lock:
+            if replace:
+                self._conn.execute(_SQL_DELETE_SYMBOL_BARS, (symbol,))
+            self._conn.executemany(_SQL_SAVE_BARS, rows)
+            self._conn.commit()
+
+    def purge_before(self, cutoff: date) -> int:
+        """Delete bars older than a date to bound the cache size.
+
+        Args:
+            cutoff: Bars dated before this are removed
+
+        Returns:
+            Number of bars deleted
+        """
+        with self._lock:
+            cursor = self._conn.execute(_SQL_PURGE_BARS, (cutoff.isoformat(),))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def load_quotes(self, symbols: list[str]) -> dict[str, tuple[float, float]]:
+        """Load unexpired quotes.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dict of symbol to (price, remaining seconds) for quotes still fresh
+        """
+        if not symbols:
+            return {}
+
+        now = time.time()
+        sql = _SQL_LOAD_QUOTES.format(", ".join("?" * len(symbols)))
+        with self._lock:
+            rows = self._conn.execute(sql, (now, *symbols)).fetchall()
+
+        return {symbol: (price, expires_at - now) for symbol, price, expires_at in rows}
+
+    def save_quote(self, symbol: str, price: float, ttl: float) -> None:
+        """Insert or replace a symbol's quote.
+
+        Args:
+            symbol: Stock symbol
+            price: Quoted price
+            ttl: Seconds the quote stays fresh
+        """
+        with self._lock:
+            self._conn.execute(_SQL_SAVE_QUOTE, (symbol, price, time.time() + ttl))
+            self._conn.commit()
+
+    def clear_quotes(self) -> None:
+        """Delete all stored quotes so the next lookups refetch them."""
+        with self._lock:
+            self._conn.execute(_SQL_CLEAR_QUOTES)
+            self._conn.commit()
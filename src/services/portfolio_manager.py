@@ -57,7 +57,24 @@ class PortfolioManager:
         """
         portfolio = self.db.get_portfolio(portfolio_id)
         if portfolio:
-            portfolio.stocks = self.db.get_stocks_by_portfolio(portfolio_id)
+            portfolio.set_stocks(self.db.get_stocks_by_portfolio(portfolio_id))
+        return portfolio
+
+    def get_portfolio_holdings(self, portfolio_id: int) -> Optional[Portfolio]:
+        """Get portfolio by ID with its holdings as column arrays only.
+
+        Cheaper than get_portfolio when only valuation is needed, since no
+        Stock objects are built.
+
+        Args:
+            portfolio_id: Portfolio ID
+
+        Returns:
+            Portfolio with holdings arrays set or None if not found
+        """
+        portfolio = self.db.get_portfolio(portfolio_id)
+        if portfolio:
+            portfolio.set_holdings(**self.db.get_stocks_as_arrays(portfolio_id))
         return portfolio
 
     def update_portfolio(self, portfolio_id: int, name: str) -> Optional[Portfolio]:
@@ -128,59 +145,135 @@ class PortfolioManager:
         symbol = symbol.strip().upper()
         purchase_date = purchase_date or date.today()
 
-        # Check if stock already exists
-        existing_stock = self.db.get_stock_by_symbol(portfolio_id, symbol)
-
-        if existing_stock:
-            # Calculate weighted average
-            new_quantity = existing_stock.quantity + quantity
-            new_avg_price = (
-                (existing_stock.quantity * existing_stock.avg_price + quantity * price)
-                / new_quantity
-            )
-
-            # Keep earliest purchase date
-            earliest_date = min(existing_stock.purchase_date, purchase_date)
-
-            # Update stock
-            stock = self.db.update_stock(
-                existing_stock.id,
-                quantity=new_quantity,
-                avg_price=new_avg_price,
-                purchase_date=earliest_date
-            )
-
-            # Record transaction
-            self.db.create_transaction(
-                stock_id=stock.id,
-                txn_type=TransactionType.BUY,
-                quantity=quantity,
-                price=price,
-                txn_date=purchase_date
-            )
-
-            return stock
-
-        else:
-            # Create new stock
-            stock = self.db.create_stock(
-                portfolio_id=portfolio_id,
-                symbol=symbol,
-                quantity=quantity,
-                avg_price=price,
-                purchase_date=purchase_date
-            )
-
-            # Record transaction
-            self.db.create_transaction(
-                stock_id=stock.id,
-                txn_type=TransactionType.BUY,
-                quantity=quantity,
-                price=price,
-                txn_date=purchase_date
-            )
-
-            return stock
+        # Lookup, update and transaction record commit together
+        with self.db.transaction():
+            # Check if stock already exists
+            existing_stock = self.db.get_stock_by_symbol(portfolio_id, symbol)
+
+            if existing_stock:
+                # Calculate weighted average
+                new_quantity = existing_stock.quantity + quantity
+                new_avg_price = (
+                    (existing_stock.quantity * existing_stock.avg_price + quantity * price)
+                    / new_quantity
+                )
+
+                # Keep earliest purchase date
+                earliest_date = min(existing_stock.purchase_date, purchase_date)
+
+                # Update stock
+                stock = self.db.update_stock(
+                    existing_stock.id,
+                    quantity=new_quantity,
+                    avg_price=new_avg_price,
+                    purchase_date=earliest_date
+                )
+
+                # Record transaction
+                self.db.create_transaction(
+                    stock_id=stock.id,
+                    txn_type=TransactionType.BUY,
+                    quantity=quantity,
+                    price=price,
+                    txn_date=purchase_date
+                )
+
+                return stock
+
+            else:
+                # Create new stock
+                stock = self.db.create_stock(
+                    portfolio_id=portfolio_id,
+                    symbol=symbol,
+                    quantity=quantity,
+                    avg_price=price,
+                    purchase_date=purchase_date
+                )
+
+                # Record transaction
+                self.db.create_transaction(
+                    stock_id=stock.id,
+                    txn_type=TransactionType.BUY,
+                    quantity=quantity,
+                    price=price,
+                    txn_date=purchase_date
+                )
+
+                return stock
+
+    def add_stocks_bulk(
+        self,
+        portfolio_id: int,
+        rows: list[tuple[str, float, float, Optional[date]]]
+    ) -> list[Stock]:
+        """Add many purchases to a portfolio with one commit.
+
+        Purchases of the same symbol are combined into a single weighted
+        average update, existing holdings are read with one query, and the
+        BUY transactions are inserted with one executemany.
+
+        Args:
+            portfolio_id: Portfolio ID
+            rows: List of (symbol, quantity, price, purchase_date) tuples;
+                purchase_date may be None for today
+
+        Returns:
+            Created or updated stocks, one per distinct symbol in input order
+
+        Raises:
+            ValueError: If any quantity, price or symbol is invalid (nothing is saved)
+        """
+        today = date.today()
+        purchases = []
+        for symbol, quantity, price, purchase_date in rows:
+            if quantity <= 0:
+                raise ValueError("Quantity must be positive")
+            if price <= 0:
+                raise ValueError("Price must be positive")
+            if not symbol or not symbol.strip():
+                raise ValueError("Symbol cannot be empty")
+            purchases.append((symbol.strip().upper(), quantity, price, purchase_date or today))
+
+        # Per symbol: [total quantity, total cost, earliest date]
+        totals: dict[str, list] = {}
+        for symbol, quantity, price, purchase_date in purchases:
+            total = totals.setdefault(symbol, [0.0, 0.0, purchase_date])
+            total[0] += quantity
+            total[1] += quantity * price
+            total[2] = min(total[2], purchase_date)
+
+        with self.db.transaction():
+            existing = {
+                stock.symbol.upper(): stock
+                for stock in self.db.get_stocks_by_portfolio(portfolio_id)
+            }
+
+            stocks = {}
+            for symbol, (quantity, cost, earliest_date) in totals.items():
+                current = existing.get(symbol)
+                if current:
+                    new_quantity = current.quantity + quantity
+                    stocks[symbol] = self.db.update_stock(
+                        current.id,
+                        quantity=new_quantity,
+                        avg_price=(current.quantity * current.avg_price + cost) / new_quantity,
+                        purchase_date=min(current.purchase_date, earliest_date)
+                    )
+                else:
+                    stocks[symbol] = self.db.create_stock(
+                        portfolio_id=portfolio_id,
+                        symbol=symbol,
+                        quantity=quantity,
+                        avg_price=cost / quantity,
+                        purchase_date=earliest_date
+                    )
+
+            self.db.create_transactions([
+                (stocks[symbol].id, TransactionType.BUY, quantity, price, purchase_date)
+                for symbol, quantity, price, purchase_date in purchases
+            ])
+
+        return list(stocks.values())
 
     def get_stocks(self, portfolio_id: int) -> list[Stock]:
         """Get all stocks in a portfolio.
@@ -244,6 +337,50 @@ class PortfolioManager:
         """
         return self.db.delete_stock(stock_id)
 
+    def update_stock_by_symbol(
+        self,
+        portfolio_id: int,
+        symbol: str,
+        quantity: Optional[float] = None,
+        avg_price: Optional[float] = None
+    ) -> Optional[Stock]:
+        """Update stock quantity or average price by symbol.
+
+        Note: Direct updates bypass transaction history.
+
+        Args:
+            portfolio_id: Portfolio ID
+            symbol: Stock ticker symbol
+            quantity: New quantity (optional)
+            avg_price: New average price (optional)
+
+        Returns:
+            Updated stock or None if not found
+
+        Raises:
+            ValueError: If quantity or price is invalid
+        """
+        if quantity is not None and quantity <= 0:
+            raise ValueError("Quantity must be positive")
+        if avg_price is not None and avg_price <= 0:
+            raise ValueError("Price must be positive")
+
+        return self.db.update_stock_by_symbol(
+            portfolio_id, symbol, quantity=quantity, avg_price=avg_price
+        )
+
+    def delete_stock_by_symbol(self, portfolio_id: int, symbol: str) -> Optional[Stock]:
+        """Delete stock and all associated transactions by symbol.
+
+        Args:
+            portfolio_id: Portfolio ID
+            symbol: Stock ticker symbol
+
+        Returns:
+            Deleted stock or None if not found
+        """
+        return self.db.delete_stock_by_symbol(portfolio_id, symbol)
+
     # ========== Transaction Operations ==========
 
     def get_stock_transactions(self, stock_id: int) -> list[Transaction]:
@@ -270,8 +407,4 @@ class PortfolioManager:
         Returns:
             Earliest purchase date or None if portfolio has no stocks
         """
-        stocks = self.db.get_stocks_by_portfolio(portfolio_id)
-        if not stocks:
-            return None
-
-        return min(stock.purchase_date for stock in stocks)
+        return self.db.get_earliest_purchase_date(portfolio_id)
@@ -1,60 +1,229 @@
 """Stock market data service using yfinance."""
 
-from datetime import datetime, timedelta
+import asyncio
+import logging
+import threading
+from datetime import UTC, datetime, time, timedelta
 from typing import Optional
-import yfinance as yf
+from zoneinfo import ZoneInfo
 import pandas as pd
 
+from src.services.cache import TTLCache
+from src.services.history_store import HistoryStore
+
+# yfinance is imported where it is used; it is slow to import and nothing
+# needs it before the first quote is fetched
+
+logger = logging.getLogger(__name__)
+
+# Seconds a fetched price or stock info stays fresh while its market is open
+CACHE_TTL = 30
+# Longest a quote is kept on a closed weekday and over the weekend
+_CLOSED_TTL = 3600
+_WEEKEND_TTL = 86400
+# Longest the exchange rate is kept while FX markets trade
+_FX_TTL = 600
+# Seconds a failed lookup is remembered before it is retried
+_FAILURE_TTL = 60
+
+# Cache lookup default, distinct from a remembered failure (None)
+_MISSING = object()
+
+# Ticker suffixes of KOSPI and KOSDAQ listings
+_KOREAN_SUFFIXES = ('.KS', '.KQ')
+
+# Regular session (local open, local close, timezone) per market
+_KRX_SESSION = (time(9, 0), time(15, 30), ZoneInfo("Asia/Seoul"))
+_NYSE_SESSION = (time(9, 30), time(16, 0), ZoneInfo("America/New_York"))
+
+# FX trades from Sunday 21:00 UTC to Friday 21:00 UTC
+_FX_OPEN = (6, time(21, 0))
+_FX_CLOSE = (4, time(21, 0))
+
+
+def _seconds_until(now: datetime, weekday: int, at: time) -> float:
+    """Seconds from now until the next given weekday and time.
+
+    Args:
+        now: Timezone-aware current time
+        weekday: Target weekday (Monday is 0)
+        at: Target time of day in now's timezone
+
+    Returns:
+        Seconds until the target (a full week if it is right now)
+    """
+    days = (weekday - now.weekday()) % 7
+    target = datetime.combine(now.date() + timedelta(days=days), at, now.tzinfo)
+    if target <= now:
+        target += timedelta(days=7)
+    return (target - now).total_seconds()
+
 
 class StockService:
     """Fetches real-time and historical stock data using yfinance."""
 
-    def __init__(self):
-        """Initialize stock service with cache."""
-        self._cache = {}
-        self._cache_duration = timedelta(minutes=5)
-        self._exchange_rate_cache = None
-        self._exchange_rate_time = None
+    def __init__(self, store: Optional[HistoryStore] = None):
+        """Initialize stock service with cache.
 
-    def get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current stock price.
+        Args:
+            store: On-disk quote store behind the in-memory caches, so fresh
+                quotes survive a restart (default: new HistoryStore)
+        """
+        # Bounded so a long session does not keep every symbol ever queried
+        self._price_cache = TTLCache(maxsize=512, ttl=CACHE_TTL)
+        self._info_cache = TTLCache(maxsize=256, ttl=CACHE_TTL)
+        self._exchange_rate_cache = TTLCache(maxsize=1, ttl=_FX_TTL)
+        self._store = store or HistoryStore()
+        # Symbols being fetched right now, so concurrent misses share one request
+        self._inflight: dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _ttl_for(self, symbol: str) -> float:
+        """Pick how long a quote stays fresh from its market's trading hours.
+
+        Quotes refresh often during the regular session and are kept for
+        longer while the market is closed, but never past the next open.
+        Exchange holidays are treated as regular weekdays.
 
         Args:
-            symbol: Stock ticker symbol (e.g., 'AAPL', 'GOOG')
+            symbol: Stock ticker symbol
+
+        Returns:
+            Time-to-live in seconds
+        """
+        open_at, close_at, tz = _KRX_SESSION if self.is_korean_stock(symbol) else _NYSE_SESSION
+        now = datetime.now(tz)
+
+        if now.weekday() < 5 and open_at <= now.time() < close_at:
+            return CACHE_TTL
+
+        # Next session opens today (before the open) or on the next weekday
+        days = 1 if now.time() >= open_at or now.weekday() >= 5 else 0
+        next_open = datetime.combine(now.date() + timedelta(days=days), open_at, tz)
+        while next_open.weekday() >= 5:
+            next_open += timedelta(days=1)
+
+        limit = _WEEKEND_TTL if now.weekday() >= 5 else _CLOSED_TTL
+        return max(CACHE_TTL, min(limit, (next_open - now).total_seconds()))
+
+    def _fx_ttl(self) -> float:
+        """Pick how long the exchange rate stays fresh.
+
+        Returns:
+            Time-to-live in seconds
+        """
+        now = datetime.now(UTC)
+        until_open = _seconds_until(now, *_FX_OPEN)
+
+        # Markets are closed when the next open comes before the next close
+        if until_open < _seconds_until(now, *_FX_CLOSE):
+            return max(_FX_TTL, min(_WEEKEND_TTL, until_open))
+        return _FX_TTL
+
+    def _load_stored_prices(self, symbols: list[str]) -> dict[str, float]:
+        """Load quotes saved by an earlier run into the price cache (blocking).
+
+        Args:
+            symbols: Stock ticker symbols missing from the price cache
+
+        Returns:
+            Dictionary mapping symbol to price for quotes that are still fresh
+        """
+        prices = {}
+        for symbol, (price, remaining) in self._store.load_quotes(symbols).items():
+            self._price_cache.set(symbol, price, ttl=remaining)
+            prices[symbol] = price
+        return prices
+
+    def _fetch_price(self, symbol: str) -> Optional[float]:
+        """Fetch and cache a current price, coalescing concurrent requests (blocking).
+
+        If another thread is already fetching the symbol, waits for it and
+        returns its cached result instead of sending a second request.
+
+        Args:
+            symbol: Stock ticker symbol
 
         Returns:
             Current price or None if fetch fails
         """
-        # Check cache
-        cache_key = f"price_{symbol}"
-        if cache_key in self._cache:
-            cached_time, cached_price = self._cache[cache_key]
-            if datetime.now() - cached_time < self._cache_duration:
-                return cached_price
+        with self._inflight_lock:
+            event = self._inflight.get(symbol)
+            leader = event is None
+            if leader:
+                event = self._inflight[symbol] = threading.Event()
+
+        if not leader:
+            event.wait()
+            return self._price_cache.get(symbol)
 
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            return self._download_price(symbol)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[symbol]
+            event.set()
+
+    def _download_price(self, symbol: str) -> Optional[float]:
+        """Download and cache a current price (blocking).
 
-            # Try multiple price fields in order of preference
-            price = (
-                info.get('currentPrice') or
-                info.get('regularMarketPrice') or
-                info.get('previousClose')
-            )
+        Uses Ticker.fast_info, which reads a small chart payload instead of
+        the full quote summary behind Ticker.info.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            Current price or None if fetch fails
+        """
+        import yfinance as yf
+
+        try:
+            fast_info = yf.Ticker(symbol).fast_info
+            price = fast_info.get('last_price') or fast_info.get('previous_close')
 
             if price:
-                self._cache[cache_key] = (datetime.now(), price)
-                return float(price)
+                price = float(price)
+                ttl = self._ttl_for(symbol)
+                self._price_cache.set(symbol, price, ttl=ttl)
+                self._store.save_quote(symbol, price, ttl)
+                return price
 
         except Exception as e:
-            print(f"Error fetching price for {symbol}: {e}")
-            return None
+            logger.warning("Error fetching price for %s: %s", symbol, e)
 
+        # Remember the failure briefly so refreshes do not hammer a bad symbol
+        self._price_cache.set(symbol, None, ttl=_FAILURE_TTL)
         return None
 
-    def get_multiple_prices(self, symbols: list[str]) -> dict[str, Optional[float]]:
-        """Get current prices for multiple stocks efficiently.
+    def get_current_price(self, symbol: str) -> Optional[float]:
+        """Get current stock price.
+
+        Args:
+            symbol: Stock ticker symbol (e.g., 'AAPL', 'GOOG')
+
+        Returns:
+            Current price or None if fetch fails
+        """
+        cached = self._price_cache.get(symbol, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        stored = self._load_stored_prices([symbol])
+        if symbol in stored:
+            return stored[symbol]
+
+        return self._fetch_price(symbol)
+
+    async def get_multiple_prices_async(
+        self,
+        symbols: list[str]
+    ) -> dict[str, Optional[float]]:
+        """Get current prices for multiple stocks concurrently.
+
+        Cached and still-fresh stored prices are returned directly; the
+        remaining lookups are blocking yfinance requests, so they run side
+        by side in worker threads and the total wait is about one round trip.
 
         Args:
             symbols: List of stock ticker symbols
@@ -63,11 +232,26 @@ class StockService:
             Dictionary mapping symbol to current price
         """
         prices = {}
+        uncached = []
 
-        for symbol in symbols:
-            prices[symbol] = self.get_current_price(symbol)
+        for symbol in dict.fromkeys(symbols):
+            cached = self._price_cache.get(symbol, _MISSING)
+            if cached is not _MISSING:
+                prices[symbol] = cached
+            else:
+                uncached.append(symbol)
 
-        return prices
+        if uncached:
+            prices.update(await asyncio.to_thread(self._load_stored_prices, uncached))
+            uncached = [symbol for symbol in uncached if symbol not in prices]
+
+        fetched = await asyncio.gather(
+            *(asyncio.to_thread(self._fetch_price, symbol) for symbol in uncached)
+        )
+        prices.update(zip(uncached, fetched))
+
+        # Preserve the caller's symbol order
+        return {symbol: prices[symbol] for symbol in dict.fromkeys(symbols)}
 
     def get_stock_history(
         self,
@@ -84,6 +268,8 @@ class StockService:
             DataFrame with columns: Date, Open, High, Low, Close, Volume
             or None if fetch fails
         """
+        import yfinance as yf
+
         try:
             ticker = yf.Ticker(symbol)
 
@@ -110,7 +296,7 @@ class StockService:
             return history
 
         except Exception as e:
-            print(f"Error fetching history for {symbol}: {e}")
+            logger.warning("Error fetching history for %s: %s", symbol, e)
             return None
 
     def get_stock_info(self, symbol: str) -> Optional[dict]:
@@ -123,11 +309,11 @@ class StockService:
             Dictionary with stock info or None if fetch fails
         """
         # Check cache
-        cache_key = f"info_{symbol}"
-        if cache_key in self._cache:
-            cached_time, cached_info = self._cache[cache_key]
-            if datetime.now() - cached_time < self._cache_duration:
-                return cached_info
+        cached = self._info_cache.get(symbol, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        import yfinance as yf
 
         try:
             ticker = yf.Ticker(symbol)
@@ -154,11 +340,12 @@ class StockService:
                 "52w_low": info.get("fiftyTwoWeekLow"),
             }
 
-            self._cache[cache_key] = (datetime.now(), stock_info)
+            self._info_cache.set(symbol, stock_info, ttl=self._ttl_for(symbol))
             return stock_info
 
         except Exception as e:
-            print(f"Error fetching info for {symbol}: {e}")
+            logger.warning("Error fetching info for %s: %s", symbol, e)
+            self._info_cache.set(symbol, None, ttl=_FAILURE_TTL)
             return None
 
     def is_korean_stock(self, symbol: str) -> bool:
@@ -170,7 +357,7 @@ class StockService:
         Returns:
             True if symbol ends with .KS or .KQ
         """
-        return symbol.endswith('.KS') or symbol.endswith('.KQ')
+        return symbol.endswith(_KOREAN_SUFFIXES)
 
     def get_usd_to_krw_rate(self) -> Optional[float]:
         """Get current USD to KRW exchange rate.
@@ -178,29 +365,35 @@ class StockService:
         Returns:
             Exchange rate (KRW per 1 USD) or None if fetch fails
         """
-        # Check cache (10 minute cache for exchange rate)
-        if self._exchange_rate_cache and self._exchange_rate_time:
-            if datetime.now() - self._exchange_rate_time < timedelta(minutes=10):
-                return self._exchange_rate_cache
+        # Check cache
+        cached = self._exchange_rate_cache.get("KRW=X", _MISSING)
+        if cached is not _MISSING:
+            return cached
 
-        try:
-            ticker = yf.Ticker("KRW=X")
-            info = ticker.info
+        stored = self._store.load_quotes(["KRW=X"]).get("KRW=X")
+        if stored:
+            rate, remaining = stored
+            self._exchange_rate_cache.set("KRW=X", rate, ttl=remaining)
+            return rate
 
-            rate = (
-                info.get('regularMarketPrice') or
-                info.get('previousClose')
-            )
+        import yfinance as yf
+
+        try:
+            # fast_info avoids the full quote summary payload behind Ticker.info
+            fast_info = yf.Ticker("KRW=X").fast_info
+            rate = fast_info.get('last_price') or fast_info.get('previous_close')
 
             if rate:
-                self._exchange_rate_cache = float(rate)
-                self._exchange_rate_time = datetime.now()
-                return float(rate)
+                rate = float(rate)
+                ttl = self._fx_ttl()
+                self._exchange_rate_cache.set("KRW=X", rate, ttl=ttl)
+                self._store.save_quote("KRW=X", rate, ttl)
+                return rate
 
         except Exception as e:
-            print(f"Error fetching KRW exchange rate: {e}")
-            return None
+            logger.warning("Error fetching KRW exchange rate: %s", e)
 
+        self._exchange_rate_cache.set("KRW=X", None, ttl=_FAILURE_TTL)
         return None
 
     def format_currency(self, amount: float, symbol: str) -> str:
@@ -219,24 +412,20 @@ class StockService:
             return f"${amount:,.2f}"
 
     def clear_cache(self):
-        """Clear all cached data."""
-        self._cache.clear()
-        self._exchange_rate_cache = None
-        self._exchange_rate_time = None
+        """Clear all cached data, including quotes persisted for a restart."""
+        self._price_cache.clear()
+        self._info_cache.clear()
+        self._exchange_rate_cache.clear()
+        self._store.clear_quotes()
 
     def get_cache_stats(self) -> dict:
         """Get cache statistics for debugging.
 
         Returns:
-            Dictionary with cache size and oldest entry time
+            Dictionary with cache sizes
         """
-        if not self._cache:
-            return {"size": 0, "oldest_entry": None}
-
-        oldest_time = min(time for time, _ in self._cache.values())
-
         return {
-            "size": len(self._cache),
-            "oldest_entry": oldest_time,
-            "cache_duration_minutes": self._cache_duration.total_seconds() / 60
+            "price_entries": len(self._price_cache),
+            "info_entries": len(self._info_cache),
+            "exchange_rate_cached": "KRW=X" in self._exchange_rate_cache,
         }
@@ -2,10 +2,13 @@
 
 import os
 import platform
+import time
 from datetime import datetime
 from typing import Optional
 import psutil
 
+from src.services.cache import TTLCache
+
 
 class SystemService:
     """Provides system information and monitoring."""
@@ -14,6 +17,13 @@ class SystemService:
         """Initialize system service."""
         self._username = None
         self._hostname = None
+        self._cpu = 0.0
+        self._mem = psutil.virtual_memory()
+        self._now = datetime.now()
+        self._status_cache = TTLCache(maxsize=1, ttl=1)
+
+        # Prime the counter so later non-blocking calls measure since the last one
+        psutil.cpu_percent(interval=None)
 
     def get_username(self) -> str:
         """Get current username.
@@ -44,12 +54,15 @@ class SystemService:
         return f"{self.get_username()}@{self.get_hostname()}"
 
     def get_cpu_percent(self) -> float:
-        """Get current CPU usage percentage.
+        """Get CPU usage percentage since the previous call.
+
+        Non-blocking; the first reading after startup covers the time since
+        the service was created.
 
         Returns:
             CPU usage percentage (0-100)
         """
-        return psutil.cpu_percent(interval=0.1)
+        return psutil.cpu_percent(interval=None)
 
     def get_memory_info(self) -> dict[str, float]:
         """Get memory usage information.
@@ -72,6 +85,12 @@ class SystemService:
         """
         return psutil.virtual_memory().percent
 
+    def snapshot(self) -> None:
+        """Read CPU, memory and time once for the composite getters below."""
+        self._cpu = self.get_cpu_percent()
+        self._mem = psutil.virtual_memory()
+        self._now = self.get_current_time()
+
     def get_current_time(self) -> datetime:
         """Get current local time.
 
@@ -100,31 +119,47 @@ class SystemService:
         Returns:
             Dictionary with all system info
         """
-        mem_info = self.get_memory_info()
+        self.snapshot()
 
         return {
             'whoami': self.get_whoami(),
             'username': self.get_username(),
             'hostname': self.get_hostname(),
-            'cpu_percent': self.get_cpu_percent(),
-            'memory_used_gb': mem_info['used_gb'],
-            'memory_total_gb': mem_info['total_gb'],
-            'memory_percent': mem_info['percent'],
-            'current_time': self.get_current_time(),
+            'cpu_percent': self._cpu,
+            'memory_used_gb': self._mem.used / (1024 ** 3),
+            'memory_total_gb': self._mem.total / (1024 ** 3),
+            'memory_percent': self._mem.percent,
+            'current_time': self._now,
             'platform': platform.system(),
             'platform_release': platform.release(),
             'python_version': platform.python_version(),
         }
 
-    def format_status_line(self) -> str:
+    def format_status_line(self, force: bool = False) -> str:
         """Format system status for header display.
 
+        The line shows the time to the second, so it is rebuilt at most once
+        per wall-clock second; repeated calls within a second reuse it.
+
+        Args:
+            force: Rebuild even if a line for the current second exists
+
         Returns:
             Formatted status string
         """
-        cpu = self.get_cpu_percent()
-        mem = self.get_memory_percent()
-        time_str = self.format_time(format="%H:%M:%S")
+        second = int(time.time())
+        if not force:
+            cached = self._status_cache.get(second)
+            if cached is not None:
+                return cached
+
+        self.snapshot()
+        time_str = self.format_time(self._now, format="%H:%M:%S")
         whoami = self.get_whoami()
 
-        return f"👤 {whoami} | 🖥️  CPU: {cpu:.1f}% | 💾 MEM: {mem:.1f}% | 🕐 {time_str}"
+        line = (
+            f"👤 {whoami} | 🖥️  CPU: {self._cpu:.1f}% | "
+            f"💾 MEM: {self._mem.percent:.1f}% | 🕐 {time_str}"
+        )
+        self._status_cache[second] = line
+        return line
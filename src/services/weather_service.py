@@ -1,10 +1,46 @@
 """Weather information service using OpenWeatherMap API."""
 
-from datetime import datetime, timedelta
+import asyncio
+import json
+import logging
+from datetime import datetime
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
 from src.config.settings import settings
+from src.services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+# OpenWeatherMap icon code -> emoji
+_ICON_EMOJI: dict[str, str] = {
+    '01d': '☀️',   # clear sky day
+    '01n': '🌙',   # clear sky night
+    '02d': '⛅',   # few clouds day
+    '02n': '☁️',   # few clouds night
+    '03d': '☁️',   # scattered clouds
+    '03n': '☁️',
+    '04d': '☁️',   # broken clouds
+    '04n': '☁️',
+    '09d': '🌧️',   # shower rain
+    '09n': '🌧️',
+    '10d': '🌦️',   # rain day
+    '10n': '🌧️',   # rain night
+    '11d': '⛈️',   # thunderstorm
+    '11n': '⛈️',
+    '13d': '❄️',   # snow
+    '13n': '❄️',
+    '50d': '🌫️',   # mist
+    '50n': '🌫️',
+}
 
 
 class WeatherService:
@@ -19,8 +55,21 @@ class WeatherService:
             api_key: OpenWeatherMap API key (default: from settings)
         """
         self.api_key = api_key or settings.OPENWEATHER_API_KEY
-        self._cache = {}
-        self._cache_duration = timedelta(minutes=10)
+        # Bounded so browsing many locations does not grow it without limit
+        self._cache = TTLCache(maxsize=64, ttl=600)
+
+        # Keep the connection to the API alive between cache misses
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self._session.mount('https://', adapter)
+        self._session.headers.update({
+            'Accept-Encoding': 'gzip',
+            'User-Agent': 'myDash/1.0',
+        })
 
     def get_weather(
         self,
@@ -63,52 +112,76 @@ class WeatherService:
             return None
 
         # Check cache
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if datetime.now() - cached_time < self._cache_duration:
-                return cached_data
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Fetch from API
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=5)
+            response = self._session.get(self.BASE_URL, params=params, timeout=5)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else json.loads(response.content)
+
+            # Parse weather data, looking up each section once
+            main = data.get('main') or {}
+            sys_info = data.get('sys') or {}
+            wind = data.get('wind') or {}
+            condition = (data.get('weather') or [{}])[0]
 
-            # Parse weather data
             weather_data = {
                 'city': data.get('name', 'Unknown'),
-                'country': data.get('sys', {}).get('country', ''),
-                'temperature': data.get('main', {}).get('temp'),
-                'feels_like': data.get('main', {}).get('feels_like'),
-                'temp_min': data.get('main', {}).get('temp_min'),
-                'temp_max': data.get('main', {}).get('temp_max'),
-                'humidity': data.get('main', {}).get('humidity'),
-                'pressure': data.get('main', {}).get('pressure'),
-                'weather': data.get('weather', [{}])[0].get('main', 'Unknown'),
-                'description': data.get('weather', [{}])[0].get('description', ''),
-                'icon': data.get('weather', [{}])[0].get('icon', '01d'),
-                'wind_speed': data.get('wind', {}).get('speed'),
-                'wind_deg': data.get('wind', {}).get('deg'),
-                'clouds': data.get('clouds', {}).get('all'),
+                'country': sys_info.get('country', ''),
+                'temperature': main.get('temp'),
+                'feels_like': main.get('feels_like'),
+                'temp_min': main.get('temp_min'),
+                'temp_max': main.get('temp_max'),
+                'humidity': main.get('humidity'),
+                'pressure': main.get('pressure'),
+                'weather': condition.get('main', 'Unknown'),
+                'description': condition.get('description', ''),
+                'icon': condition.get('icon', '01d'),
+                'wind_speed': wind.get('speed'),
+                'wind_deg': wind.get('deg'),
+                'clouds': (data.get('clouds') or {}).get('all'),
                 'visibility': data.get('visibility'),
-                'sunrise': datetime.fromtimestamp(data.get('sys', {}).get('sunrise', 0)),
-                'sunset': datetime.fromtimestamp(data.get('sys', {}).get('sunset', 0)),
+                'sunrise': datetime.fromtimestamp(sys_info.get('sunrise', 0)),
+                'sunset': datetime.fromtimestamp(sys_info.get('sunset', 0)),
                 'timestamp': datetime.fromtimestamp(data.get('dt', 0)),
                 'units': units
             }
 
             # Cache the result
-            self._cache[cache_key] = (datetime.now(), weather_data)
+            self._cache[cache_key] = weather_data
 
             return weather_data
 
         except requests.RequestException as e:
-            print(f"Weather API error: {e}")
+            logger.warning("Weather API error: %s", e)
             return None
         except (KeyError, ValueError, IndexError) as e:
-            print(f"Weather data parsing error: {e}")
+            logger.warning("Weather data parsing error: %s", e)
             return None
 
+    async def get_weather_async(
+        self,
+        city: Optional[str] = None,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        units: str = "metric"
+    ) -> Optional[dict]:
+        """Get current weather data without blocking the event loop.
+
+        Args:
+            city: City name (e.g., "Seoul", "New York")
+            lat: Latitude (if using coordinates)
+            lon: Longitude (if using coordinates)
+            units: Units system ("metric", "imperial", "standard")
+
+        Returns:
+            Weather data dictionary or None if fetch fails
+        """
+        return await asyncio.to_thread(self.get_weather, city, lat, lon, units)
+
     def get_weather_icon_emoji(self, icon_code: str) -> str:
         """Get emoji for weather icon code.
 
@@ -118,27 +191,7 @@ class WeatherService:
         Returns:
             Weather emoji
         """
-        icon_map = {
-            '01d': '☀️',   # clear sky day
-            '01n': '🌙',   # clear sky night
-            '02d': '⛅',   # few clouds day
-            '02n': '☁️',   # few clouds night
-            '03d': '☁️',   # scattered clouds
-            '03n': '☁️',
-            '04d': '☁️',   # broken clouds
-            '04n': '☁️',
-            '09d': '🌧️',   # shower rain
-            '09n': '🌧️',
-            '10d': '🌦️',   # rain day
-            '10n': '🌧️',   # rain night
-            '11d': '⛈️',   # thunderstorm
-            '11n': '⛈️',
-            '13d': '❄️',   # snow
-            '13n': '❄️',
-            '50d': '🌫️',   # mist
-            '50n': '🌫️',
-        }
-        return icon_map.get(icon_code, '🌤️')
+        return _ICON_EMOJI.get(icon_code, '🌤️')
 
     def format_weather_short(self, weather_data: Optional[dict] = None, city: str = "Seoul") -> str:
         """Format weather for compact display.
@@ -158,7 +211,6 @@ class WeatherService:
 
         temp = weather_data.get('temperature')
         icon = self.get_weather_icon_emoji(weather_data.get('icon', '01d'))
-        weather = weather_data.get('weather', 'Unknown')
 
         if temp is not None:
             return f"{icon} {temp:.1f}°C"
@@ -168,3 +220,7 @@ class WeatherService:
     def clear_cache(self):
         """Clear weather cache."""
         self._cache.clear()
+
+    def close(self) -> None:
+        """Close the HTTP session."""
+        self._session.close()
@@ -1,14 +1,24 @@
 """Chart visualization widgets using plotext."""
 
+import asyncio
+import threading
+from typing import Optional
+
+from textual import events
 from textual.widgets import Static
 from textual.reactive import reactive
 from rich.console import RenderableType
 from rich.text import Text
+import numpy as np
 import plotext as plt
 
+from src.models import Portfolio
 from src.services.chart_service import ChartService
 from src.services import StockService
 
+# plotext draws into one process-global figure; builds run on worker threads
+_PLOT_LOCK = threading.Lock()
+
 
 class ChartView(Static):
     """Detail chart view for stocks and portfolio."""
@@ -17,21 +27,74 @@ class ChartView(Static):
     selected_symbol = reactive("")
     selected_data = reactive(None)
 
-    def __init__(self, **kwargs):
-        """Initialize chart view."""
+    def __init__(
+        self,
+        stock_service: Optional[StockService] = None,
+        chart_service: Optional[ChartService] = None,
+        **kwargs,
+    ):
+        """Initialize chart view.
+
+        Args:
+            stock_service: Stock service (creates new if None)
+            chart_service: Chart service (creates new if None)
+        """
         super().__init__(**kwargs)
-        self.chart_service = ChartService()
-        self.stock_service = StockService()
+        self.chart_service = chart_service or ChartService()
+        self.stock_service = stock_service or StockService()
+        # Updated on resize so renders do not query the terminal size
+        self._chart_width = 80
+        # Last built chart; render() only returns it
+        self._chart_output: Optional[RenderableType] = None
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Track the terminal width and rebuild a shown chart to fit."""
+        self._chart_width = max(80, self.app.size.width - 10)  # Terminal width minus padding
+        if self.selected_data is not None:
+            self._rebuild()
+
+    def _new_figure(self, height: int) -> None:
+        """Reset plotext's global figure for the next chart.
+
+        Args:
+            height: Chart height in rows
+        """
+        plt.clf()
+        plt.theme('dark')
+        plt.plot_size(self._chart_width, height)
 
     def render(self) -> RenderableType:
-        """Render the chart."""
-        if self.view_mode == "stock" and self.selected_symbol:
-            return self._render_stock_chart()
-        elif self.view_mode == "portfolio" and self.selected_data:
-            return self._render_portfolio_chart()
+        """Render the last built chart."""
+        if self._chart_output is not None:
+            return self._chart_output
+        elif self.view_mode in ("stock", "portfolio") and self.selected_data:
+            return Text("📊 차트를 그리는 중...", style="dim italic")
         else:
             return Text("📊 차트를 보려면 주식을 선택하거나 'v' 키를 누르세요", style="dim italic")
 
+    def _rebuild(self) -> None:
+        """Build the current chart in a background worker."""
+        self.run_worker(self._build_chart_async(), group="chart-build", exclusive=True)
+
+    async def _build_chart_async(self) -> None:
+        """Build the current chart off the UI thread, then show it."""
+        output = await asyncio.to_thread(self._build_chart)
+        self._chart_output = output
+        self.refresh()
+
+    def _build_chart(self) -> Optional[RenderableType]:
+        """Build the chart for the current view mode.
+
+        Returns:
+            Chart renderable, or None if nothing is selected
+        """
+        with _PLOT_LOCK:
+            if self.view_mode == "stock" and self.selected_symbol:
+                return self._render_stock_chart()
+            elif self.view_mode == "portfolio" and self.selected_data:
+                return self._render_portfolio_chart()
+            return None
+
     def _render_stock_chart(self) -> RenderableType:
         """Render stock detail chart."""
         if not self.selected_symbol or not self.selected_data:
@@ -54,25 +117,15 @@ class ChartView(Static):
         # Format data
         indices, prices = self.chart_service.format_price_data(hist)
 
-        # Get date labels for display
-        date_labels = [hist.index[i].strftime('%m/%d') for i in range(0, len(hist), max(1, len(hist) // 10))]
+        # Label about ten evenly spaced days on the x-axis
+        step = max(1, len(hist) // 10)
+        date_labels = hist.index[::step].strftime('%m/%d').tolist()
 
-        # Create chart using plotext with dynamic width
-        plt.clf()
-        plt.theme('dark')
-
-        # Get terminal width dynamically
-        try:
-            import shutil
-            term_width = shutil.get_terminal_size().columns
-            chart_width = max(80, term_width - 10)  # Use terminal width minus padding
-        except:
-            chart_width = 80  # Fallback to 80
-
-        plt.plot_size(chart_width, 15)
+        # Create chart using plotext sized to the terminal
+        self._new_figure(15)
 
         # Price chart
-        plt.plot(indices, prices, marker="•", label=f"{symbol} Price")
+        plt.plot(indices.tolist(), prices.tolist(), marker="•", label=f"{symbol} Price")
 
         # Add average price line
         if avg_price > 0:
@@ -87,9 +140,7 @@ class ChartView(Static):
         plt.ylabel(f"Price ({currency_label})")
 
         # Show x-axis labels with date annotations
-        step = max(1, len(indices) // 10)
-        tick_positions = [indices[i] for i in range(0, len(indices), step)]
-        plt.xticks(tick_positions, date_labels)
+        plt.xticks(indices[::step].tolist(), date_labels)
 
         plt.grid(True, True)
 
@@ -123,70 +174,47 @@ class ChartView(Static):
         if not self.selected_data:
             return "No portfolio data"
 
-        stocks = self.selected_data
+        portfolio = self.selected_data
 
-        if not stocks:
+        if not portfolio.symbols.size:
             return "📊 포트폴리오가 비어있습니다"
 
         # Get exchange rate for KRW conversion
         usd_to_krw = self.stock_service.get_usd_to_krw_rate()
 
-        # Prepare data for allocation chart
-        stock_data = []
-        total_value_usd = 0
-        total_gain_usd = 0
-
-        for stock in stocks:
-            symbol = stock['symbol']
-            quantity = stock['quantity']
-            avg_price = stock['avg_price']
-            current_price = self.stock_service.get_current_price(symbol)
-
-            if current_price is None:
-                continue
-
-            is_korean = self.stock_service.is_korean_stock(symbol)
-            value = quantity * current_price
-            gain = quantity * (current_price - avg_price)
-
-            # Convert to USD for chart consistency
-            if is_korean and usd_to_krw:
-                value_usd = value / usd_to_krw
-                gain_usd = gain / usd_to_krw
-            else:
-                value_usd = value
-                gain_usd = gain
-
-            stock_data.append({
-                'symbol': symbol,
-                'value': value_usd,
-                'gain': gain_usd,
-                'return_pct': ((current_price - avg_price) / avg_price * 100) if avg_price > 0 else 0
-            })
-
-            total_value_usd += value_usd
-            total_gain_usd += gain_usd
-
-        if not stock_data:
+        # Only stocks with a known current price are charted
+        priced = ~np.isnan(portfolio.current_prices)
+        if not priced.any():
             return "📉 주식 데이터를 가져올 수 없습니다"
 
-        # Get terminal width dynamically
-        try:
-            import shutil
-            term_width = shutil.get_terminal_size().columns
-            chart_width = max(80, term_width - 10)  # Use terminal width minus padding
-        except:
-            chart_width = 80  # Fallback to 80
+        symbols = portfolio.symbols[priced].tolist()
+        quantities = portfolio.quantities[priced]
+        current_prices = portfolio.current_prices[priced]
+        value = quantities * current_prices
+        gain = quantities * (current_prices - portfolio.avg_prices[priced])
 
-        # Create allocation bar chart
-        plt.clf()
-        plt.theme('dark')
-        plt.plot_size(chart_width, 15)
+        # Convert to USD for chart consistency
+        if usd_to_krw:
+            is_korean = np.fromiter(
+                (self.stock_service.is_korean_stock(symbol) for symbol in symbols),
+                dtype=bool,
+                count=len(symbols)
+            )
+            scale = np.where(is_korean, 1.0 / usd_to_krw, 1.0)
+            value_usd = value * scale
+            gain_usd = gain * scale
+        else:
+            value_usd = value
+            gain_usd = gain
+
+        total_value_usd = float(value_usd.sum())
+        total_gain_usd = float(gain_usd.sum())
+        _, returns = self.chart_service.get_portfolio_performance(portfolio)
 
-        symbols = [s['symbol'] for s in stock_data]
-        values = [s['value'] for s in stock_data]
+        # Create allocation bar chart
+        self._new_figure(15)
 
-        plt.bar(symbols, values, marker="●", orientation="v")
+        plt.bar(symbols, value_usd.tolist(), marker="●", orientation="v")
         plt.title("📊 Portfolio Allocation by Value")
         plt.xlabel("Stock")
         plt.ylabel("Value (USD equiv.)")
@@ -195,11 +223,8 @@ class ChartView(Static):
         chart_output = plt.build()
 
         # Add performance chart
-        plt.clf()
-        plt.theme('dark')
-        plt.plot_size(chart_width, 12)
+        self._new_figure(12)
 
-        returns = [s['return_pct'] for s in stock_data]
         colors = ['green' if r >= 0 else 'red' for r in returns]
 
         plt.bar(symbols, returns, marker="●", orientation="v")
@@ -225,7 +250,7 @@ class ChartView(Static):
             summary += f"{'📈' if total_return >= 0 else '📉'} Return: {total_return:+.2f}% | "
             summary += f"{'✅' if total_gain_usd >= 0 else '❌'} P/L: ${total_gain_usd:+,.2f}"
 
-        return Text.from_ansi(chart_output + "\n" + chart_output2 + summary)
+        return Text.from_ansi("".join((chart_output, "\n", chart_output2, summary)))
 
     def show_stock_chart(self, symbol: str, data: dict):
         """
@@ -238,22 +263,26 @@ class ChartView(Static):
         self.view_mode = "stock"
         self.selected_symbol = symbol
         self.selected_data = data
-        self.refresh()
+        self._chart_output = None
+        self._rebuild()
 
-    def show_portfolio_chart(self, stocks: list[dict]):
+    def show_portfolio_chart(self, portfolio: Portfolio):
         """
         Show portfolio summary chart.
 
         Args:
-            stocks: List of stock dicts with symbol, quantity, avg_price
+            portfolio: Portfolio with holdings and current prices set
         """
         self.view_mode = "portfolio"
-        self.selected_data = stocks
-        self.refresh()
+        self.selected_data = portfolio
+        self._chart_output = None
+        self._rebuild()
 
     def hide_chart(self):
         """Hide the chart view."""
+        self.workers.cancel_group(self, "chart-build")
         self.view_mode = ""
         self.selected_symbol = ""
         self.selected_data = None
+        self._chart_output = None
         self.refresh()
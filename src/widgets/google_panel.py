@@ -1,8 +1,14 @@
 """Google services panel widget."""
 
+import asyncio
+import time
+from typing import Optional
+
 from textual.app import ComposeResult
+from textual.timer import Timer
 from textual.widgets import Static
 from textual.containers import Vertical
+from textual.worker import Worker
 
 from src.services import (
     GoogleAuthService,
@@ -11,6 +17,11 @@ from src.services import (
     GoogleTasksService,
 )
 
+# Seconds between refreshes while the panel is shown
+REFRESH_INTERVAL = 300.0
+# Data younger than this is not refetched when the panel is shown again
+SHOW_REFRESH_AGE = 30.0
+
 
 class GooglePanel(Vertical):
     """Panel displaying Google services information."""
@@ -23,6 +34,9 @@ class GooglePanel(Vertical):
         self.gmail = GmailService(self.auth)
         self.tasks = GoogleTasksService(self.auth)
         self._authenticated = False
+        self._refresh_worker: Optional[Worker] = None
+        self._refresh_timer: Optional[Timer] = None
+        self._last_refresh = 0.0  # time.monotonic() of the last successful refresh
 
     def compose(self) -> ComposeResult:
         """Compose the panel layout."""
@@ -31,13 +45,43 @@ class GooglePanel(Vertical):
 
     def on_mount(self) -> None:
         """Setup when widget is mounted."""
-        self._authenticated = self.auth.is_authenticated()
-        self.refresh_data()
-        # Refresh every 5 minutes
-        self.set_interval(300.0, self.refresh_data)
+        self._authenticated = self.auth.has_valid_token()
+        if self._authenticated:
+            self.query_one("#google-content", Static).update("[dim]불러오는 중...[/dim]")
+            self.run_worker(self._warmup(), group="google-warmup", exclusive=True)
+        else:
+            self.refresh_data()
+
+    async def _warmup(self) -> None:
+        """Build Google services in the background, then show their data."""
+        self._authenticated = await self.auth.warmup()
+        await self.refresh_data_async()
+        self._refresh_timer = self.set_interval(REFRESH_INTERVAL, self.refresh_data)
+        if not self.is_on_screen:
+            self._refresh_timer.pause()
+
+    def on_hide(self) -> None:
+        """Stop refreshing while nobody can see the panel."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.pause()
+
+    def on_show(self) -> None:
+        """Resume refreshing, catching up if the shown data is stale."""
+        if self._refresh_timer is None:
+            return
+        self._refresh_timer.resume()
+        if time.monotonic() - self._last_refresh > SHOW_REFRESH_AGE:
+            self.refresh_data()
 
     def refresh_data(self) -> None:
-        """Refresh Google services data."""
+        """Refresh Google services data in a background worker."""
+        # A refresh still in flight keeps its API clients busy; let it finish
+        if self._refresh_worker is not None and self._refresh_worker.is_running:
+            return
+        self._refresh_worker = self.run_worker(self.refresh_data_async(), group="google-refresh")
+
+    async def refresh_data_async(self) -> None:
+        """Fetch all Google service summaries concurrently, then update the panel."""
         content_widget = self.query_one("#google-content", Static)
 
         if not self._authenticated:
@@ -47,20 +91,25 @@ class GooglePanel(Vertical):
                 "1. Google Cloud Console에서\n"
                 "   credentials.json 다운로드\n"
                 "2. 프로젝트 루트에 저장\n"
-                "3. 앱 재시작 후 OAuth 인증\n\n"
+                "3. python setup_google_auth.py 실행\n"
+                "   (OAuth 인증) 후 앱 재시작\n\n"
                 "[dim]선택 사항입니다[/dim]"
             )
             return
 
         try:
             # Get data from all services
-            calendar_summary = self.calendar.format_events_summary(3)
-            gmail_summary = self.gmail.format_inbox_summary()
-            tasks_summary = self.tasks.format_tasks_summary(3)
+            # Each service has its own HTTP client, so they can run side by side
+            calendar_summary, gmail_summary, tasks_summary = await asyncio.gather(
+                asyncio.to_thread(self.calendar.format_events_summary, 3),
+                asyncio.to_thread(self.gmail.format_inbox_summary),
+                asyncio.to_thread(self.tasks.format_tasks_summary, 3),
+            )
 
             # Combine into display
             content = f"{calendar_summary}\n\n{gmail_summary}\n\n{tasks_summary}"
             content_widget.update(content)
+            self._last_refresh = time.monotonic()
 
         except Exception as e:
             content_widget.update(
@@ -5,67 +5,70 @@ from textual.containers import Grid, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Static
 
+# Both portfolio dialogs share one layout
+_PORTFOLIO_MODAL_CSS = """
+AddPortfolioModal, EditPortfolioModal {
+    align: center middle;
+}
+
+#dialog {
+    width: 50;
+    height: auto;
+    border: thick $background 80%;
+    background: $surface;
+    padding: 1 2;
+}
+
+#title {
+    width: 100%;
+    text-align: center;
+    text-style: bold;
+    background: $primary;
+    color: $text;
+    padding: 1;
+    margin-bottom: 1;
+}
+
+.input-group {
+    height: auto;
+    margin: 1 0;
+}
+
+.input-group Label {
+    width: 100%;
+    margin-bottom: 1;
+}
+
+.input-group Input {
+    width: 100%;
+}
+
+#button-row {
+    width: 100%;
+    height: auto;
+    grid-size: 2;
+    grid-gutter: 1;
+    margin-top: 1;
+}
+
+Button {
+    width: 100%;
+}
+
+#error-message {
+    color: $error;
+    width: 100%;
+    text-align: center;
+    height: auto;
+    margin-top: 1;
+}
+"""
+
 
 class AddPortfolioModal(ModalScreen[str | None]):
     """Modal dialog for creating a new portfolio."""
 
-    CSS = """
-    AddPortfolioModal {
-        align: center middle;
-    }
-
-    #dialog {
-        width: 50;
-        height: auto;
-        border: thick $background 80%;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
-        background: $primary;
-        color: $text;
-        padding: 1;
-        margin-bottom: 1;
-    }
-
-    .input-group {
-        height: auto;
-        margin: 1 0;
-    }
-
-    .input-group Label {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    .input-group Input {
-        width: 100%;
-    }
-
-    #button-row {
-        width: 100%;
-        height: auto;
-        grid-size: 2;
-        grid-gutter: 1;
-        margin-top: 1;
-    }
-
-    Button {
-        width: 100%;
-    }
-
-    #error-message {
-        color: $error;
-        width: 100%;
-        text-align: center;
-        height: auto;
-        margin-top: 1;
-    }
-    """
+    CSS = _PORTFOLIO_MODAL_CSS
 
     def compose(self) -> ComposeResult:
         """Compose the modal dialog."""
@@ -117,63 +120,7 @@ class AddPortfolioModal(ModalScreen[str | None]):
 class EditPortfolioModal(ModalScreen[str | None]):
     """Modal dialog for editing portfolio name."""
 
-    CSS = """
-    EditPortfolioModal {
-        align: center middle;
-    }
-
-    #dialog {
-        width: 50;
-        height: auto;
-        border: thick $background 80%;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
-        background: $primary;
-        color: $text;
-        padding: 1;
-        margin-bottom: 1;
-    }
-
-    .input-group {
-        height: auto;
-        margin: 1 0;
-    }
-
-    .input-group Label {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    .input-group Input {
-        width: 100%;
-    }
-
-    #button-row {
-        width: 100%;
-        height: auto;
-        grid-size: 2;
-        grid-gutter: 1;
-        margin-top: 1;
-    }
-
-    Button {
-        width: 100%;
-    }
-
-    #error-message {
-        color: $error;
-        width: 100%;
-        text-align: center;
-        height: auto;
-        margin-top: 1;
-    }
-    """
+    CSS = _PORTFOLIO_MODAL_CSS
 
     def __init__(self, current_name: str):
         """Initialize edit portfolio modal.
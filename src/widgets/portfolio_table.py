@@ -1,28 +1,51 @@
 """Portfolio table widget with real-time stock data."""
 
+import asyncio
+from typing import Optional
+
+import numpy as np
+
 from textual.app import ComposeResult
 from textual.widgets import DataTable, Static
 from textual.containers import Container, Vertical
+from textual.coordinate import Coordinate
 from textual.reactive import reactive
 
+from src.models import Stock
 from src.services import PortfolioManager, StockService
 
+# Cell formatters per currency: (price, amount, signed amount).
+# KRW gets a space after ₩ for better visibility.
+_KRW_FORMAT = ("₩ {:,.0f}".format, "₩ {:,.0f}".format, "₩ {:+,.0f}".format)
+_USD_FORMAT = ("${:.2f}".format, "${:,.2f}".format, "${:+,.2f}".format)
+# Current, value, gain and gain % cells of a holding without a price
+_NO_PRICE_CELLS = ("[dim]N/A[/dim]",) * 4
+
 
 class PortfolioTable(Vertical):
     """Portfolio table widget showing stocks with real-time prices."""
 
     portfolio_id: reactive[int | None] = reactive(None)
 
-    def __init__(self, portfolio_id: int | None = None):
+    def __init__(
+        self,
+        portfolio_id: int | None = None,
+        pm: Optional[PortfolioManager] = None,
+        stock_service: Optional[StockService] = None
+    ):
         """Initialize portfolio table.
 
         Args:
             portfolio_id: Portfolio ID to display
+            pm: Portfolio manager (creates new if None)
+            stock_service: Stock service (creates new if None)
         """
         super().__init__()
         self.portfolio_id = portfolio_id
-        self.pm = PortfolioManager()
-        self.stock_service = StockService()
+        self.pm = pm or PortfolioManager()
+        self.stock_service = stock_service or StockService()
+        # Inputs of the last table rebuild, to skip refreshes that change nothing
+        self._last_render_key: Optional[tuple] = None
 
     def compose(self) -> ComposeResult:
         """Compose the widget layout."""
@@ -32,7 +55,9 @@ class PortfolioTable(Vertical):
 
     def on_mount(self) -> None:
         """Setup table when widget is mounted."""
-        table = self.query_one("#portfolio-table", DataTable)
+        # Widgets are composed once; keep references instead of re-querying
+        self._table = table = self.query_one("#portfolio-table", DataTable)
+        self._summary = self.query_one("#portfolio-summary", Static)
 
         # Add columns with wider widths for KRW display (₩ symbol can cause overlap)
         table.add_column("Symbol", width=14)
@@ -57,131 +82,156 @@ class PortfolioTable(Vertical):
         Args:
             new_id: New portfolio ID
         """
-        if new_id is not None:
+        # Before mounting, on_mount does the first refresh
+        if new_id is not None and self.is_mounted:
             self.refresh_data()
 
-    def refresh_data(self) -> None:
-        """Refresh table data from database and stock service."""
+    def refresh_data(self, notify: bool = False) -> None:
+        """Refresh table data in a background worker.
+
+        A refresh requested while another is in flight cancels the older one.
+
+        Args:
+            notify: Show a notification when the refresh completes
+        """
         if not self.portfolio_id:
             return
 
-        table = self.query_one("#portfolio-table", DataTable)
-        table.clear()
+        self.run_worker(self.refresh_data_async(notify), group="refresh", exclusive=True)
+
+    async def refresh_data_async(self, notify: bool = False) -> None:
+        """Fetch stocks and prices off the UI thread, then update the table.
+
+        Args:
+            notify: Show a notification when the refresh completes
+        """
+        stocks, current_prices, usd_to_krw = await self._fetch(self.portfolio_id)
+        self._apply(stocks, current_prices, usd_to_krw)
+
+        if notify:
+            self.notify("✅ 데이터 새로고침 완료", severity="information")
 
+    async def _fetch(
+        self,
+        portfolio_id: int
+    ) -> tuple[list[Stock], dict[str, Optional[float]], Optional[float]]:
+        """Load stocks from the database and their current prices.
+
+        Args:
+            portfolio_id: Portfolio ID
+
+        Returns:
+            Tuple of (stocks, symbol to current price, USD to KRW rate)
+        """
         # Get stocks from database
-        stocks = self.pm.get_stocks(self.portfolio_id)
+        stocks = await asyncio.to_thread(self.pm.get_stocks, portfolio_id)
+        if not stocks:
+            return stocks, {}, None
+
+        # Fetch current prices and the exchange rate for KRW conversion concurrently
+        symbols = [stock.symbol for stock in stocks]
+        current_prices, usd_to_krw = await asyncio.gather(
+            self.stock_service.get_multiple_prices_async(symbols),
+            asyncio.to_thread(self.stock_service.get_usd_to_krw_rate)
+        )
+
+        return stocks, current_prices, usd_to_krw
+
+    def _apply(
+        self,
+        stocks: list[Stock],
+        current_prices: dict[str, Optional[float]],
+        usd_to_krw: Optional[float]
+    ) -> None:
+        """Rebuild table rows and summary from fetched data.
+
+        Args:
+            stocks: Stocks in the portfolio
+            current_prices: Symbol to current price
+            usd_to_krw: USD to KRW exchange rate
+        """
+        render_key = (
+            tuple((s.symbol, s.quantity, s.avg_price) for s in stocks),
+            tuple(current_prices.get(s.symbol) for s in stocks),
+            usd_to_krw
+        )
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        table = self._table
 
         if not stocks:
+            table.clear()
             table.add_row("No stocks in portfolio", "", "", "", "", "", "", "")
             self._update_summary(0, 0, 0)
             return
 
-        # Fetch current prices for all stocks
-        symbols = [stock.symbol for stock in stocks]
-        current_prices = self.stock_service.get_multiple_prices(symbols)
-
-        # Get exchange rate for KRW conversion
-        usd_to_krw = self.stock_service.get_usd_to_krw_rate()
-
-        total_value_usd = 0
-        total_cost_usd = 0
-        total_gain_usd = 0
-
-        # Add rows for each stock
-        for stock in stocks:
-            current_price = current_prices.get(stock.symbol)
-
-            if current_price:
-                is_korean = self.stock_service.is_korean_stock(stock.symbol)
-
-                value = stock.quantity * current_price
-                cost = stock.quantity * stock.avg_price
-                gain = value - cost
-                gain_pct = (gain / cost * 100) if cost > 0 else 0
-
-                # Convert to USD for total calculation
-                if is_korean and usd_to_krw:
-                    value_usd = value / usd_to_krw
-                    cost_usd = cost / usd_to_krw
-                    gain_usd = gain / usd_to_krw
-                else:
-                    value_usd = value
-                    cost_usd = cost
-                    gain_usd = gain
-
-                total_value_usd += value_usd
-                total_cost_usd += cost_usd
-                total_gain_usd += gain_usd
-
-                # Format values with appropriate currency (add space after ₩ for better visibility)
-                if is_korean:
-                    avg_price_str = f"₩ {stock.avg_price:,.0f}"
-                    current_price_str = f"₩ {current_price:,.0f}"
-                    value_str = f"₩ {value:,.0f}"
-                    cost_str = f"₩ {cost:,.0f}"
-                    # Color code gain/loss
-                    if gain >= 0:
-                        gain_str = f"[green]₩ {gain:+,.0f}[/green]"
-                    else:
-                        gain_str = f"[red]₩ {gain:+,.0f}[/red]"
-                else:
-                    avg_price_str = f"${stock.avg_price:.2f}"
-                    current_price_str = f"${current_price:.2f}"
-                    value_str = f"${value:,.2f}"
-                    cost_str = f"${cost:,.2f}"
-                    # Color code gain/loss
-                    if gain >= 0:
-                        gain_str = f"[green]${gain:+,.2f}[/green]"
-                    else:
-                        gain_str = f"[red]${gain:+,.2f}[/red]"
-
-                # Color code gain percentage
-                if gain >= 0:
-                    gain_pct_str = f"[green]{gain_pct:+.2f}%[/green]"
-                else:
-                    gain_pct_str = f"[red]{gain_pct:+.2f}%[/red]"
-
-                table.add_row(
-                    stock.symbol,
-                    f"{stock.quantity:.2f}",
-                    avg_price_str,
-                    current_price_str,
-                    value_str,
-                    cost_str,
-                    gain_str,
-                    gain_pct_str
+        # Per-holding math runs over column arrays; only formatting is per row
+        count = len(stocks)
+        quantities = np.fromiter((s.quantity for s in stocks), dtype=np.float64, count=count)
+        avg_prices = np.fromiter((s.avg_price for s in stocks), dtype=np.float64, count=count)
+        prices = np.fromiter(
+            (current_prices.get(s.symbol) or np.nan for s in stocks), dtype=np.float64, count=count
+        )
+        is_korean = np.fromiter(
+            (self.stock_service.is_korean_stock(s.symbol) for s in stocks), dtype=bool, count=count
+        )
+
+        priced = ~np.isnan(prices)
+        values = quantities * prices  # NaN where the price fetch failed
+        costs = quantities * avg_prices
+        gains = values - costs
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gain_pcts = np.where(costs > 0, gains / costs * 100, 0.0)
+
+        # Convert to USD for total calculation
+        scale = np.where(is_korean, 1.0 / usd_to_krw, 1.0) if usd_to_krw else 1.0
+        total_value_usd = float(np.sum(values * scale, where=priced))
+        total_cost_usd = float(np.sum(costs * scale))
+        total_gain_usd = float(np.sum(gains * scale, where=priced))
+
+        # Build rows for each stock
+        rows: list[tuple[str, ...]] = []
+        for stock, has_price, current_price, value, cost, gain, gain_pct, korean in zip(
+            stocks,
+            priced.tolist(),
+            prices.tolist(),
+            values.tolist(),
+            costs.tolist(),
+            gains.tolist(),
+            gain_pcts.tolist(),
+            is_korean.tolist()
+        ):
+            # Format values with appropriate currency
+            format_price, format_amount, format_gain = _KRW_FORMAT if korean else _USD_FORMAT
+
+            if has_price:
+                # Color code gain/loss
+                color = "green" if gain >= 0 else "red"
+                price_cells = (
+                    format_price(current_price),
+                    format_amount(value),
+                    f"[{color}]{format_gain(gain)}[/{color}]",
+                    f"[{color}]{gain_pct:+.2f}%[/{color}]"
                 )
             else:
                 # Price fetch failed
-                is_korean = self.stock_service.is_korean_stock(stock.symbol)
-                cost = stock.quantity * stock.avg_price
-
-                # Convert to USD for total
-                if is_korean and usd_to_krw:
-                    cost_usd = cost / usd_to_krw
-                else:
-                    cost_usd = cost
-
-                total_cost_usd += cost_usd
-
-                # Format with appropriate currency
-                if is_korean:
-                    avg_price_str = f"₩ {stock.avg_price:,.0f}"
-                    cost_str = f"₩ {cost:,.0f}"
-                else:
-                    avg_price_str = f"${stock.avg_price:.2f}"
-                    cost_str = f"${cost:,.2f}"
-
-                table.add_row(
-                    stock.symbol,
-                    f"{stock.quantity:.2f}",
-                    avg_price_str,
-                    "[dim]N/A[/dim]",
-                    "[dim]N/A[/dim]",
-                    cost_str,
-                    "[dim]N/A[/dim]",
-                    "[dim]N/A[/dim]"
-                )
+                price_cells = _NO_PRICE_CELLS
+
+            current_str, value_str, gain_str, gain_pct_str = price_cells
+            rows.append((
+                stock.symbol,
+                f"{stock.quantity:.2f}",
+                format_price(stock.avg_price),
+                current_str,
+                value_str,
+                format_amount(cost),
+                gain_str,
+                gain_pct_str
+            ))
+
+        self._set_rows(table, [stock.symbol for stock in stocks], rows)
 
         # Update summary with KRW converted values
         if usd_to_krw:
@@ -192,6 +242,28 @@ class PortfolioTable(Vertical):
         else:
             self._update_summary(total_value_usd, total_cost_usd, total_gain_usd, use_krw=False)
 
+    def _set_rows(self, table: DataTable, keys: list[str], rows: list[tuple[str, ...]]) -> None:
+        """Show rows, updating changed cells in place when the holdings are unchanged.
+
+        In-place updates keep the cursor on the selected stock across refreshes.
+
+        Args:
+            table: Portfolio data table
+            keys: Row keys (stock symbols), in the same order as rows
+            rows: Formatted cell values per row
+        """
+        with self.app.batch_update():
+            if [row_key.value for row_key in table.rows] == keys:
+                for row_index, row in enumerate(rows):
+                    current = table.get_row_at(row_index)
+                    for column_index, value in enumerate(row):
+                        if current[column_index] != value:
+                            table.update_cell_at(Coordinate(row_index, column_index), value)
+            else:
+                table.clear()
+                for key, row in zip(keys, rows):
+                    table.add_row(*row, key=key)
+
     def _update_summary(self, total_value: float, total_cost: float, total_gain: float, use_krw: bool = False) -> None:
         """Update portfolio summary display.
 
@@ -201,7 +273,7 @@ class PortfolioTable(Vertical):
             total_gain: Total gain/loss
             use_krw: Whether to display in KRW
         """
-        summary = self.query_one("#portfolio-summary", Static)
+        summary = self._summary
 
         if total_cost == 0:
             summary.update("")
@@ -210,27 +282,15 @@ class PortfolioTable(Vertical):
         gain_pct = (total_gain / total_cost * 100) if total_cost > 0 else 0
 
         # Format with appropriate currency and shorter labels for space
-        if use_krw:
-            value_str = f"₩ {total_value:,.0f}"
-            cost_str = f"₩ {total_cost:,.0f}"
-            if total_gain >= 0:
-                gain_str = f"[green]₩ {total_gain:+,.0f}[/green]"
-            else:
-                gain_str = f"[red]₩ {total_gain:+,.0f}[/red]"
-        else:
-            value_str = f"${total_value:,.2f}"
-            cost_str = f"${total_cost:,.2f}"
-            if total_gain >= 0:
-                gain_str = f"[green]${total_gain:+,.2f}[/green]"
-            else:
-                gain_str = f"[red]${total_gain:+,.2f}[/red]"
+        _, format_amount, format_gain = _KRW_FORMAT if use_krw else _USD_FORMAT
+        # Gain and gain % share a sign, so one color covers both
+        color = "green" if total_gain >= 0 else "red"
 
         # Shorter summary format to accommodate large KRW values
-        pct_color = "green" if gain_pct >= 0 else "red"
         summary_text = (
-            f"💰 {value_str} | "
-            f"📊 {cost_str} | "
-            f"📈 {gain_str} [{pct_color}]({gain_pct:+.2f}%)[/{pct_color}]"
+            f"💰 {format_amount(total_value)} | "
+            f"📊 {format_amount(total_cost)} | "
+            f"📈 [{color}]{format_gain(total_gain)}[/{color}] [{color}]({gain_pct:+.2f}%)[/{color}]"
         )
 
         summary.update(summary_text)
@@ -241,22 +301,11 @@ class PortfolioTable(Vertical):
         Returns:
             Stock symbol or None if nothing selected
         """
-        table = self.query_one("#portfolio-table", DataTable)
+        table = self._table
 
         if table.cursor_row < 0 or table.cursor_row >= table.row_count:
             return None
 
-        # Get row key and extract symbol (first column)
-        try:
-            # Iterate through rows to find the row at cursor position
-            for idx, row_key in enumerate(table.rows):
-                if idx == table.cursor_row:
-                    # Get the row data
-                    row_data = table.get_row(row_key)
-                    if row_data and len(row_data) > 0:
-                        return str(row_data[0])
-                    break
-        except Exception:
-            return None
-
-        return None
+        # Symbol is the first column
+        row_data = table.get_row_at(table.cursor_row)
+        return str(row_data[0]) if row_data else None
@@ -6,15 +6,8 @@ from textual.containers import Grid, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Static
 
-
-class AddStockModal(ModalScreen[dict | None]):
-    """Modal dialog for adding a new stock."""
-
-    CSS = """
-    AddStockModal {
-        align: center middle;
-    }
-
+# Dialog frame, title and buttons shared by the stock dialogs
+_DIALOG_CSS = """
     #dialog {
         width: 60;
         height: auto;
@@ -33,29 +26,32 @@ class AddStockModal(ModalScreen[dict | None]):
         margin-bottom: 1;
     }
 
-    .input-group {
+    #button-row {
+        width: 100%;
         height: auto;
-        margin: 1 0;
+        grid-size: 2;
+        grid-gutter: 1;
+        margin-top: 1;
     }
 
-    .input-group Label {
+    Button {
         width: 100%;
-        margin-bottom: 1;
     }
+"""
 
-    .input-group Input {
-        width: 100%;
+# Labelled inputs and the validation message of the add/edit forms
+_FORM_CSS = """
+    .input-group {
+        height: auto;
+        margin: 1 0;
     }
 
-    #button-row {
+    .input-group Label {
         width: 100%;
-        height: auto;
-        grid-size: 2;
-        grid-gutter: 1;
-        margin-top: 1;
+        margin-bottom: 1;
     }
 
-    Button {
+    .input-group Input {
         width: 100%;
     }
 
@@ -66,7 +62,17 @@ class AddStockModal(ModalScreen[dict | None]):
         height: auto;
         margin-top: 1;
     }
-    """
+"""
+
+
+class AddStockModal(ModalScreen[dict | None]):
+    """Modal dialog for adding a new stock."""
+
+    CSS = """
+    AddStockModal {
+        align: center middle;
+    }
+    """ + _DIALOG_CSS + _FORM_CSS
 
     def __init__(self, portfolio_id: int):
         """Initialize add stock modal.
@@ -119,8 +125,14 @@ class AddStockModal(ModalScreen[dict | None]):
                 yield Button("취소", variant="default", id="cancel-button")
 
     def on_mount(self) -> None:
-        """Focus the symbol input when mounted."""
-        self.query_one("#symbol-input", Input).focus()
+        """Keep form widget references and focus the symbol input."""
+        # Widgets are composed once; keep references instead of re-querying
+        self._symbol_input = self.query_one("#symbol-input", Input)
+        self._quantity_input = self.query_one("#quantity-input", Input)
+        self._price_input = self.query_one("#price-input", Input)
+        self._date_input = self.query_one("#date-input", Input)
+        self._error_msg = self.query_one("#error-message", Static)
+        self._symbol_input.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses.
@@ -136,11 +148,11 @@ class AddStockModal(ModalScreen[dict | None]):
     def _submit(self) -> None:
         """Validate and submit the form."""
         # Get inputs
-        symbol_input = self.query_one("#symbol-input", Input)
-        quantity_input = self.query_one("#quantity-input", Input)
-        price_input = self.query_one("#price-input", Input)
-        date_input = self.query_one("#date-input", Input)
-        error_msg = self.query_one("#error-message", Static)
+        symbol_input = self._symbol_input
+        quantity_input = self._quantity_input
+        price_input = self._price_input
+        date_input = self._date_input
+        error_msg = self._error_msg
 
         # Validate symbol
         symbol = symbol_input.value.strip().upper()
@@ -198,65 +210,13 @@ class EditStockModal(ModalScreen[dict | None]):
         align: center middle;
     }
 
-    #dialog {
-        width: 60;
-        height: auto;
-        border: thick $background 80%;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
-        background: $primary;
-        color: $text;
-        padding: 1;
-        margin-bottom: 1;
-    }
-
     #stock-info {
         width: 100%;
         text-align: center;
         margin-bottom: 1;
         color: $text-muted;
     }
-
-    .input-group {
-        height: auto;
-        margin: 1 0;
-    }
-
-    .input-group Label {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    .input-group Input {
-        width: 100%;
-    }
-
-    #button-row {
-        width: 100%;
-        height: auto;
-        grid-size: 2;
-        grid-gutter: 1;
-        margin-top: 1;
-    }
-
-    Button {
-        width: 100%;
-    }
-
-    #error-message {
-        color: $error;
-        width: 100%;
-        text-align: center;
-        height: auto;
-        margin-top: 1;
-    }
-    """
+    """ + _DIALOG_CSS + _FORM_CSS
 
     def __init__(self, stock_id: int, symbol: str, current_quantity: float, current_avg_price: float):
         """Initialize edit stock modal.
@@ -302,8 +262,12 @@ class EditStockModal(ModalScreen[dict | None]):
                 yield Button("취소", variant="default", id="cancel-button")
 
     def on_mount(self) -> None:
-        """Focus the quantity input when mounted."""
-        self.query_one("#quantity-input", Input).focus()
+        """Keep form widget references and focus the quantity input."""
+        # Widgets are composed once; keep references instead of re-querying
+        self._quantity_input = self.query_one("#quantity-input", Input)
+        self._price_input = self.query_one("#price-input", Input)
+        self._error_msg = self.query_one("#error-message", Static)
+        self._quantity_input.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses.
@@ -318,9 +282,9 @@ class EditStockModal(ModalScreen[dict | None]):
 
     def _submit(self) -> None:
         """Validate and submit the form."""
-        quantity_input = self.query_one("#quantity-input", Input)
-        price_input = self.query_one("#price-input", Input)
-        error_msg = self.query_one("#error-message", Static)
+        quantity_input = self._quantity_input
+        price_input = self._price_input
+        error_msg = self._error_msg
 
         # Validate quantity
         try:
@@ -357,23 +321,13 @@ class DeleteConfirmModal(ModalScreen[bool]):
     DeleteConfirmModal {
         align: center middle;
     }
-
+    """ + _DIALOG_CSS + """
     #dialog {
         width: 50;
-        height: auto;
-        border: thick $background 80%;
-        background: $surface;
-        padding: 1 2;
     }
 
     #title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
         background: $error;
-        color: $text;
-        padding: 1;
-        margin-bottom: 1;
     }
 
     #message {
@@ -381,18 +335,6 @@ class DeleteConfirmModal(ModalScreen[bool]):
         text-align: center;
         margin: 2 0;
     }
-
-    #button-row {
-        width: 100%;
-        height: auto;
-        grid-size: 2;
-        grid-gutter: 1;
-        margin-top: 1;
-    }
-
-    Button {
-        width: 100%;
-    }
     """
 
     def __init__(self, item_name: str):
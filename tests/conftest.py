@@ -0,0 +1,26 @@
+"""Shared pytest fixtures.
+
+The test modules also run as plain scripts through run_all_tests.py, where
+their main() builds the same objects by hand.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.history_store import HistoryStore
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    """Path for a database file that does not exist yet."""
+    return str(tmp_path / "mydash.db")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> HistoryStore:
+    """History store backed by an empty file in a temporary directory."""
+    return HistoryStore(str(tmp_path / "history.db"))
@@ -0,0 +1,60 @@
+"""Test the in-memory TTL cache."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.cache import TTLCache
+
+
+def test_ttl_cache_expiry() -> None:
+    """Entries past their time-to-live behave as missing."""
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("fresh", 1)
+    cache.set("stale", 2, ttl=0)
+
+    assert cache.get("fresh") == 1
+    assert "stale" not in cache
+    assert cache.get("stale", "missing") == "missing"
+    print("✓ TTL 만료")
+
+
+def test_ttl_cache_lru_eviction() -> None:
+    """The least recently read entry is evicted once maxsize is exceeded."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert "a" in cache and "c" in cache, "recently used entries were evicted"
+    assert "b" not in cache, "least recently used entry was kept"
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    print("✓ LRU 제거")
+
+
+def main() -> int:
+    """Run cache tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 캐시 테스트")
+
+    try:
+        test_ttl_cache_expiry()
+        test_ttl_cache_lru_eviction()
+    except AssertionError as e:
+        print(f"❌ 실패: {e}")
+        return 1
+
+    print("✅ 모든 캐시 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
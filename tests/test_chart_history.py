@@ -0,0 +1,132 @@
+"""Test when ChartService serves stored bars and when it refetches a period."""
+
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yfinance
+
+from src.services.chart_service import ChartService
+from src.services.history_store import HistoryStore, normalize_history
+
+
+def _bars(days: pd.DatetimeIndex) -> pd.DataFrame:
+    """Build a flat-priced yfinance-style history frame on the given days."""
+    return pd.DataFrame(
+        {
+            "Open": 10.0,
+            "High": 10.5,
+            "Low": 9.5,
+            "Close": 10.0,
+            "Volume": 1000.0,
+        },
+        index=days,
+    )
+
+
+def _weekdays(start: date, end: date) -> pd.DatetimeIndex:
+    """Weekdays from start to end inclusive."""
+    return pd.bdate_range(start, end)
+
+
+@contextmanager
+def _fake_yfinance() -> Iterator[list[dict]]:
+    """Replace yfinance.Ticker with one serving flat weekday bars up to today.
+
+    Yields:
+        List collecting the keyword arguments of each history() call
+    """
+    calls: list[dict] = []
+
+    class FakeTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def history(self, start=None, period=None):
+            calls.append({"start": start, "period": period})
+            today = date.today()
+            first = start or today - timedelta(days=92)
+            return _bars(_weekdays(first, today))
+
+    original = yfinance.Ticker
+    yfinance.Ticker = FakeTicker
+    try:
+        yield calls
+    finally:
+        yfinance.Ticker = original
+
+
+def _largest_gap(hist: pd.DataFrame) -> timedelta:
+    """Longest span between consecutive bars."""
+    return pd.Timedelta(np.diff(hist.index.to_numpy()).max()).to_pytimedelta()
+
+
+def test_complete_store_refetches_only_the_end(store: HistoryStore) -> None:
+    """Stored bars covering the period are extended from the last stored bar."""
+    today = date.today()
+    last = today - timedelta(days=3)
+    store.save("AAPL", normalize_history(_bars(_weekdays(today - timedelta(days=92), last))))
+
+    with _fake_yfinance() as calls:
+        hist = ChartService(store).get_stock_history("AAPL", "3mo")
+
+    assert len(calls) == 1 and calls[0]["period"] is None, f"history calls: {calls}"
+    assert calls[0]["start"] <= last, f"refetch started at {calls[0]['start']}, after {last}"
+    # The fresh bars were stored after the existing ones
+    stored = store.load("AAPL", today - timedelta(days=92))
+    assert stored.index[-1] == hist.index[-1], f"stored up to {stored.index[-1]}"
+    print("✓ 완전한 저장 데이터는 끝부분만 갱신")
+
+
+def test_gap_in_store_refetches_period(store: HistoryStore) -> None:
+    """A hole in the stored bars triggers a full download that refills it."""
+    today = date.today()
+    days = _weekdays(today - timedelta(days=92), today - timedelta(days=1))
+    hole = (days >= pd.Timestamp(today - timedelta(days=60))) & (
+        days < pd.Timestamp(today - timedelta(days=30))
+    )
+    store.save("AAPL", normalize_history(_bars(days[~hole])))
+
+    with _fake_yfinance() as calls:
+        hist = ChartService(store).get_stock_history("AAPL", "3mo")
+
+    assert [call["period"] for call in calls] == ["3mo"], f"history calls: {calls}"
+    assert _largest_gap(hist) <= timedelta(days=3), f"served gap {_largest_gap(hist)}"
+
+    stored = store.load("AAPL", today - timedelta(days=92))
+    assert _largest_gap(stored) <= timedelta(days=3), f"stored gap {_largest_gap(stored)}"
+    print("✓ 저장 데이터에 빈 구간이 있으면 기간 전체 재요청")
+
+
+def main() -> int:
+    """Run chart history tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 차트 히스토리 테스트")
+
+    tests = (test_complete_store_refetches_only_the_end, test_gap_in_store_refetches_period)
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            # A fresh store per test, as the pytest fixture provides
+            for index, test in enumerate(tests):
+                test(HistoryStore(str(Path(tmp) / f"history{index}.db")))
+        except AssertionError as e:
+            print(f"❌ 실패: {e}")
+            return 1
+
+    print("✅ 모든 차트 히스토리 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Test stock create, update and delete round trips through DatabaseManager."""
+
+import sqlite3
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.db_manager import DatabaseManager
+
+
+def _manager_with_portfolio() -> tuple[DatabaseManager, int]:
+    """Build an in-memory database holding one empty portfolio.
+
+    Returns:
+        Tuple of (database manager, portfolio ID)
+    """
+    db = DatabaseManager(":memory:")
+    return db, db.create_portfolio("테스트").id
+
+
+def _insert_raw_stock(db: DatabaseManager, portfolio_id: int, symbol: str) -> None:
+    """Insert a stock row as stored, bypassing create_stock's upper-casing.
+
+    Older databases can hold symbols in any case; the NOCASE collation
+    added by the migration is what makes them match.
+    """
+    db._conn.execute(
+        "INSERT INTO stocks (portfolio_id, symbol, purchase_date, quantity, avg_price) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (portfolio_id, symbol, 1704153600, 5, 300),
+    )
+    db._conn.commit()
+
+
+def test_create_matches_select() -> None:
+    """RETURNING rows map to the same Stock as a later SELECT."""
+    db, portfolio_id = _manager_with_portfolio()
+    created = db.create_stock(portfolio_id, "aapl", 10, 185, date(2024, 1, 15))
+
+    assert created.symbol == "AAPL", f"symbol {created.symbol!r}"
+    assert created.portfolio_id == portfolio_id
+    assert created.purchase_date == date(2024, 1, 15), f"purchase_date {created.purchase_date!r}"
+    # Integer inputs come back as floats, as they do from a SELECT
+    assert type(created.quantity) is float, f"quantity {created.quantity!r}"
+    assert type(created.avg_price) is float, f"avg_price {created.avg_price!r}"
+    assert (created.quantity, created.avg_price) == (10.0, 185.0), f"values: {created}"
+    assert created.id is not None and created.created_at is not None
+
+    assert db.get_stock(created.id) == created, "RETURNING and SELECT mappers differ"
+    assert db.get_stock_by_symbol(portfolio_id, "AAPL") == created
+    print("✓ 생성 결과와 조회 결과 일치")
+
+
+def test_partial_update_keeps_other_fields() -> None:
+    """Fields left as None keep their stored values."""
+    db, portfolio_id = _manager_with_portfolio()
+    created = db.create_stock(portfolio_id, "MSFT", 2, 400.0, date(2024, 2, 1))
+
+    updated = db.update_stock(created.id, quantity=3)
+    assert (updated.quantity, updated.avg_price, updated.purchase_date) == (
+        3.0, 400.0, date(2024, 2, 1)
+    ), f"quantity update: {updated}"
+
+    updated = db.update_stock_by_symbol(portfolio_id, "MSFT", purchase_date=date(2023, 6, 1))
+    assert (updated.quantity, updated.avg_price, updated.purchase_date) == (
+        3.0, 400.0, date(2023, 6, 1)
+    ), f"purchase_date update: {updated}"
+
+    updated = db.update_stock_by_symbol(portfolio_id, "MSFT", avg_price=410)
+    assert type(updated.avg_price) is float and updated.avg_price == 410.0
+    assert db.get_stock(created.id) == updated, "RETURNING and SELECT mappers differ"
+
+    # Nothing to change returns the current row without writing
+    assert db.update_stock_by_symbol(portfolio_id, "MSFT") == updated
+    assert db.update_stock_by_symbol(portfolio_id, "GOOG", quantity=1) is None
+    print("✓ 부분 업데이트")
+
+
+def test_delete_by_symbol_returns_row() -> None:
+    """Deleting by symbol returns the removed stock and leaves nothing behind."""
+    db, portfolio_id = _manager_with_portfolio()
+    created = db.create_stock(portfolio_id, "NVDA", 4, 120.0, date(2024, 3, 1))
+
+    deleted = db.delete_stock_by_symbol(portfolio_id, "NVDA")
+    assert deleted == created, f"deleted row differs: {deleted}"
+    assert db.get_stock(created.id) is None
+    assert db.delete_stock_by_symbol(portfolio_id, "NVDA") is None
+    print("✓ 심볼로 삭제")
+
+
+def test_symbols_match_case_insensitively() -> None:
+    """Symbols that differ only in case address the same holding."""
+    db, portfolio_id = _manager_with_portfolio()
+    _insert_raw_stock(db, portfolio_id, "brk-b")
+
+    found = db.get_stock_by_symbol(portfolio_id, "BRK-B")
+    assert found is not None and found.symbol == "brk-b", f"lookup: {found}"
+
+    updated = db.update_stock_by_symbol(portfolio_id, "Brk-B", quantity=6)
+    assert updated is not None and updated.quantity == 6.0, f"update: {updated}"
+    assert updated.avg_price == 300.0
+
+    try:
+        db.create_stock(portfolio_id, "BRK-B", 1, 300.0, date(2024, 1, 2))
+    except sqlite3.IntegrityError:
+        pass
+    else:
+        raise AssertionError("UNIQUE(portfolio_id, symbol) ignored a case-only difference")
+
+    deleted = db.delete_stock_by_symbol(portfolio_id, "BRK-B")
+    assert deleted == updated, f"delete: {deleted}"
+    assert db.get_stocks_by_portfolio(portfolio_id) == []
+    print("✓ 대소문자 무시 심볼 매칭")
+
+
+def main() -> int:
+    """Run database manager tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 데이터베이스 매니저 테스트")
+
+    try:
+        test_create_matches_select()
+        test_partial_update_keeps_other_fields()
+        test_delete_by_symbol_returns_row()
+        test_symbols_match_case_insensitively()
+    except AssertionError as e:
+        print(f"❌ 실패: {e}")
+        return 1
+
+    print("✅ 모든 데이터베이스 매니저 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Test that Google credential resolution does not block cached services."""
+
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import googleapiclient.discovery
+
+from src.services import google_auth as auth_module
+from src.services.google_auth import GoogleAuthService
+
+# Upper bound on any wait, so a regression fails instead of hanging
+_TIMEOUT = 5.0
+
+
+class _FakeCredentials:
+    """Credentials stand-in whose refresh takes a while and is counted."""
+
+    refreshes = 0
+
+    def __init__(self, valid: bool = False):
+        """Initialize credentials.
+
+        Args:
+            valid: Whether the token starts out usable
+        """
+        self.valid = valid
+        self.expired = not valid
+        self.refresh_token = "refresh"
+
+    def refresh(self, request) -> None:
+        """Pretend to refresh over the network."""
+        type(self).refreshes += 1
+        time.sleep(0.2)
+        self.valid, self.expired = True, False
+
+    def to_json(self) -> str:
+        """Serialize for the token file."""
+        return "{}"
+
+
+@contextmanager
+def _fake_build() -> Iterator[list[str]]:
+    """Replace the discovery build with one returning the API name.
+
+    Yields:
+        List collecting the APIs built
+    """
+    built: list[str] = []
+
+    def build(name, version, credentials=None, static_discovery=True):
+        built.append(name)
+        return f"{name}-{version}"
+
+    original = googleapiclient.discovery.build
+    googleapiclient.discovery.build = build
+    try:
+        yield built
+    finally:
+        googleapiclient.discovery.build = original
+
+
+def _auth_service(tmp: Path) -> GoogleAuthService:
+    """Build an auth service with a credentials file and a saved token in tmp."""
+    credentials_path = tmp / "credentials.json"
+    token_path = tmp / "token.json"
+    credentials_path.write_text("{}")
+    token_path.write_text("{}")
+    return GoogleAuthService(str(credentials_path), str(token_path))
+
+
+def test_cached_service_not_blocked_by_refresh(tmp_path: Path) -> None:
+    """A built service is returned while another thread resolves credentials."""
+    auth = _auth_service(tmp_path)
+    auth._services["calendar"] = "calendar-v3"
+    gate, started = threading.Event(), threading.Event()
+
+    def slow_ensure():
+        started.set()
+        gate.wait(_TIMEOUT)
+        auth._creds = _FakeCredentials(valid=True)
+        return auth._creds
+
+    auth.ensure_credentials = slow_ensure
+    with _fake_build():
+        builder = threading.Thread(target=auth.get_gmail_service, daemon=True)
+        builder.start()
+        assert started.wait(_TIMEOUT), "credential resolution never started"
+
+        began = time.monotonic()
+        service = auth.get_calendar_service()
+        waited = time.monotonic() - began
+        gate.set()
+        builder.join(_TIMEOUT)
+
+    assert service == "calendar-v3", f"service: {service}"
+    assert waited < 1.0, f"cached lookup waited {waited:.2f}s on credential resolution"
+    assert not builder.is_alive(), "service build never finished"
+    assert auth._services.get("gmail") == "gmail-v1", f"services: {auth._services}"
+    print("✓ 인증 중에도 캐시된 서비스 즉시 반환")
+
+
+def test_concurrent_refresh_runs_once(tmp_path: Path) -> None:
+    """Threads that find an expired token share a single refresh."""
+    auth = _auth_service(tmp_path)
+    _FakeCredentials.refreshes = 0
+    original = auth_module.Credentials
+
+    class FakeCredentialsLoader:
+        @staticmethod
+        def from_authorized_user_info(info, scopes):
+            return _FakeCredentials()
+
+    auth_module.Credentials = FakeCredentialsLoader
+    try:
+        results: list = []
+        threads = [
+            threading.Thread(target=lambda: results.append(auth.ensure_credentials()), daemon=True)
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(_TIMEOUT)
+    finally:
+        auth_module.Credentials = original
+
+    assert len(results) == 3, f"{3 - len(results)} callers still blocked"
+    assert _FakeCredentials.refreshes == 1, f"refreshed {_FakeCredentials.refreshes} times"
+    assert all(creds is results[0] for creds in results), "callers got different credentials"
+    assert results[0].valid, "shared credentials were not refreshed"
+    print("✓ 동시 토큰 갱신은 한 번만 실행")
+
+
+def test_warmup_builds_each_service_once(tmp_path: Path) -> None:
+    """Warmup resolves credentials once and builds the three services."""
+    auth = _auth_service(tmp_path)
+    calls: list[None] = []
+
+    def ensure():
+        calls.append(None)
+        auth._creds = _FakeCredentials(valid=True)
+        return auth._creds
+
+    auth.ensure_credentials = ensure
+    with _fake_build() as built:
+        assert asyncio.run(auth.warmup())
+
+    assert len(calls) == 1, f"credentials resolved {len(calls)} times"
+    assert sorted(built) == ["calendar", "gmail", "tasks"], f"built: {built}"
+    print("✓ 워밍업 시 서비스별 1회 생성")
+
+
+def main() -> int:
+    """Run Google auth tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 Google 인증 테스트")
+
+    tests = (
+        test_cached_service_not_blocked_by_refresh,
+        test_concurrent_refresh_runs_once,
+        test_warmup_builds_each_service_once,
+    )
+    try:
+        # A fresh directory per test, as pytest's tmp_path provides
+        for test in tests:
+            with tempfile.TemporaryDirectory() as tmp:
+                test(Path(tmp))
+    except AssertionError as e:
+        print(f"❌ 실패: {e}")
+        return 1
+
+    print("✅ 모든 Google 인증 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Test the on-disk history store."""
+
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.history_store import HistoryStore, normalize_history
+
+
+def _bars(start: str, closes: list[float]) -> pd.DataFrame:
+    """Build a daily OHLCV frame in normalize_history layout.
+
+    Args:
+        start: First trading date (ISO)
+        closes: Close price per day
+
+    Returns:
+        Normalized history DataFrame
+    """
+    index = pd.date_range(start, periods=len(closes), freq="D", tz="America/New_York")
+    hist = pd.DataFrame(
+        {
+            "Open": closes,
+            "High": closes,
+            "Low": closes,
+            "Close": closes,
+            "Volume": [1000.0] * len(closes),
+            "Dividends": 0.0,
+        },
+        index=index,
+    )
+    return normalize_history(hist)
+
+
+def test_history_store_bars(store: HistoryStore) -> None:
+    """Bars round-trip, replace drops old rows and purge bounds the store."""
+    store.save("AAPL", _bars("2024-01-01", [10.0, 11.0, 12.0]))
+
+    loaded = store.load("AAPL", date(2024, 1, 2))
+    assert loaded is not None and len(loaded) == 2, f"loaded: {loaded}"
+    assert loaded.index[0] == pd.Timestamp("2024-01-02")
+    assert np.allclose(loaded["Close"], [11.0, 12.0])
+    assert loaded["Close"].dtype == np.float32
+    assert store.load("MSFT", date(2024, 1, 1)) is None
+
+    # A re-adjusted history replaces every stored bar of the symbol
+    store.save("AAPL", _bars("2024-01-02", [1.1, 1.2]), replace=True)
+    loaded = store.load("AAPL", date(2024, 1, 1))
+    assert len(loaded) == 2 and np.allclose(loaded["Close"], [1.1, 1.2]), f"loaded: {loaded}"
+
+    deleted = store.purge_before(date(2024, 1, 3))
+    assert deleted == 1, f"purged {deleted} bars"
+    assert len(store.load("AAPL", date(2024, 1, 1))) == 1
+    print("✓ 일봉 저장/교체/정리")
+
+
+def test_history_store_quotes(store: HistoryStore) -> None:
+    """Only unexpired quotes load, and clear_quotes removes them all."""
+    store.save_quote("AAPL", 190.0, ttl=60)
+    store.save_quote("MSFT", 400.0, ttl=-1)
+
+    quotes = store.load_quotes(["AAPL", "MSFT", "GOOG"])
+    assert set(quotes) == {"AAPL"}, f"quotes: {quotes}"
+    price, remaining = quotes["AAPL"]
+    assert price == 190.0 and 0 < remaining <= 60
+
+    store.clear_quotes()
+    assert store.load_quotes(["AAPL"]) == {}
+    print("✓ 시세 저장/만료/삭제")
+
+
+def main() -> int:
+    """Run history store tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 히스토리 저장소 테스트")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            # A fresh store per test, as the pytest fixture provides
+            for index, test in enumerate((test_history_store_bars, test_history_store_quotes)):
+                test(HistoryStore(str(Path(tmp) / f"history{index}.db")))
+        except AssertionError as e:
+            print(f"❌ 실패: {e}")
+            return 1
+
+    print("✅ 모든 히스토리 저장소 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""Test upgrading a database created with the original schema."""
+
+import sqlite3
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.db_manager import DatabaseManager
+from src.database.migrations import SCHEMA_VERSION, migrate_schema
+
+
+# Schema written by the first release (user_version 0): ISO text dates,
+# case-sensitive symbols and single-column indexes
+_BASELINE_SCHEMA = """
+    CREATE TABLE portfolios (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE stocks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        portfolio_id INTEGER NOT NULL,
+        symbol TEXT NOT NULL,
+        purchase_date DATE NOT NULL,
+        quantity REAL NOT NULL CHECK(quantity > 0),
+        avg_price REAL NOT NULL CHECK(avg_price > 0),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (portfolio_id) REFERENCES portfolios(id) ON DELETE CASCADE,
+        UNIQUE(portfolio_id, symbol)
+    );
+    CREATE TABLE transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        stock_id INTEGER NOT NULL,
+        txn_type TEXT NOT NULL CHECK(txn_type IN ('BUY', 'SELL')),
+        quantity REAL NOT NULL CHECK(quantity > 0),
+        price REAL NOT NULL CHECK(price > 0),
+        txn_date DATE NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
+    );
+    CREATE INDEX idx_portfolios_name ON portfolios(name);
+    CREATE INDEX idx_stocks_portfolio ON stocks(portfolio_id);
+    CREATE INDEX idx_stocks_symbol ON stocks(symbol);
+    CREATE INDEX idx_stocks_purchase_date ON stocks(purchase_date);
+    CREATE INDEX idx_transactions_stock ON transactions(stock_id);
+    CREATE INDEX idx_transactions_date ON transactions(txn_date);
+    CREATE INDEX idx_transactions_type ON transactions(txn_type);
+
+    INSERT INTO portfolios (id, name, created_at, updated_at)
+    VALUES (1, '메인', '2024-01-02 03:04:05', '2024-01-02 03:04:05');
+    INSERT INTO stocks (id, portfolio_id, symbol, purchase_date, quantity, avg_price,
+                        created_at, updated_at)
+    VALUES (1, 1, 'AAPL', '2024-01-15', 10, 185.5, '2024-01-15 09:00:00', '2024-01-15 09:00:00'),
+           (2, 1, '005930.KS', '2023-12-01', 3, 71000, '2023-12-01 09:00:00', '2023-12-01 09:00:00');
+    INSERT INTO transactions (id, stock_id, txn_type, quantity, price, txn_date, created_at)
+    VALUES (1, 1, 'BUY', 10, 185.5, '2024-01-15', '2024-01-15 09:00:00');
+"""
+
+# Epoch seconds of 2024-01-15 00:00 UTC
+_PURCHASE_EPOCH = 1705276800
+
+
+def _create_baseline_db(db_path: str) -> None:
+    """Write a database with the original schema and a few rows.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(_BASELINE_SCHEMA)
+    finally:
+        conn.close()
+
+
+def _migrated_baseline_db(db_path: str) -> None:
+    """Write a database with the original schema and migrate it.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    _create_baseline_db(db_path)
+    migrate_schema(db_path)
+
+
+def test_migrate_baseline(db_path: str) -> None:
+    """Migrating keeps every row and converts dates to epoch seconds."""
+    _migrated_baseline_db(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        assert version == SCHEMA_VERSION, f"user_version {version}, expected {SCHEMA_VERSION}"
+
+        counts = [
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("portfolios", "stocks", "transactions")
+        ]
+        assert counts == [1, 2, 1], f"row counts changed: {counts}"
+
+        purchase_date, quantity, avg_price = conn.execute(
+            "SELECT purchase_date, quantity, avg_price FROM stocks WHERE id = 1"
+        ).fetchone()
+        assert purchase_date == _PURCHASE_EPOCH, f"purchase_date {purchase_date!r}"
+        assert (quantity, avg_price) == (10, 185.5)
+
+        txn_date = conn.execute("SELECT txn_date FROM transactions WHERE id = 1").fetchone()[0]
+        assert txn_date == _PURCHASE_EPOCH, f"txn_date {txn_date!r}"
+
+        # Symbols compare case-insensitively after the migration
+        row = conn.execute("SELECT id FROM stocks WHERE symbol = 'aapl'").fetchone()
+        assert row == (1,), "lowercase symbol lookup found no row"
+
+        indexes = {
+            name for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+            )
+        }
+        assert "idx_stocks_symbol" not in indexes, "obsolete index was not dropped"
+        assert "idx_transactions_stock_date" in indexes, "composite index missing"
+
+        violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+        assert not violations, f"foreign key violations: {violations}"
+    finally:
+        conn.close()
+
+    print("✓ 기존 스키마 데이터 마이그레이션")
+
+
+def test_migrated_rows_load(db_path: str) -> None:
+    """The database manager reads migrated rows back as models."""
+    _migrated_baseline_db(db_path)
+    db = DatabaseManager(db_path)
+    try:
+        stocks = {stock.symbol: stock for stock in db.get_stocks_by_portfolio(1)}
+        assert set(stocks) == {"AAPL", "005930.KS"}, f"stocks: {sorted(stocks)}"
+        assert stocks["AAPL"].purchase_date == date(2024, 1, 15)
+        assert stocks["005930.KS"].purchase_date == date(2023, 12, 1)
+
+        transactions = db.get_transactions_by_stock(1)
+        assert len(transactions) == 1, f"transactions: {transactions}"
+    finally:
+        db.close()
+
+    print("✓ 마이그레이션된 데이터 조회")
+
+
+def test_migrate_is_idempotent(db_path: str) -> None:
+    """Running the migration again leaves a current database unchanged."""
+    _migrated_baseline_db(db_path)
+    migrate_schema(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        count = conn.execute("SELECT COUNT(*) FROM stocks").fetchone()[0]
+    finally:
+        conn.close()
+
+    assert version == SCHEMA_VERSION, f"user_version {version}"
+    assert count == 2, f"stock count {count}"
+    print("✓ 재실행 시 변경 없음")
+
+
+def main() -> int:
+    """Run migration tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 데이터베이스 마이그레이션 테스트")
+
+    tests = (test_migrate_baseline, test_migrated_rows_load, test_migrate_is_idempotent)
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            # A fresh database per test, as the pytest fixture provides
+            for index, test in enumerate(tests):
+                test(str(Path(tmp) / f"mydash{index}.db"))
+        except AssertionError as e:
+            print(f"❌ 실패: {e}")
+            return 1
+
+    print("✅ 모든 마이그레이션 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Test that concurrent price lookups for one symbol share a single download."""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.history_store import HistoryStore
+from src.services.stock_service import StockService
+
+# Callers racing for the same symbol
+_CALLERS = 8
+# Upper bound on any wait, so a regression fails instead of hanging
+_TIMEOUT = 5.0
+
+
+def _race(service: StockService, symbol: str, gate: threading.Event, started: threading.Event):
+    """Start concurrent _fetch_price calls and release the download once all wait.
+
+    Args:
+        service: Stock service with a stubbed _download_price
+        symbol: Symbol every caller asks for
+        gate: Event the stubbed download blocks on
+        started: Event the stubbed download sets when it begins
+
+    Returns:
+        Tuple of (results, errors, threads still alive)
+    """
+    results: list = []
+    errors: list[BaseException] = []
+
+    def call():
+        try:
+            results.append(service._fetch_price(symbol))
+        except BaseException as e:
+            errors.append(e)
+
+    # Daemon threads, so a caller left blocked cannot keep the process alive
+    leader = threading.Thread(target=call, daemon=True)
+    leader.start()
+    assert started.wait(_TIMEOUT), "download never started"
+
+    followers = [threading.Thread(target=call, daemon=True) for _ in range(_CALLERS - 1)]
+    for thread in followers:
+        thread.start()
+    # Give the followers time to find the in-flight entry and block on it
+    time.sleep(0.2)
+    gate.set()
+
+    threads = [leader, *followers]
+    deadline = time.monotonic() + _TIMEOUT
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+    return results, errors, [thread for thread in threads if thread.is_alive()]
+
+
+def test_concurrent_fetches_share_one_download(store: HistoryStore) -> None:
+    """Every caller gets the leader's price from a single download."""
+    service = StockService(store)
+    gate, started = threading.Event(), threading.Event()
+    calls: list[str] = []
+
+    def download(symbol):
+        calls.append(symbol)
+        started.set()
+        gate.wait(_TIMEOUT)
+        service._price_cache.set(symbol, 190.0)
+        return 190.0
+
+    service._download_price = download
+    results, errors, alive = _race(service, "AAPL", gate, started)
+
+    assert not alive, f"{len(alive)} callers still blocked"
+    assert not errors, f"errors: {errors}"
+    assert calls == ["AAPL"], f"downloads: {calls}"
+    assert results == [190.0] * _CALLERS, f"results: {results}"
+    assert not service._inflight, "in-flight entry left behind"
+    print("✓ 동시 요청은 한 번만 다운로드")
+
+
+def test_failed_download_wakes_waiters(store: HistoryStore) -> None:
+    """A download that raises still releases the callers waiting on it."""
+    service = StockService(store)
+    gate, started = threading.Event(), threading.Event()
+    calls: list[str] = []
+
+    def download(symbol):
+        calls.append(symbol)
+        started.set()
+        gate.wait(_TIMEOUT)
+        raise RuntimeError("offline")
+
+    service._download_price = download
+    results, errors, alive = _race(service, "AAPL", gate, started)
+
+    assert not alive, f"{len(alive)} callers still blocked after the failure"
+    assert calls == ["AAPL"], f"downloads: {calls}"
+    # The leader sees the error; the others find no cached price
+    assert len(errors) == 1 and isinstance(errors[0], RuntimeError), f"errors: {errors}"
+    assert results == [None] * (_CALLERS - 1), f"results: {results}"
+    assert not service._inflight, "in-flight entry left behind"
+
+    # The next lookup is free to try again
+    service._download_price = lambda symbol: 191.0
+    assert service._fetch_price("AAPL") == 191.0
+    print("✓ 다운로드 실패 시 대기 중인 요청 해제")
+
+
+def main() -> int:
+    """Run price coalescing tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 시세 요청 병합 테스트")
+
+    tests = (test_concurrent_fetches_share_one_download, test_failed_download_wakes_waiters)
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            # A fresh store per test, as the pytest fixture provides
+            for index, test in enumerate(tests):
+                test(HistoryStore(str(Path(tmp) / f"history{index}.db")))
+        except AssertionError as e:
+            print(f"❌ 실패: {e}")
+            return 1
+
+    print("✅ 모든 시세 요청 병합 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""Test market-hours quote lifetimes and failure caching in StockService."""
+
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yfinance
+
+from src.services import cache as cache_module
+from src.services import stock_service as stock_module
+from src.services.history_store import HistoryStore
+from src.services.stock_service import CACHE_TTL, StockService
+
+# (UTC time, symbol, expected TTL); January 2024, where the 10th is a Wednesday
+_QUOTE_CASES = [
+    # New York session 09:30-16:00 (UTC-5)
+    (datetime(2024, 1, 10, 15, 0), "AAPL", CACHE_TTL),     # 10:00, open
+    (datetime(2024, 1, 10, 14, 20), "AAPL", 600),          # 09:20, opens in 10 min
+    (datetime(2024, 1, 10, 22, 0), "AAPL", 3600),          # 17:00, capped closed TTL
+    (datetime(2024, 1, 12, 21, 30), "AAPL", 3600),         # Friday 16:30
+    (datetime(2024, 1, 13, 12, 0), "AAPL", 86400),         # Saturday, capped weekend TTL
+    (datetime(2024, 1, 15, 3, 0), "AAPL", 41400),          # Sunday 22:00, Monday open
+    # Seoul session 09:00-15:30 (UTC+9)
+    (datetime(2024, 1, 10, 1, 0), "005930.KS", CACHE_TTL),  # 10:00, open
+    (datetime(2024, 1, 9, 23, 50), "005930.KS", 600),       # 08:50, opens in 10 min
+    (datetime(2024, 1, 10, 7, 0), "035720.KQ", 3600),       # 16:00, closed
+]
+
+# (UTC time, expected TTL); FX trades Sunday 21:00 to Friday 21:00 UTC
+_FX_CASES = [
+    (datetime(2024, 1, 10, 12, 0), 600),       # midweek
+    (datetime(2024, 1, 13, 12, 0), 86400),     # Saturday, capped weekend TTL
+    (datetime(2024, 1, 14, 20, 0), 3600),      # Sunday, reopens in an hour
+    (datetime(2024, 1, 14, 20, 55), 600),      # never below the trading TTL
+]
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() returns a fixed instant."""
+
+    frozen: datetime = datetime(2024, 1, 10, tzinfo=UTC)
+
+    @classmethod
+    def now(cls, tz=None):
+        """Return the frozen instant in the requested timezone."""
+        return cls.frozen.astimezone(tz)
+
+
+class _Clock:
+    """Stand-in for the time module with a monotonic clock the test advances."""
+
+    def __init__(self):
+        """Initialize clock at zero."""
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        """Return the current fake monotonic time."""
+        return self.now
+
+
+@contextmanager
+def _frozen_at(moment: datetime) -> Iterator[None]:
+    """Make StockService see a fixed wall-clock time.
+
+    Args:
+        moment: Naive UTC time
+    """
+    original = stock_module.datetime
+    _FrozenDatetime.frozen = moment.replace(tzinfo=UTC)
+    stock_module.datetime = _FrozenDatetime
+    try:
+        yield
+    finally:
+        stock_module.datetime = original
+
+
+@contextmanager
+def _fake_yfinance(fast_info) -> Iterator[list[str]]:
+    """Replace yfinance.Ticker with one returning the given fast_info.
+
+    Args:
+        fast_info: Dict returned as fast_info, or an exception to raise
+
+    Yields:
+        List collecting the symbols requested
+    """
+    requested: list[str] = []
+
+    class FakeTicker:
+        def __init__(self, symbol):
+            requested.append(symbol)
+
+        @property
+        def fast_info(self):
+            if isinstance(fast_info, Exception):
+                raise fast_info
+            return fast_info
+
+    original = yfinance.Ticker
+    yfinance.Ticker = FakeTicker
+    try:
+        yield requested
+    finally:
+        yfinance.Ticker = original
+
+
+@contextmanager
+def _fake_monotonic() -> Iterator[_Clock]:
+    """Drive TTLCache expiry from a clock the test controls."""
+    clock = _Clock()
+    original = cache_module.time
+    cache_module.time = clock
+    try:
+        yield clock
+    finally:
+        cache_module.time = original
+
+
+def test_quote_ttl_follows_market_hours(store: HistoryStore) -> None:
+    """Quotes live briefly in session and until the next open otherwise."""
+    service = StockService(store)
+    for moment, symbol, expected in _QUOTE_CASES:
+        with _frozen_at(moment):
+            ttl = service._ttl_for(symbol)
+        assert ttl == expected, f"{symbol} at {moment:%a %H:%M} UTC: ttl {ttl}, expected {expected}"
+    print("✓ 장 운영 시간별 시세 TTL")
+
+
+def test_fx_ttl_follows_fx_week(store: HistoryStore) -> None:
+    """The exchange rate is kept over the FX weekend, but not past the reopen."""
+    service = StockService(store)
+    for moment, expected in _FX_CASES:
+        with _frozen_at(moment):
+            ttl = service._fx_ttl()
+        assert ttl == expected, f"FX at {moment:%a %H:%M} UTC: ttl {ttl}, expected {expected}"
+    print("✓ 환율 TTL")
+
+
+def test_failed_fetch_cached_briefly(store: HistoryStore) -> None:
+    """A failed download is remembered for the failure TTL, then retried."""
+    service = StockService(store)
+
+    with _fake_monotonic() as clock, _frozen_at(datetime(2024, 1, 10, 22, 0)):
+        with _fake_yfinance(RuntimeError("offline")) as requested:
+            assert service.get_current_price("AAPL") is None
+            # Within the failure TTL the remembered None is served without a request
+            clock.now += stock_module._FAILURE_TTL - 1
+            assert service.get_current_price("AAPL") is None
+            assert requested == ["AAPL"], f"requests while failure cached: {requested}"
+
+        assert store.load_quotes(["AAPL"]) == {}, "a failed fetch was persisted"
+
+        with _fake_yfinance({"last_price": 190.0}) as requested:
+            # Past the failure TTL the symbol is fetched again
+            clock.now += 2
+            assert service.get_current_price("AAPL") == 190.0
+            assert requested == ["AAPL"], f"requests after failure expired: {requested}"
+
+            # The successful quote keeps the longer closed-market TTL
+            clock.now += stock_module._FAILURE_TTL + 1
+            assert service.get_current_price("AAPL") == 190.0
+            assert requested == ["AAPL"], f"cached quote was refetched: {requested}"
+
+    print("✓ 실패한 조회는 짧게만 캐시")
+
+
+def main() -> int:
+    """Run quote lifetime tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 시세 캐시 TTL 테스트")
+
+    tests = (
+        test_quote_ttl_follows_market_hours,
+        test_fx_ttl_follows_fx_week,
+        test_failed_fetch_cached_briefly,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            # A fresh store per test, as the pytest fixture provides
+            for index, test in enumerate(tests):
+                test(HistoryStore(str(Path(tmp) / f"history{index}.db")))
+        except AssertionError as e:
+            print(f"❌ 실패: {e}")
+            return 1
+
+    print("✅ 모든 시세 캐시 TTL 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""Test that grouped database writes commit once or not at all."""
+
+import sqlite3
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.db_manager import DatabaseManager
+from src.models import TransactionType
+from src.services.portfolio_manager import PortfolioManager
+
+
+def _portfolio_with_stock() -> tuple[PortfolioManager, int]:
+    """Build an in-memory portfolio holding one AAPL purchase.
+
+    Returns:
+        Tuple of (portfolio manager, portfolio ID)
+    """
+    pm = PortfolioManager(DatabaseManager(":memory:"))
+    portfolio = pm.create_portfolio("테스트")
+    pm.add_stock(portfolio.id, "AAPL", 1, 100.0, date(2024, 1, 2))
+    return pm, portfolio.id
+
+
+def _snapshot(db: DatabaseManager, portfolio_id: int) -> tuple[list, int]:
+    """Capture holdings and the transaction count.
+
+    Returns:
+        Tuple of ((symbol, quantity, avg_price) rows, transaction count)
+    """
+    stocks = [
+        (stock.symbol, stock.quantity, stock.avg_price)
+        for stock in db.get_stocks_by_portfolio(portfolio_id)
+    ]
+    count = db._conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+    return stocks, count
+
+
+def _count_commits(db: DatabaseManager) -> list[str]:
+    """Record the COMMIT statements the manager's connection runs.
+
+    Returns:
+        List that collects each COMMIT as it happens
+    """
+    commits: list[str] = []
+    db._conn.set_trace_callback(
+        lambda statement: commits.append(statement) if statement == "COMMIT" else None
+    )
+    return commits
+
+
+def test_failed_bulk_add_leaves_database_unchanged() -> None:
+    """A bulk add that fails after its stock writes rolls all of them back."""
+    pm, portfolio_id = _portfolio_with_stock()
+    before = _snapshot(pm.db, portfolio_id)
+
+    def fail_transactions(rows):
+        raise sqlite3.IntegrityError("simulated failure")
+
+    # The stock update and insert run first; the transaction insert then fails
+    pm.db.create_transactions = fail_transactions
+    try:
+        pm.add_stocks_bulk(portfolio_id, [
+            ("AAPL", 2, 110.0, None),
+            ("MSFT", 1, 400.0, None),
+        ])
+    except sqlite3.IntegrityError:
+        pass
+    else:
+        raise AssertionError("bulk add did not raise")
+
+    after = _snapshot(pm.db, portfolio_id)
+    assert after == before, f"database changed: {before} -> {after}"
+    print("✓ 일괄 추가 실패 시 롤백")
+
+
+def test_create_transactions_is_atomic() -> None:
+    """An invalid row rejects the whole executemany, not just itself."""
+    pm, portfolio_id = _portfolio_with_stock()
+    stock = pm.db.get_stock_by_symbol(portfolio_id, "AAPL")
+    before = _snapshot(pm.db, portfolio_id)
+
+    try:
+        pm.db.create_transactions([
+            (stock.id, TransactionType.BUY, 1, 100.0, date(2024, 1, 3)),
+            (stock.id, TransactionType.BUY, 1, -1.0, date(2024, 1, 4)),
+        ])
+    except sqlite3.IntegrityError:
+        pass
+    else:
+        raise AssertionError("CHECK(price > 0) was not enforced")
+
+    after = _snapshot(pm.db, portfolio_id)
+    assert after == before, f"database changed: {before} -> {after}"
+    print("✓ 거래 일괄 삽입 원자성")
+
+
+def test_nested_transaction_commits_once() -> None:
+    """Inner transaction() blocks and manager calls join the outermost commit."""
+    pm, portfolio_id = _portfolio_with_stock()
+    commits = _count_commits(pm.db)
+
+    with pm.db.transaction():
+        # add_stock opens its own transaction() block inside this one
+        pm.add_stock(portfolio_id, "MSFT", 1, 400.0, date(2024, 1, 3))
+        with pm.db.transaction():
+            pm.add_stock(portfolio_id, "AAPL", 1, 120.0, date(2024, 1, 4))
+        assert not commits, f"committed inside the outer block: {commits}"
+        assert pm.db._conn.in_transaction, "inner block ended the transaction"
+
+    assert len(commits) == 1, f"expected one COMMIT, got {len(commits)}"
+    assert pm.db._tx_depth == 0
+
+    stocks, count = _snapshot(pm.db, portfolio_id)
+    assert stocks == [("AAPL", 2, 110.0), ("MSFT", 1, 400.0)], f"stocks: {stocks}"
+    assert count == 3, f"transaction count {count}"
+    print("✓ 중첩 트랜잭션 단일 커밋")
+
+
+def test_nested_failure_rolls_back_outer() -> None:
+    """An error escaping an inner block undoes the outer block's writes too."""
+    pm, portfolio_id = _portfolio_with_stock()
+    before = _snapshot(pm.db, portfolio_id)
+    commits = _count_commits(pm.db)
+
+    try:
+        with pm.db.transaction():
+            pm.add_stock(portfolio_id, "MSFT", 1, 400.0, date(2024, 1, 3))
+            with pm.db.transaction():
+                pm.add_stock(portfolio_id, "AAPL", 1, 120.0, date(2024, 1, 4))
+                raise RuntimeError("simulated failure")
+    except RuntimeError:
+        pass
+
+    assert not commits, f"rolled-back block committed: {commits}"
+    assert pm.db._tx_depth == 0
+    after = _snapshot(pm.db, portfolio_id)
+    assert after == before, f"database changed: {before} -> {after}"
+    print("✓ 중첩 트랜잭션 실패 시 전체 롤백")
+
+
+def main() -> int:
+    """Run transaction tests.
+
+    Returns:
+        Process exit code
+    """
+    print("🧪 트랜잭션 테스트")
+
+    try:
+        test_failed_bulk_add_leaves_database_unchanged()
+        test_create_transactions_is_atomic()
+        test_nested_transaction_commits_once()
+        test_nested_failure_rolls_back_outer()
+    except AssertionError as e:
+        print(f"❌ 실패: {e}")
+        return 1
+
+    print("✅ 모든 트랜잭션 테스트 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())